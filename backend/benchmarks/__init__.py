@@ -0,0 +1,4 @@
+"""Benchmark suite for the configuration API.
+
+Run from ``backend/`` with ``python -m benchmarks --help``.
+"""
@@ -0,0 +1,69 @@
+"""Command-line entry point: ``python -m benchmarks``."""
+
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+from benchmarks.harness import find_regressions
+from benchmarks.run import TARGETS, run_suite
+from benchmarks.seed import DataShape
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    parser.add_argument("--database-url", default="sqlite+aiosqlite:///:memory:", help="Database to seed and query")
+    parser.add_argument("--reset", action="store_true", help="Drop and recreate the tables before seeding")
+    parser.add_argument("--keys", type=int, default=DataShape.keys, help="Configurations to seed")
+    parser.add_argument("--depth", type=int, default=DataShape.depth, help="Levels per configuration tree")
+    parser.add_argument("--fan-out", type=int, default=DataShape.fan_out, help="Children per inner node")
+    parser.add_argument("--translations", type=int, default=DataShape.translations, help="Translations per key")
+    parser.add_argument("--iterations", type=int, default=200, help="Timed calls per scenario")
+    parser.add_argument("--warmup", type=int, default=20, help="Untimed calls per scenario")
+    parser.add_argument("--concurrency", type=int, default=1, help="Concurrent callers per scenario")
+    parser.add_argument("--target", choices=TARGETS, action="append", help="Only run http or service scenarios")
+    parser.add_argument("--scenario", action="append", default=[], help="Only run scenarios containing this name")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for picking IDs and offsets")
+    parser.add_argument("--output", type=Path, help="Write the JSON report here instead of stdout")
+    parser.add_argument("--baseline", type=Path, help="Earlier JSON report to compare p50/p99 against")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed slowdown over the baseline (0.2 = 20%%)")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the suite; exit non-zero when a scenario regressed against the baseline."""
+    args = parse_args(argv)
+    shape = DataShape(keys=args.keys, depth=args.depth, fan_out=args.fan_out, translations=args.translations)
+    report = asyncio.run(
+        run_suite(
+            args.database_url,
+            shape,
+            iterations=args.iterations,
+            warmup=args.warmup,
+            targets=tuple(args.target or TARGETS),
+            scenarios=tuple(args.scenario),
+            reset=args.reset,
+            seed_value=args.seed,
+            concurrency=args.concurrency,
+        )
+    )
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())
+        report["regressions"] = find_regressions(report["results"], baseline["results"], args.tolerance)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n")
+    else:
+        print(text)
+
+    for regression in report.get("regressions", []):
+        print(f"REGRESSION {regression}", file=sys.stderr)
+    return 1 if report.get("regressions") else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+"""Cold-start benchmark: ``python -m benchmarks.cold_start``.
+
+Every run is a fresh interpreter, so nothing is shared between runs. A run imports
+the app, runs its lifespan startup, and serves one request. The parent times the
+whole run, from spawning the process to the first response.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from benchmarks.harness import percentile
+from benchmarks.seed import DataShape
+
+SCHEMA_MODES = ("create_all", "migrations")
+PHASES = ("import_ms", "startup_ms", "first_request_ms", "time_to_first_request_ms")
+
+
+async def _child(path: str) -> dict[str, float]:
+    """Time importing the app, its startup, and its first request (runs in the spawned process)."""
+    started = time.perf_counter()
+    import httpx
+
+    from src.main import app
+
+    imported = time.perf_counter()
+    async with app.router.lifespan_context(app):
+        ready = time.perf_counter()
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+            response = await client.get(path)
+        response.raise_for_status()
+        served = time.perf_counter()
+        served_at = time.time()
+    return {
+        "import_ms": (imported - started) * 1000,
+        "startup_ms": (ready - imported) * 1000,
+        "first_request_ms": (served - ready) * 1000,
+        "served_at": served_at,
+    }
+
+
+def run_once(database_url: str, schema_mode: str, path: str) -> dict[str, float]:
+    """Spawn one cold process and return its phase timings in milliseconds."""
+    env = {**os.environ, "DATABASE_URL": database_url, "DB_SCHEMA_MODE": schema_mode, "LOG_LEVEL": "WARNING"}
+    spawned_at = time.time()
+    completed = subprocess.run(
+        [sys.executable, "-m", "benchmarks.cold_start", "--child", "--path", path],
+        capture_output=True,
+        check=True,
+        cwd=Path(__file__).resolve().parent.parent,
+        env=env,
+        text=True,
+    )
+    timings = json.loads(completed.stdout.strip().splitlines()[-1])
+    timings["time_to_first_request_ms"] = (timings.pop("served_at") - spawned_at) * 1000
+    return timings
+
+
+def summarize_runs(name: str, runs: list[dict[str, float]]) -> dict[str, Any]:
+    """Median and worst case of every phase across runs."""
+    result: dict[str, Any] = {"name": name, "runs": len(runs)}
+    for phase in PHASES:
+        ordered = sorted(run[phase] for run in runs)
+        result[phase] = {"p50": round(percentile(ordered, 0.50), 2), "max": round(ordered[-1], 2)}
+    return result
+
+
+def run_cold_start(
+    database_url: str, runs: int, schema_modes: tuple[str, ...], path: str = "/health"
+) -> list[dict[str, Any]]:
+    """Time ``runs`` cold starts per schema mode against an already prepared database."""
+    results = []
+    for mode in schema_modes:
+        timings = [run_once(database_url, mode, path) for _ in range(runs)]
+        results.append(summarize_runs(f"cold_start[{mode}]", timings))
+    return results
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.cold_start", description=__doc__)
+    parser.add_argument("--database-url", help="Existing database with the schema (default: a seeded SQLite file)")
+    parser.add_argument("--keys", type=int, default=DataShape.keys, help="Configurations to seed the SQLite file with")
+    parser.add_argument("--runs", type=int, default=10, help="Cold starts per schema mode")
+    parser.add_argument("--schema-mode", choices=SCHEMA_MODES, action="append", help="Only time this DB_SCHEMA_MODE")
+    parser.add_argument("--path", default="/health", help="First request to serve")
+    parser.add_argument("--output", type=Path, help="Write the JSON report here instead of stdout")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Prepare the database once, then time cold starts in fresh processes."""
+    args = parse_args(argv)
+    if args.child:
+        print(json.dumps(asyncio.run(_child(args.path))))
+        return 0
+
+    with tempfile.TemporaryDirectory() as directory:
+        database_url = args.database_url
+        if database_url is None:
+            from benchmarks.run import prepare_database
+            from src.infrastructure.database import connection
+
+            database_url = f"sqlite+aiosqlite:///{Path(directory) / 'cold_start.db'}"
+            shape = DataShape(keys=args.keys)
+
+            async def prepare() -> None:
+                await prepare_database(database_url, shape)
+                await connection.close_db()
+
+            asyncio.run(prepare())
+
+        results = run_cold_start(database_url, args.runs, tuple(args.schema_mode or SCHEMA_MODES), args.path)
+
+    text = json.dumps({"database": database_url.split("://")[0], "results": results}, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+"""Timing, summary statistics, and baseline comparison."""
+
+import asyncio
+import math
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from typing import Any
+
+
+@dataclass
+class BenchmarkResult:
+    """Latency summary of one scenario."""
+
+    name: str
+    iterations: int
+    throughput_per_s: float
+    mean_ms: float
+    p50_ms: float
+    p99_ms: float
+    max_ms: float
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-ready dict."""
+        return asdict(self)
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of already sorted values."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def summarize(name: str, latencies: list[float], elapsed: float) -> BenchmarkResult:
+    """Summarize per-call latencies (seconds) and the wall time they took."""
+    ordered = sorted(latencies)
+    return BenchmarkResult(
+        name=name,
+        iterations=len(ordered),
+        throughput_per_s=round(len(ordered) / elapsed, 2) if elapsed else 0.0,
+        mean_ms=round(sum(ordered) / len(ordered) * 1000, 4) if ordered else 0.0,
+        p50_ms=round(percentile(ordered, 0.50) * 1000, 4),
+        p99_ms=round(percentile(ordered, 0.99) * 1000, 4),
+        max_ms=round(ordered[-1] * 1000, 4) if ordered else 0.0,
+    )
+
+
+async def measure(
+    name: str,
+    operation: Callable[[int], Awaitable[Any]],
+    iterations: int,
+    warmup: int = 0,
+    concurrency: int = 1,
+) -> BenchmarkResult:
+    """Run ``operation(i)`` and time every call after the warm-up.
+
+    With ``concurrency`` above 1 that many workers share the iterations, which is
+    what exercises the connection pool.
+    """
+    for i in range(warmup):
+        await operation(i)
+    latencies: list[float] = []
+    counter = iter(range(warmup, warmup + iterations))
+
+    async def worker() -> None:
+        for i in counter:
+            call_started = time.perf_counter()
+            await operation(i)
+            latencies.append(time.perf_counter() - call_started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(max(1, concurrency))))
+    return summarize(name, latencies, time.perf_counter() - started)
+
+
+def find_regressions(
+    results: list[dict[str, Any]],
+    baseline: list[dict[str, Any]],
+    tolerance: float,
+) -> list[str]:
+    """Describe every scenario whose p50 or p99 grew more than ``tolerance`` over the baseline."""
+    previous = {result["name"]: result for result in baseline}
+    regressions = []
+    for result in results:
+        before = previous.get(result["name"])
+        if before is None:
+            continue
+        for metric in ("p50_ms", "p99_ms"):
+            if before[metric] > 0 and result[metric] > before[metric] * (1 + tolerance):
+                regressions.append(
+                    f"{result['name']} {metric}: {before[metric]:.3f} -> {result[metric]:.3f} "
+                    f"(+{(result[metric] / before[metric] - 1) * 100:.0f}%)"
+                )
+    return regressions
@@ -0,0 +1,115 @@
+"""Seed a database, run the scenarios, and collect the results."""
+
+import platform
+import time
+from datetime import datetime, timezone
+from typing import Any
+
+from sqlalchemy import select
+
+from benchmarks.harness import measure
+from benchmarks.scenarios import ScenarioContext, asgi_client, http_scenarios, service_scenarios
+from benchmarks.seed import DataShape, build_configurations, seed
+from src.configs import get_settings
+from src.infrastructure.cache import get_configuration_cache, get_configuration_graph, get_snapshot_cache
+from src.infrastructure.database import connection
+from src.infrastructure.database.models import Base
+from src.infrastructure.database.models import Configuration as ConfigurationModel
+
+TARGETS = ("http", "service")
+
+
+def _reset_caches() -> None:
+    """Start a scenario from cold process-wide caches; warm-up calls refill them."""
+    get_configuration_cache().clear()
+    get_snapshot_cache().clear()
+    get_configuration_graph().invalidate()
+
+
+async def prepare_database(database_url: str, shape: DataShape, reset: bool = False) -> tuple[list, float]:
+    """Create the schema and seed it; returns the seeded IDs and the seconds seeding took.
+
+    The database must be empty unless ``reset`` drops every table first.
+    """
+    await connection.init_db(database_url)
+    async with connection.engine.begin() as conn:
+        if reset:
+            await conn.run_sync(Base.metadata.drop_all)
+            await conn.run_sync(Base.metadata.create_all)
+        elif (await conn.execute(select(ConfigurationModel.id).limit(1))).first() is not None:
+            raise RuntimeError("Benchmark database is not empty; pass --reset to drop and recreate its tables")
+
+    configs = build_configurations(shape)
+    started = time.perf_counter()
+    async with connection.async_session() as session:
+        await seed(session, configs)
+    return [config.id for config in configs], time.perf_counter() - started
+
+
+async def run_suite(
+    database_url: str,
+    shape: DataShape,
+    iterations: int = 200,
+    warmup: int = 20,
+    targets: tuple[str, ...] = TARGETS,
+    scenarios: tuple[str, ...] = (),
+    reset: bool = False,
+    seed_value: int = 0,
+    concurrency: int = 1,
+) -> dict[str, Any]:
+    """Run the suite and return a JSON-ready report.
+
+    ``scenarios`` keeps only scenarios whose name contains one of the given parts,
+    e.g. ``("list", "parent_options")``. Concurrency above 1 needs a server database;
+    in-memory SQLite shares a single connection.
+    """
+    ids, seed_seconds = await prepare_database(database_url, shape, reset=reset)
+    results = []
+    try:
+        for target in targets:
+            context = ScenarioContext(ids, seed_value)
+            if target == "http":
+                client = asgi_client()
+                selected = http_scenarios(client, context)
+            else:
+                client = None
+                selected = service_scenarios(context)
+            try:
+                for name, operation in selected.items():
+                    if scenarios and not any(part in name for part in scenarios):
+                        continue
+                    _reset_caches()
+                    result = await measure(name, operation, iterations, warmup=warmup, concurrency=concurrency)
+                    results.append(result.to_dict())
+            finally:
+                if client is not None:
+                    await client.aclose()
+    finally:
+        dialect = connection.engine.dialect.name
+        await connection.close_db()
+
+    settings = get_settings()
+    return {
+        "concurrency": concurrency,
+        "environment": {
+            "cache_enabled": settings.cache_enabled,
+            "dialect": dialect,
+            "graph_enabled": settings.graph_enabled,
+            "python": platform.python_version(),
+            "snapshot_cache_enabled": settings.snapshot_cache_enabled,
+        },
+        "iterations": iterations,
+        "pool": {
+            "max_overflow": settings.db_max_overflow,
+            "pre_ping": settings.db_pool_pre_ping,
+            "prepared_statement_cache_size": settings.db_prepared_statement_cache_size,
+            "recycle_seconds": settings.db_pool_recycle_seconds,
+            "size": settings.db_pool_size,
+            "timeout_seconds": settings.db_pool_timeout_seconds,
+        },
+        "results": results,
+        "seed_seconds": round(seed_seconds, 3),
+        "shape": shape.to_dict(),
+        "started_at": datetime.now(timezone.utc).isoformat(),
+        "warmup": warmup,
+    }
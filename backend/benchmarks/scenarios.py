@@ -0,0 +1,110 @@
+"""Benchmark scenarios run over HTTP (ASGI transport) and against the service."""
+
+import random
+from collections.abc import Awaitable, Callable
+from typing import Any
+from uuid import UUID
+
+from httpx import ASGITransport, AsyncClient
+
+from src.application.services.configuration_service import ConfigurationService
+from src.infrastructure.database import connection
+
+# Scenario name -> operation taking the iteration number
+Scenarios = dict[str, Callable[[int], Awaitable[Any]]]
+
+PAGE_SIZE = 50
+API_PREFIX = "/api/v1/configurations"
+
+
+class ScenarioContext:
+    """Seeded IDs and a seeded random source shared by both scenario sets."""
+
+    def __init__(self, ids: list[UUID], seed: int):
+        """Initialize context."""
+        self.ids = ids
+        self.random = random.Random(seed)
+
+    def any_id(self) -> UUID:
+        """Pick a seeded configuration ID."""
+        return self.random.choice(self.ids)
+
+    def any_offset(self) -> int:
+        """Pick a list offset anywhere in the seeded rows."""
+        return self.random.randrange(max(1, len(self.ids) - PAGE_SIZE))
+
+
+def _checked(response) -> None:
+    if response.status_code >= 400:
+        raise RuntimeError(f"{response.request.method} {response.request.url} -> {response.status_code}")
+
+
+def http_scenarios(client: AsyncClient, context: ScenarioContext) -> Scenarios:
+    """Scenarios that go through routing, validation, and encoding."""
+
+    async def list_page(i: int) -> None:
+        _checked(await client.get(f"{API_PREFIX}/", params={"limit": PAGE_SIZE, "offset": context.any_offset()}))
+
+    async def get(i: int) -> None:
+        _checked(await client.get(f"{API_PREFIX}/by-id/{context.any_id()}"))
+
+    async def create(i: int) -> None:
+        body = {"key": f"bench.http.{i:08d}", "label": f"HTTP {i}", "data_type": "number", "default_value": "1"}
+        _checked(await client.post(f"{API_PREFIX}/", json=body))
+
+    async def update(i: int) -> None:
+        _checked(await client.put(f"{API_PREFIX}/by-id/{context.any_id()}", json={"label": f"Updated {i}"}))
+
+    async def parent_options(i: int) -> None:
+        _checked(await client.get(f"{API_PREFIX}/parent-options/by/{context.any_id()}"))
+
+    return {
+        "http.list": list_page,
+        "http.get": get,
+        "http.create": create,
+        "http.update": update,
+        "http.parent_options": parent_options,
+    }
+
+
+def service_scenarios(context: ScenarioContext) -> Scenarios:
+    """Scenarios that call ConfigurationService directly, one session per call like a request."""
+
+    def with_service(call: Callable[[ConfigurationService, int], Awaitable[Any]]) -> Callable[[int], Awaitable[Any]]:
+        async def operation(i: int) -> Any:
+            async with connection.async_session() as session:
+                return await call(ConfigurationService(session), i)
+
+        return operation
+
+    async def list_page(service: ConfigurationService, i: int) -> None:
+        await service.list_configurations(limit=PAGE_SIZE, offset=context.any_offset())
+
+    async def get(service: ConfigurationService, i: int) -> None:
+        await service.get_configuration(context.any_id())
+
+    async def create(service: ConfigurationService, i: int) -> None:
+        await service.create_configuration(
+            key=f"bench.service.{i:08d}", label=f"Service {i}", data_type="number", default_value="1"
+        )
+
+    async def update(service: ConfigurationService, i: int) -> None:
+        await service.update_configuration(context.any_id(), label=f"Updated {i}")
+
+    async def parent_options(service: ConfigurationService, i: int) -> None:
+        await service.get_parent_options(current_config_id=context.any_id())
+
+    return {
+        "service.list": with_service(list_page),
+        "service.get": with_service(get),
+        "service.create": with_service(create),
+        "service.update": with_service(update),
+        "service.parent_options": with_service(parent_options),
+    }
+
+
+def asgi_client() -> AsyncClient:
+    """Client calling the application in-process, without a network hop."""
+    from src.main import app
+
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://benchmark")
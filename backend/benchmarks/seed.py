@@ -0,0 +1,82 @@
+"""Synthetic configuration data of a configurable shape."""
+
+import uuid
+from collections.abc import AsyncIterator
+from dataclasses import asdict, dataclass
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.repositories.configuration_repository import ConfigurationRepository
+from src.domain.entities.configuration import Configuration, ParentCondition, Translation, ValidationRule
+
+LANGUAGES = ("ar", "fr", "de", "es", "ja", "pt", "ru", "zh", "it", "tr")
+
+# Seeded IDs are derived from the position so runs are reproducible
+SEED_NAMESPACE = uuid.UUID("5eed0000-0000-4000-8000-000000000000")
+
+# Rows handed to one import batch while seeding
+SEED_BATCH_SIZE = 1000
+
+
+@dataclass(frozen=True)
+class DataShape:
+    """How many configurations to seed and how they are arranged.
+
+    Keys form a forest of complete trees ``depth`` levels deep in which every inner
+    node has ``fan_out`` children; ``depth=1`` seeds only roots.
+    """
+
+    keys: int = 10_000
+    depth: int = 3
+    fan_out: int = 10
+    translations: int = 2
+
+    def to_dict(self) -> dict[str, int]:
+        """Convert to a JSON-ready dict."""
+        return asdict(self)
+
+
+def parent_index(index: int, shape: DataShape) -> int | None:
+    """Get the position of a node's parent, or None for a root."""
+    tree_size = sum(shape.fan_out**level for level in range(shape.depth))
+    tree, position = divmod(index, tree_size)
+    if position == 0:
+        return None
+    return tree * tree_size + (position - 1) // shape.fan_out
+
+
+def build_configurations(shape: DataShape) -> list[Configuration]:
+    """Build the configurations of a shape, parents before children."""
+    configs: list[Configuration] = []
+    for index in range(shape.keys):
+        parent = parent_index(index, shape)
+        configs.append(
+            Configuration(
+                id=uuid.uuid5(SEED_NAMESPACE, str(index)),
+                key=f"bench.{index:08d}",
+                label=f"Benchmark {index}",
+                description=f"Seeded configuration {index}",
+                data_type="number",
+                default_value=str(index % 100),
+                validation_rules=[ValidationRule(rule_type="min", value=0), ValidationRule(rule_type="max", value=100)],
+                parent_config_id=configs[parent].id if parent is not None else None,
+                parent_conditions=(
+                    [ParentCondition(operator=">=", value="50", default_value="100")] if parent is not None else []
+                ),
+                translations=[
+                    Translation(language=LANGUAGES[i % len(LANGUAGES)], label=f"Benchmark {index} ({i})")
+                    for i in range(shape.translations)
+                ],
+            )
+        )
+    return configs
+
+
+async def seed(session: AsyncSession, configs: list[Configuration]) -> int:
+    """Write configurations through the bulk import path; returns rows written."""
+
+    async def batches() -> AsyncIterator[list[Configuration]]:
+        for start in range(0, len(configs), SEED_BATCH_SIZE):
+            yield configs[start : start + SEED_BATCH_SIZE]
+
+    return await ConfigurationRepository(session).import_configurations(batches())
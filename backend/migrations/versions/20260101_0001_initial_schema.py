@@ -0,0 +1,76 @@
+"""Initial schema: configurations and the change log
+
+Matches scripts/init-db.sql. Databases created by that script or by create_all
+are already at this revision: run ``alembic stamp 0001`` once, then upgrade.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-01-01 00:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+EMPTY_JSON_ARRAY = sa.text("'[]'")
+
+
+def upgrade() -> None:
+    """Apply the migration."""
+    postgres = op.get_bind().dialect.name == "postgresql"
+    op.create_table(
+        "configurations",
+        sa.Column(
+            "id",
+            postgresql.UUID(as_uuid=True),
+            primary_key=True,
+            server_default=sa.text("gen_random_uuid()") if postgres else None,
+        ),
+        sa.Column("key", sa.String(255), nullable=False, unique=True),
+        sa.Column("label", sa.String(255), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("data_type", sa.String(50), nullable=False),
+        sa.Column("default_value", sa.Text(), nullable=True),
+        sa.Column("active", sa.Boolean(), server_default=sa.true()),
+        sa.Column(
+            "parent_config_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("configurations.id", ondelete="SET NULL"),
+            nullable=True,
+        ),
+        sa.Column("validation_rules", postgresql.JSONB(), server_default=EMPTY_JSON_ARRAY),
+        sa.Column("parent_conditions", postgresql.JSONB(), server_default=EMPTY_JSON_ARRAY),
+        sa.Column("translations", postgresql.JSONB(), server_default=EMPTY_JSON_ARRAY),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.current_timestamp()),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.current_timestamp()),
+    )
+    op.create_index("idx_configurations_key", "configurations", ["key"])
+    op.create_index("ix_configurations_key_id", "configurations", ["key", "id"])
+    op.create_index("idx_configurations_parent_config_id", "configurations", ["parent_config_id"])
+    op.create_index("idx_configurations_active", "configurations", ["active"])
+
+    op.create_table(
+        "configuration_change_log",
+        # SQLite only auto-increments INTEGER PRIMARY KEY columns
+        sa.Column(
+            "revision", sa.BigInteger().with_variant(sa.Integer(), "sqlite"), primary_key=True, autoincrement=True
+        ),
+        sa.Column("config_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("key", sa.String(255), nullable=False),
+        sa.Column("op", sa.String(16), nullable=False),
+        sa.Column("parent_config_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("previous_parent_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("changed_at", sa.DateTime(timezone=True), server_default=sa.func.current_timestamp()),
+    )
+    op.create_index("ix_configuration_change_log_config_id", "configuration_change_log", ["config_id"])
+
+
+def downgrade() -> None:
+    """Revert the migration."""
+    op.drop_table("configuration_change_log")
+    op.drop_table("configurations")
@@ -0,0 +1,34 @@
+"""Unwrap JSONB columns stored as JSON-encoded strings
+
+Same conversion as scripts/migrate-jsonb-native.sql. Rows that are already native
+are left untouched, so it is safe on databases that never held legacy rows.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-01-02 00:00:00
+"""
+
+from alembic import op
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+JSON_COLUMNS = ("validation_rules", "parent_conditions", "translations")
+
+
+def upgrade() -> None:
+    """Apply the migration."""
+    # Only PostgreSQL ever stored the legacy strings in JSONB; the reader tolerates them elsewhere
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for column in JSON_COLUMNS:
+        op.execute(
+            f"UPDATE configurations SET {column} = ({column} #>> '{{}}')::jsonb "
+            f"WHERE jsonb_typeof({column}) = 'string'"
+        )
+
+
+def downgrade() -> None:
+    """Revert the migration (nothing to do: native values are what every release reads)."""
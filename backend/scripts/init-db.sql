@@ -17,5 +17,19 @@ CREATE TABLE IF NOT EXISTS configurations (
 
 -- Create indexes for better performance
 CREATE INDEX IF NOT EXISTS idx_configurations_key ON configurations(key);
+CREATE INDEX IF NOT EXISTS ix_configurations_key_id ON configurations(key, id);
 CREATE INDEX IF NOT EXISTS idx_configurations_parent_config_id ON configurations(parent_config_id);
 CREATE INDEX IF NOT EXISTS idx_configurations_active ON configurations(active);
+
+-- Change feed: one row per committed write, numbered by a store-wide revision
+CREATE TABLE IF NOT EXISTS configuration_change_log (
+    revision BIGSERIAL PRIMARY KEY,
+    config_id UUID NOT NULL,
+    key VARCHAR(255) NOT NULL,
+    op VARCHAR(16) NOT NULL,
+    parent_config_id UUID,
+    previous_parent_id UUID,
+    changed_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS ix_configuration_change_log_config_id ON configuration_change_log(config_id);
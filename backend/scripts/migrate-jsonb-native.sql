@@ -0,0 +1,22 @@
+-- One-off migration: unwrap JSONB columns that were stored as JSON-encoded strings.
+--
+-- Earlier releases called json.dumps() before assigning validation_rules,
+-- parent_conditions and translations, so each column held a JSONB *string*
+-- containing the document instead of the document itself. `#>> '{}'` extracts
+-- the string's text, which is then parsed back into a native JSONB value.
+-- Rows that are already native are left untouched, so the script is idempotent.
+BEGIN;
+
+UPDATE configurations
+SET validation_rules = (validation_rules #>> '{}')::jsonb
+WHERE jsonb_typeof(validation_rules) = 'string';
+
+UPDATE configurations
+SET parent_conditions = (parent_conditions #>> '{}')::jsonb
+WHERE jsonb_typeof(parent_conditions) = 'string';
+
+UPDATE configurations
+SET translations = (translations #>> '{}')::jsonb
+WHERE jsonb_typeof(translations) = 'string';
+
+COMMIT;
@@ -0,0 +1,85 @@
+"""Routing of read requests to replicas without losing read-your-writes."""
+
+from collections.abc import AsyncGenerator
+from contextvars import ContextVar
+from typing import Annotated
+
+from fastapi import Depends, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.configs import get_settings
+from src.infrastructure.database import connection
+from src.infrastructure.database.connection import get_session
+from src.infrastructure.notifications import ConfigurationChange, get_change_bus
+
+# Sent back after a write; reads carrying it stay on the primary until it expires
+READ_PRIMARY_COOKIE = "read_primary"
+# Request header forcing a read onto the primary
+CONSISTENCY_HEADER = "x-read-consistency"
+
+# Set to [False] by the middleware per request; flipped when the request commits a change
+_request_wrote: ContextVar[list[bool] | None] = ContextVar("request_wrote", default=None)
+
+
+def _note_write(change: ConfigurationChange) -> None:
+    """Flag the current request as a writer; peers' changes arrive outside any request."""
+    wrote = _request_wrote.get()
+    if wrote is not None:
+        wrote[0] = True
+
+
+def prefers_primary(request: Request) -> bool:
+    """Whether a read must see the primary: asked for explicitly, or the client just wrote."""
+    return request.headers.get(CONSISTENCY_HEADER, "").lower() == "primary" or (READ_PRIMARY_COOKIE in request.cookies)
+
+
+async def get_read_session(
+    request: Request,
+    session: Annotated[AsyncSession, Depends(get_session)],
+) -> AsyncGenerator[AsyncSession]:
+    """Get a session for a read-only request: a replica when possible, else the primary.
+
+    The primary session is only a fallback; it checks out no connection unless used.
+    """
+    replica = None if prefers_primary(request) else await connection.open_read_session()
+    if replica is None:
+        yield session
+        return
+    async with replica:
+        yield replica
+
+
+class ReadYourWritesMiddleware:
+    """Pin a client to the primary for a short while after it commits a change.
+
+    Any request that publishes a configuration change gets a short-lived cookie,
+    which ``prefers_primary`` honours, so the client's next reads cannot hit a
+    replica that has not replayed the write yet.
+    """
+
+    def __init__(self, app: ASGIApp):
+        """Initialize middleware."""
+        self.app = app
+        self.max_age = max(1, round(get_settings().read_your_writes_seconds))
+        get_change_bus().subscribe(_note_write)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Serve a request, marking the response if it wrote."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        wrote = [False]
+        token = _request_wrote.set(wrote)
+
+        async def send_with_cookie(message: Message) -> None:
+            if message["type"] == "http.response.start" and wrote[0]:
+                cookie = f"{READ_PRIMARY_COOKIE}=1; Max-Age={self.max_age}; Path=/; HttpOnly; SameSite=Lax"
+                message["headers"] = [*message.get("headers", []), (b"set-cookie", cookie.encode())]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_cookie)
+        finally:
+            _request_wrote.reset(token)
@@ -0,0 +1,20 @@
+"""Entity tags for conditional GET requests."""
+
+import hashlib
+from typing import Any
+
+
+def make_etag(*parts: Any) -> str:
+    """Build a strong, quoted ETag from the values that identify a representation."""
+    digest = hashlib.blake2b("\x1f".join(str(part) for part in parts).encode(), digest_size=12).hexdigest()
+    return f'"{digest}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an ``If-None-Match`` header against an ETag (weak comparison, per RFC 9110)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return etag in candidates
@@ -0,0 +1,72 @@
+"""Request metrics middleware."""
+
+from collections.abc import Callable
+from time import perf_counter
+from typing import Any
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.infrastructure.metrics import MetricsRegistry, RequestMetrics, current_request, get_metrics_registry
+
+# Route label of requests that matched no route, so unknown paths do not add series
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class MetricsMiddleware:
+    """Record latency, DB time, and serialization time per route template.
+
+    A plain ASGI middleware: it only wraps ``send`` to capture the status, and the
+    timings are recorded once the response body has been sent.
+    """
+
+    def __init__(self, app: ASGIApp, registry: MetricsRegistry | None = None):
+        """Initialize middleware."""
+        self.app = app
+        self.registry = registry or get_metrics_registry()
+        self.route_paths: dict[Callable[..., Any], str] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Serve a request and record its metrics."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        metrics = RequestMetrics()
+        token = current_request.set(metrics)
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        started = perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = perf_counter() - started
+            current_request.reset(token)
+            self.registry.observe_request(
+                scope["method"],
+                self._route_path(scope),
+                status_code,
+                elapsed,
+                metrics.db_queries,
+                metrics.db_seconds,
+                metrics.pool_wait_seconds,
+                metrics.serialization_seconds,
+            )
+
+    def _route_path(self, scope: Scope) -> str:
+        """Get the path template of the route that served the request."""
+        endpoint = scope.get("endpoint")
+        if endpoint is None:
+            return UNMATCHED_ROUTE
+        path = self.route_paths.get(endpoint)
+        if path is None:
+            self.route_paths = {
+                route.endpoint: route.path for route in scope["app"].routes if hasattr(route, "endpoint")
+            }
+            path = self.route_paths.get(endpoint, UNMATCHED_ROUTE)
+        return path
@@ -1,6 +1,6 @@
 """API models for configurations."""
 
-from typing import Any
+from typing import Any, Literal
 from pydantic import BaseModel, Field
 
 
@@ -41,6 +41,13 @@ class ConfigurationCreateRequest(BaseModel):
     validation_rules: list[ValidationRuleDTO] = Field(default_factory=list)
 
 
+class ConfigurationImportRecord(ConfigurationCreateRequest):
+    """One NDJSON import record; export lines are valid records, so IDs round-trip."""
+
+    active: bool = Field(True, description="Active status")
+    id: str | None = Field(None, description="Configuration ID to keep; generated when omitted")
+
+
 class ConfigurationUpdateRequest(BaseModel):
     """Configuration update request."""
 
@@ -83,10 +90,161 @@ class ConfigurationListResponse(BaseModel):
 
     items: list[ConfigurationResponse] = Field(..., description="List of configurations")
     limit: int = Field(..., description="Items per page")
+    next_cursor: str | None = Field(None, description="Opaque cursor for the next page, if any")
     offset: int = Field(..., description="Offset from start")
     total: int = Field(..., description="Total number of configurations")
 
 
+class BatchGetRequest(BaseModel):
+    """Batch lookup request; keys and IDs may be combined."""
+
+    ids: list[str] = Field(default_factory=list, max_length=1000, description="Configuration IDs")
+    keys: list[str] = Field(default_factory=list, max_length=1000, description="Configuration keys")
+
+
+class BatchGetResponse(BaseModel):
+    """Batch lookup response."""
+
+    by_id: dict[str, ConfigurationResponse] = Field(..., description="Found configurations by requested ID")
+    by_key: dict[str, ConfigurationResponse] = Field(..., description="Found configurations by requested key")
+    missing_ids: list[str] = Field(default_factory=list, description="Requested IDs that do not exist")
+    missing_keys: list[str] = Field(default_factory=list, description="Requested keys that do not exist")
+
+
+class BulkOperationDTO(BaseModel):
+    """Bulk operation DTO; only the fields that are set are written."""
+
+    active: bool | None = Field(None, description="Active status")
+    data_type: str | None = Field(None, description="string, number, date, or list")
+    default_value: str | None = Field(None, description="Default value")
+    description: str | None = Field(None, description="Configuration description")
+    key: str = Field(..., min_length=1, max_length=255, description="Configuration key")
+    label: str | None = Field(None, min_length=1, max_length=255, description="Human readable label")
+    op: Literal["create", "update", "upsert", "delete"] = Field(..., description="Operation")
+    parent_config_id: str | None = Field(None, description="Parent configuration ID (null detaches)")
+    parent_conditions: list[ParentConditionDTO] | None = None
+    translations: list[TranslationDTO] | None = None
+    validation_rules: list[ValidationRuleDTO] | None = None
+
+
+class BulkRequest(BaseModel):
+    """Bulk request."""
+
+    atomic: bool = Field(True, description="Reject the whole batch if any operation is invalid")
+    operations: list[BulkOperationDTO] = Field(..., min_length=1, max_length=10_000)
+
+
+class BulkOperationResultDTO(BaseModel):
+    """Bulk operation result DTO."""
+
+    error: str | None = Field(None, description="Why the operation was rejected")
+    id: str | None = Field(None, description="Configuration ID")
+    index: int = Field(..., description="Position in the request")
+    key: str = Field(..., description="Configuration key")
+    status: str = Field(..., description="created, updated, deleted, error, or skipped")
+
+
+class BulkResponse(BaseModel):
+    """Bulk response."""
+
+    committed: bool = Field(..., description="Whether any changes were written")
+    failed: int = Field(..., description="Number of rejected operations")
+    results: list[BulkOperationResultDTO] = Field(..., description="Per-operation results in request order")
+    succeeded: int = Field(..., description="Number of written operations")
+
+
+class ImportErrorDTO(BaseModel):
+    """Rejected import line."""
+
+    error: str = Field(..., description="Why the line was rejected")
+    line: int = Field(..., description="1-based line number")
+
+
+class ImportResponse(BaseModel):
+    """Import response."""
+
+    errors: list[ImportErrorDTO] = Field(default_factory=list, description="First rejected lines")
+    failed: int = Field(..., description="Number of rejected lines")
+    imported: int = Field(..., description="Number of rows written")
+    received: int = Field(..., description="Number of non-empty lines read")
+
+
+class ResolveRequest(BaseModel):
+    """Value resolution request."""
+
+    context: dict[str, Any] = Field(default_factory=dict, description="Explicit values by configuration key")
+    keys: list[str] = Field(..., min_length=1, max_length=10_000, description="Configuration keys to resolve")
+
+
+class EvaluateRequest(BaseModel):
+    """Column evaluation request for one configuration's parent conditions."""
+
+    key: str = Field(..., description="Configuration key")
+    parent_values: list[Any] = Field(..., min_length=1, max_length=100_000, description="Parent values, one per row")
+
+
+class EvaluateResponse(BaseModel):
+    """Column evaluation response, one entry per requested row."""
+
+    matched: list[bool] = Field(..., description="Whether a parent condition matched the row")
+    values: list[Any] = Field(..., description="Matched condition default, else the configuration default")
+
+
+class ResolvedValueDTO(BaseModel):
+    """Resolved value DTO."""
+
+    source: str = Field(..., description="context, condition, or default")
+    value: Any = Field(None, description="Effective value")
+
+
+class ResolveResponse(BaseModel):
+    """Value resolution response."""
+
+    missing: list[str] = Field(default_factory=list, description="Requested keys that do not exist")
+    values: dict[str, ResolvedValueDTO] = Field(..., description="Effective values by key")
+
+
+class ChangeDTO(BaseModel):
+    """Change-feed entry DTO."""
+
+    configuration: ConfigurationResponse | None = Field(None, description="Current state; null once deleted")
+    id: str = Field(..., description="Configuration ID")
+    key: str = Field(..., description="Configuration key")
+    op: str = Field(..., description="create, update, or delete")
+    revision: int = Field(..., description="Change-log revision of the change")
+
+
+class ChangesResponse(BaseModel):
+    """Change-feed page DTO."""
+
+    changes: list[ChangeDTO] = Field(..., description="Latest change per configuration, oldest first")
+    has_more: bool = Field(..., description="Whether more changes follow; request again with since=revision")
+    revision: int = Field(..., description="Revision to pass as since on the next request")
+
+
+class ValidateRequest(BaseModel):
+    """Value validation request; identify the configuration by ID or key."""
+
+    id: str | None = Field(None, description="Configuration ID")
+    key: str | None = Field(None, description="Configuration key")
+    values: list[Any] = Field(..., min_length=1, max_length=100_000, description="Candidate values")
+
+
+class ValueErrorsDTO(BaseModel):
+    """Rules broken by one candidate value."""
+
+    errors: list[str] = Field(..., description="Broken rules")
+    index: int = Field(..., description="Position in the request")
+
+
+class ValidateResponse(BaseModel):
+    """Value validation response."""
+
+    errors: list[ValueErrorsDTO] = Field(default_factory=list, description="Invalid values only, in request order")
+    invalid: int = Field(..., description="Number of invalid values")
+    valid: int = Field(..., description="Number of valid values")
+
+
 class ErrorResponse(BaseModel):
     """Error response."""
 
@@ -1,27 +1,86 @@
 """Configuration API routers."""
 
-from typing import Annotated
+import asyncio
+import json
+import uuid
+import zlib
+from collections.abc import AsyncIterator
+from datetime import datetime
+from typing import Annotated, Literal
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.apis.consistency import get_read_session
+from src.apis.etags import etag_matches, make_etag
+from src.apis.serialization import (
+    RESPONSE_FIELDS,
+    JSONBytesResponse,
+    encode_configuration,
+    encode_configuration_list,
+    encode_json,
+    encode_object,
+    parse_fields,
+    row_to_dict,
+)
+from src.domain.translations import language_chain, parse_accept_language
 from src.apis.models.configuration_models import (
+    BatchGetRequest,
+    BatchGetResponse,
+    BulkOperationDTO,
+    BulkOperationResultDTO,
+    BulkRequest,
+    BulkResponse,
+    ChangeDTO,
+    ChangesResponse,
     ConfigurationCreateRequest,
+    ConfigurationImportRecord,
     ConfigurationUpdateRequest,
     ConfigurationResponse,
     ConfigurationListResponse,
+    EvaluateRequest,
+    EvaluateResponse,
+    ImportErrorDTO,
+    ImportResponse,
     ParentConditionDTO,
+    ResolvedValueDTO,
+    ResolveRequest,
+    ResolveResponse,
     TranslationDTO,
+    ValidateRequest,
+    ValidateResponse,
     ValidationRuleDTO,
 )
 from src.application.services.configuration_service import ConfigurationService
+from src.configs import get_settings
 from src.infrastructure.database.connection import get_session
-from src.domain.entities.configuration import ParentCondition, Translation, ValidationRule
+from src.domain.entities.configuration import (
+    BulkOperation,
+    Configuration,
+    ParentCondition,
+    Translation,
+    ValidationRule,
+)
+from src.infrastructure.cache import get_snapshot_cache
+from src.infrastructure.notifications import (
+    ConfigurationChange,
+    WatchItem,
+    WatchSubscription,
+    get_change_broadcaster,
+)
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Export output is flushed to the client in chunks of roughly this many bytes
+EXPORT_CHUNK_BYTES = 64 * 1024
+
+# Rejected import lines reported back in detail (all of them are counted)
+IMPORT_MAX_REPORTED_ERRORS = 100
+
 router = APIRouter(
     prefix="/configurations",
     tags=["configurations"],
@@ -35,6 +94,13 @@ async def get_configuration_service(
     return ConfigurationService(session)
 
 
+async def get_read_configuration_service(
+    session: Annotated[AsyncSession, Depends(get_read_session)],
+) -> ConfigurationService:
+    """Dependency to get a configuration service for read-only endpoints, on a replica when configured."""
+    return ConfigurationService(session)
+
+
 @router.post(
     "/",
     response_model=ConfigurationResponse,
@@ -83,56 +149,533 @@ async def create_configuration(
     response_model=ConfigurationListResponse,
 )
 async def list_configurations(
-    service: Annotated[ConfigurationService, Depends(get_configuration_service)],
+    service: Annotated[ConfigurationService, Depends(get_read_configuration_service)],
     limit: Annotated[int, Query(ge=1, le=100)] = 10,
     offset: Annotated[int, Query(ge=0)] = 0,
-) -> ConfigurationListResponse:
-    """List all configurations."""
+    cursor: Annotated[str | None, Query(description="Opaque cursor from a previous page")] = None,
+    count: Annotated[Literal["exact", "estimated"], Query(description="How the total is computed")] = "exact",
+    fields: Annotated[
+        str | None, Query(description="Comma-separated response fields, e.g. key,data_type,default_value")
+    ] = None,
+    lang: Annotated[
+        str | None,
+        Query(description="Preferred languages for translations, e.g. ar-JO,fr; 'auto' uses Accept-Language"),
+    ] = None,
+    accept_language: Annotated[str | None, Header()] = None,
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> Response:
+    """List all configurations.
+
+    Pages are ordered by key. Passing the returned ``next_cursor`` back as ``cursor``
+    pages in constant time regardless of depth; ``offset`` is ignored in that mode.
+    The page itself is read as ``(id, updated_at)`` pairs and assembled from cached
+    snapshots, so only configurations changed since they were last served are loaded.
+    With ``fields``, only those columns are selected and returned; with ``lang``,
+    translations are narrowed to the best match of the fallback chain.
+    """
     try:
-        configs, total = await service.list_configurations(limit=limit, offset=offset)
-        return ConfigurationListResponse(
-            items=[_config_to_response(c) for c in configs],
+        projection = parse_fields(fields)
+        languages = _language_chain(lang, accept_language)
+        if languages and not projection:
+            projection = RESPONSE_FIELDS
+        etag = make_etag(await service.get_store_version(), limit, offset, cursor, count, projection, languages)
+        headers = _etag_headers(etag, vary_language=lang == "auto")
+        if etag_matches(if_none_match, etag):
+            return _not_modified(headers)
+        if projection:
+            rows, total, next_cursor = await service.list_configuration_fields(
+                projection,
+                limit=limit,
+                offset=offset,
+                cursor=cursor,
+                estimate_total=count == "estimated",
+                languages=languages,
+            )
+            items = [encode_json(row_to_dict(row, projection, languages)) for row in rows]
+        elif get_settings().snapshot_cache_enabled:
+            versions, total, next_cursor = await service.list_configuration_versions(
+                limit=limit,
+                offset=offset,
+                cursor=cursor,
+                estimate_total=count == "estimated",
+            )
+            items = await _encode_snapshots(service, versions)
+        else:
+            configs, total, next_cursor = await service.list_configurations(
+                limit=limit,
+                offset=offset,
+                cursor=cursor,
+                estimate_total=count == "estimated",
+            )
+            items = [encode_configuration(c) for c in configs]
+        body = encode_configuration_list(
+            items,
             total=total,
             limit=limit,
-            offset=offset,
+            offset=0 if cursor else offset,
+            next_cursor=next_cursor,
         )
+        return JSONBytesResponse(body, headers=headers)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         logger.error("Error listing configurations", error=str(e))
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
 
 
-@router.get("/parent-options")
-async def get_parent_options_all(
+@router.post(
+    "/batch-get",
+    response_model=BatchGetResponse,
+)
+async def batch_get_configurations(
+    req: BatchGetRequest,
     service: Annotated[ConfigurationService, Depends(get_configuration_service)],
-) -> ConfigurationListResponse:
-    """Get all available parent configurations (for creating new configs)."""
+) -> Response:
+    """Get many configurations by key and/or ID in one round-trip."""
     try:
-        configs = await service.get_parent_options(current_config_id=None)
-        return ConfigurationListResponse(
-            items=[_config_to_response(c) for c in configs],
-            total=len(configs),
-            limit=len(configs),
-            offset=0,
+        ids = [UUID(config_id) for config_id in req.ids]
+        by_id, by_key = await service.batch_get(ids, req.keys)
+        body = encode_object(
+            [
+                ("by_id", encode_object((str(i), _encode_snapshot(c)) for i, c in by_id.items())),
+                ("by_key", encode_object((k, _encode_snapshot(c)) for k, c in by_key.items())),
+                ("missing_ids", encode_json([str(i) for i in dict.fromkeys(ids) if i not in by_id])),
+                ("missing_keys", encode_json([k for k in dict.fromkeys(req.keys) if k not in by_key])),
+            ]
         )
+        return JSONBytesResponse(body)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid configuration ID")
     except Exception as e:
-        logger.error("Error getting parent options", error=str(e))
+        logger.error("Error batch getting configurations", error=str(e))
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
+
+
+@router.post(
+    "/bulk",
+    response_model=BulkResponse,
+)
+async def bulk_configurations(
+    req: BulkRequest,
+    service: Annotated[ConfigurationService, Depends(get_configuration_service)],
+) -> BulkResponse:
+    """Create, update, upsert, and delete many configurations in one transaction."""
+    try:
+        operations = [BulkOperation(op=o.op, key=o.key, fields=_bulk_fields(o)) for o in req.operations]
+        results, committed = await service.bulk_apply(operations, atomic=req.atomic)
+        succeeded = sum(r.status in ("created", "updated", "deleted") for r in results)
+        return BulkResponse(
+            committed=committed,
+            succeeded=succeeded,
+            failed=sum(r.status == "error" for r in results),
+            results=[
+                BulkOperationResultDTO(
+                    index=r.index,
+                    key=r.key,
+                    id=str(r.id) if r.id else None,
+                    status=r.status,
+                    error=r.error,
+                )
+                for r in results
+            ],
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        logger.error("Error applying bulk operations", error=str(e))
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
+
+
+@router.post(
+    "/resolve",
+    response_model=ResolveResponse,
+)
+async def resolve_configurations(
+    req: ResolveRequest,
+    service: Annotated[ConfigurationService, Depends(get_configuration_service)],
+) -> ResolveResponse:
+    """Resolve effective values by walking parent conditions."""
+    try:
+        values, missing = await service.resolve(req.keys, req.context)
+        return ResolveResponse(
+            values={key: ResolvedValueDTO(value=v.value, source=v.source) for key, v in values.items()},
+            missing=missing,
+        )
+    except Exception as e:
+        logger.error("Error resolving configurations", error=str(e))
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
 
 
-@router.get("/parent-options/by/{config_id}")
+@router.post(
+    "/evaluate",
+    response_model=EvaluateResponse,
+)
+async def evaluate_conditions(
+    req: EvaluateRequest,
+    service: Annotated[ConfigurationService, Depends(get_configuration_service)],
+) -> Response:
+    """Evaluate one configuration's parent conditions for many parent values at once."""
+    try:
+        result = await service.evaluate_conditions(req.key, req.parent_values)
+        if result is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Configuration not found")
+        _, matched, values = result
+        return JSONBytesResponse(encode_json({"matched": matched, "values": values}))
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        logger.error("Error evaluating conditions", error=str(e))
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
+
+
+@router.post(
+    "/validate",
+    response_model=ValidateResponse,
+)
+async def validate_values(
+    req: ValidateRequest,
+    service: Annotated[ConfigurationService, Depends(get_configuration_service)],
+) -> Response:
+    """Check a batch of candidate values against one configuration's validation rules."""
+    if (req.id is None) == (req.key is None):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Provide exactly one of id or key")
+    try:
+        config_id = UUID(req.id) if req.id is not None else None
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid configuration ID")
+    try:
+        invalid = await service.validate_values(req.values, config_id=config_id, key=req.key)
+        if invalid is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Configuration not found")
+        body = encode_json(
+            {
+                "errors": [{"errors": errors, "index": index} for index, errors in invalid],
+                "invalid": len(invalid),
+                "valid": len(req.values) - len(invalid),
+            }
+        )
+        return JSONBytesResponse(body)
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        logger.error("Error validating values", error=str(e))
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
+
+
+@router.get(
+    "/changes",
+    response_model=ChangesResponse,
+)
+async def list_changes(
+    service: Annotated[ConfigurationService, Depends(get_configuration_service)],
+    since: Annotated[int, Query(ge=0, description="Last revision already applied by the client")] = 0,
+    limit: Annotated[int, Query(ge=1, le=10_000, description="Maximum change-log entries to read")] = 1000,
+) -> ChangesResponse:
+    """List configurations changed after a revision.
+
+    Each configuration appears once, at its latest change in the page, with its
+    current state (or null when deleted). Pass the returned ``revision`` as
+    ``since`` to continue; ``since=0`` replays the whole log.
+    """
+    try:
+        entries, revision, has_more = await service.get_changes(since=since, limit=limit)
+        return ChangesResponse(
+            changes=[
+                ChangeDTO(
+                    configuration=_config_to_response(e.configuration) if e.configuration else None,
+                    id=str(e.config_id),
+                    key=e.key,
+                    op=e.op,
+                    revision=e.revision,
+                )
+                for e in entries
+            ],
+            has_more=has_more,
+            revision=revision,
+        )
+    except Exception as e:
+        logger.error("Error listing configuration changes", error=str(e))
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
+
+
+@router.get("/watch")
+async def watch_configurations(
+    session: Annotated[AsyncSession, Depends(get_session)],
+    key_prefix: Annotated[str | None, Query(description="Only configurations whose key starts with this")] = None,
+    parent_config_id: Annotated[UUID | None, Query(description="Only this configuration and its subtree")] = None,
+    since: Annotated[int | None, Query(ge=0, description="Replay changes after this revision first")] = None,
+    last_event_id: Annotated[str | None, Header()] = None,
+) -> StreamingResponse:
+    """Stream configuration changes as server-sent events.
+
+    Each event is named after the operation and carries the change-log revision as
+    its id, so a reconnecting ``EventSource`` resumes through ``Last-Event-ID``. A
+    ``reset`` event means changes may have been missed and the client should resync
+    from ``/changes``; the server closes the stream right after an overflow reset.
+    """
+    if last_event_id:
+        try:
+            since = int(last_event_id)
+        except ValueError:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid Last-Event-ID")
+
+    service = ConfigurationService(session)
+    try:
+        subscription, replay = await service.watch(key_prefix=key_prefix, root_id=parent_config_id, since=since)
+    except Exception as e:
+        logger.error("Error starting configuration watch", error=str(e))
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
+    finally:
+        # Watchers are long-lived; none of them may hold a pooled connection
+        await session.close()
+
+    return StreamingResponse(
+        _watch_stream(subscription, replay, heartbeat=get_settings().watch_heartbeat_seconds),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _watch_stream(
+    subscription: WatchSubscription,
+    replay: list[ConfigurationChange],
+    heartbeat: float,
+) -> AsyncIterator[bytes]:
+    """Encode replayed and live changes as SSE, with keepalive comments while idle."""
+    try:
+        yield b": connected\n\n"
+        last_revision = 0
+        for change in replay:
+            yield _sse_event(change)
+            last_revision = change.revision or last_revision
+        while True:
+            try:
+                item: WatchItem = await asyncio.wait_for(subscription.get(), timeout=heartbeat)
+            except TimeoutError:
+                yield b": keepalive\n\n"
+                continue
+            if item is None:
+                yield _sse_event(ConfigurationChange.reset())
+                return
+            # Already sent during the replay
+            if item.revision is not None and item.revision <= last_revision:
+                continue
+            yield _sse_event(item)
+    finally:
+        get_change_broadcaster().unsubscribe(subscription)
+
+
+def _sse_event(change: ConfigurationChange) -> bytes:
+    """Encode a change as one server-sent event."""
+    data = json.dumps(
+        {
+            "op": change.op,
+            "id": str(change.config_id) if change.config_id else None,
+            "key": change.key,
+            "parent_config_id": str(change.parent_config_id) if change.parent_config_id else None,
+            "previous_parent_id": str(change.previous_parent_id) if change.previous_parent_id else None,
+            "revision": change.revision,
+        },
+        separators=(",", ":"),
+    )
+    event_id = f"id: {change.revision}\n" if change.revision is not None else ""
+    return f"{event_id}event: {change.op}\ndata: {data}\n\n".encode()
+
+
+@router.get("/export")
+async def export_configurations(
+    session: Annotated[AsyncSession, Depends(get_read_session)],
+    gzip: Annotated[bool, Query(description="Compress the stream with gzip")] = False,
+) -> StreamingResponse:
+    """Stream every configuration as NDJSON, one configuration per line."""
+    service = ConfigurationService(session)
+    body = _export_stream(service, session, compress=gzip)
+    if gzip:
+        return StreamingResponse(
+            body,
+            media_type="application/gzip",
+            headers={"Content-Disposition": 'attachment; filename="configurations.ndjson.gz"'},
+        )
+    return StreamingResponse(
+        body,
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": 'attachment; filename="configurations.ndjson"'},
+    )
+
+
+async def _export_stream(service: ConfigurationService, session: AsyncSession, compress: bool) -> AsyncIterator[bytes]:
+    """Encode the export as NDJSON chunks, gzipping on the fly when asked."""
+    compressor = zlib.compressobj(wbits=31) if compress else None
+    buffer: list[bytes] = []
+    size = 0
+    try:
+        async for config in service.export_configurations():
+            line = encode_configuration(config) + b"\n"
+            buffer.append(line)
+            size += len(line)
+            if size >= EXPORT_CHUNK_BYTES:
+                chunk = b"".join(buffer)
+                buffer, size = [], 0
+                yield compressor.compress(chunk) if compressor else chunk
+        chunk = b"".join(buffer)
+        if compressor:
+            yield compressor.compress(chunk) + compressor.flush()
+        elif chunk:
+            yield chunk
+    except Exception as e:
+        # Headers are already sent; truncating the stream is all that is left to do
+        logger.error("Error exporting configurations", error=str(e))
+        raise
+    finally:
+        # The request-scoped session may already be released; the stream owns it now
+        await session.close()
+
+
+@router.post(
+    "/import",
+    response_model=ImportResponse,
+)
+async def import_configurations(
+    request: Request,
+    service: Annotated[ConfigurationService, Depends(get_configuration_service)],
+    on_conflict: Annotated[Literal["update", "skip"], Query(description="What to do with existing keys")] = "update",
+) -> ImportResponse:
+    """Import NDJSON (optionally gzipped) as produced by the export endpoint.
+
+    The body is parsed incrementally; each line is validated on its own and invalid
+    lines are reported without aborting the import.
+    """
+    received = 0
+    errors: list[ImportErrorDTO] = []
+    failed = 0
+
+    async def records() -> AsyncIterator[tuple[int, Configuration]]:
+        nonlocal received, failed
+        async for line_number, line in _ndjson_lines(request):
+            received += 1
+            try:
+                yield line_number, _import_record_to_domain(ConfigurationImportRecord.model_validate_json(line))
+            except (ValidationError, ValueError) as e:
+                failed += 1
+                if len(errors) < IMPORT_MAX_REPORTED_ERRORS:
+                    errors.append(ImportErrorDTO(line=line_number, error=str(e)))
+
+    try:
+        imported, rejected = await service.import_configurations(records(), update_existing=on_conflict == "update")
+        failed += len(rejected)
+        errors.extend(ImportErrorDTO(line=line, error=error) for line, error in rejected[:IMPORT_MAX_REPORTED_ERRORS])
+        errors.sort(key=lambda e: e.line)
+        return ImportResponse(
+            received=received, imported=imported, failed=failed, errors=errors[:IMPORT_MAX_REPORTED_ERRORS]
+        )
+    except (ValueError, zlib.error) as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        logger.error("Error importing configurations", error=str(e))
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
+
+
+async def _ndjson_lines(request: Request) -> AsyncIterator[tuple[int, bytes]]:
+    """Yield ``(line_number, line)`` for each non-empty body line, gunzipping if needed."""
+    decompressor = None
+    pending = b""
+    line_number = 0
+    first = True
+    async for chunk in request.stream():
+        if first and chunk:
+            first = False
+            if chunk[:2] == b"\x1f\x8b" or request.headers.get("content-encoding") == "gzip":
+                decompressor = zlib.decompressobj(wbits=47)
+        data = decompressor.decompress(chunk) if decompressor else chunk
+        *lines, pending = (pending + data).split(b"\n")
+        for line in lines:
+            line_number += 1
+            if line.strip():
+                yield line_number, line
+    if decompressor:
+        pending += decompressor.flush()
+    for line in pending.split(b"\n"):
+        line_number += 1
+        if line.strip():
+            yield line_number, line
+
+
+def _import_record_to_domain(record: ConfigurationImportRecord) -> Configuration:
+    """Convert a validated import record to a domain entity."""
+    return Configuration(
+        id=UUID(record.id) if record.id else uuid.uuid4(),
+        key=record.key,
+        label=record.label,
+        description=record.description,
+        data_type=record.data_type,
+        default_value=record.default_value,
+        active=record.active,
+        parent_config_id=UUID(record.parent_config_id) if record.parent_config_id else None,
+        validation_rules=[ValidationRule(rule_type=r.rule_type, value=r.value) for r in record.validation_rules],
+        parent_conditions=[
+            ParentCondition(operator=p.operator, value=p.value, default_value=p.default_value)
+            for p in record.parent_conditions
+        ],
+        translations=[
+            Translation(language=t.language, label=t.label, description=t.description) for t in record.translations
+        ],
+    )
+
+
+@router.get(
+    "/parent-options",
+    response_model=ConfigurationListResponse,
+)
+async def get_parent_options_all(
+    service: Annotated[ConfigurationService, Depends(get_read_configuration_service)],
+    limit: Annotated[int, Query(ge=1, le=1000)] = 1000,
+    cursor: Annotated[str | None, Query(description="Opaque cursor from a previous page")] = None,
+) -> Response:
+    """Get all available parent configurations (for creating new configs)."""
+    return await _parent_options_response(service, None, limit, cursor)
+
+
+@router.get(
+    "/parent-options/by/{config_id}",
+    response_model=ConfigurationListResponse,
+)
 async def get_parent_options(
     config_id: UUID,
-    service: Annotated[ConfigurationService, Depends(get_configuration_service)],
-) -> ConfigurationListResponse:
+    service: Annotated[ConfigurationService, Depends(get_read_configuration_service)],
+    limit: Annotated[int, Query(ge=1, le=1000)] = 1000,
+    cursor: Annotated[str | None, Query(description="Opaque cursor from a previous page")] = None,
+) -> Response:
     """Get available parent configurations (excluding current and descendants)."""
+    return await _parent_options_response(service, config_id, limit, cursor)
+
+
+async def _parent_options_response(
+    service: ConfigurationService,
+    config_id: UUID | None,
+    limit: int,
+    cursor: str | None,
+) -> Response:
+    """Build one page of parent options."""
     try:
-        configs = await service.get_parent_options(current_config_id=config_id)
-        return ConfigurationListResponse(
-            items=[_config_to_response(c) for c in configs],
-            total=len(configs),
-            limit=len(configs),
+        configs, total, next_cursor = await service.get_parent_options(
+            current_config_id=config_id,
+            limit=limit,
+            cursor=cursor,
+        )
+        body = encode_configuration_list(
+            [_encode_snapshot(c, store=not service.on_replica) for c in configs],
+            total=total,
+            limit=limit,
             offset=0,
+            next_cursor=next_cursor,
         )
+        return JSONBytesResponse(body)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         logger.error("Error getting parent options", error=str(e))
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
@@ -144,16 +687,56 @@ async def get_parent_options(
 )
 async def get_configuration(
     config_id: UUID,
-    service: Annotated[ConfigurationService, Depends(get_configuration_service)],
-) -> ConfigurationResponse:
-    """Get a configuration by ID."""
+    service: Annotated[ConfigurationService, Depends(get_read_configuration_service)],
+    fields: Annotated[
+        str | None, Query(description="Comma-separated response fields, e.g. key,data_type,default_value")
+    ] = None,
+    lang: Annotated[
+        str | None,
+        Query(description="Preferred languages for translations, e.g. ar-JO,fr; 'auto' uses Accept-Language"),
+    ] = None,
+    accept_language: Annotated[str | None, Header()] = None,
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> Response:
+    """Get a configuration by ID.
+
+    Only ``updated_at`` is read up front: an unchanged configuration is answered with
+    304, or from its cached snapshot, without loading or serializing it. ``fields``
+    and ``lang`` project the response as on the list endpoint.
+    """
     try:
+        projection = parse_fields(fields)
+        languages = _language_chain(lang, accept_language)
+        if languages and not projection:
+            projection = RESPONSE_FIELDS
+        vary_language = lang == "auto"
+        version = await service.get_configuration_version(config_id)
+        if version is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Configuration not found")
+        etag = _configuration_etag(config_id, version, projection, languages)
+        if etag_matches(if_none_match, etag):
+            return _not_modified(_etag_headers(etag, vary_language))
+        if projection:
+            row = await service.get_configuration_fields(config_id, (*projection, "updated_at"), languages)
+            if not row:
+                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Configuration not found")
+            etag = _configuration_etag(config_id, row["updated_at"], projection, languages)
+            body = encode_json(row_to_dict(row, projection, languages))
+            return JSONBytesResponse(body, headers=_etag_headers(etag, vary_language))
+        snapshots = get_snapshot_cache() if get_settings().snapshot_cache_enabled else None
+        snapshot = snapshots.get(config_id, version) if snapshots else None
+        if snapshot is not None:
+            return JSONBytesResponse(snapshot, headers=_etag_headers(etag))
+        # Snapshot miss: load and encode the configuration, caching it for the next request
         config = await service.get_configuration(config_id)
         if not config:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Configuration not found")
-        return _config_to_response(config)
+        body = _encode_snapshot(config, store=not service.on_replica)
+        return JSONBytesResponse(body, headers=_etag_headers(_configuration_etag(config.id, config.updated_at)))
     except HTTPException:
         raise
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         logger.error("Error getting configuration", error=str(e))
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
@@ -205,6 +788,8 @@ async def update_configuration(
 
     except HTTPException:
         raise
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         logger.error("Error updating configuration", error=str(e))
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
@@ -230,6 +815,88 @@ async def delete_configuration(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
 
 
+def _bulk_fields(req: BulkOperationDTO) -> dict:
+    """Convert the fields set on a bulk operation to domain values."""
+    fields = req.model_dump(exclude_unset=True, exclude={"op", "key"})
+    if "validation_rules" in fields:
+        fields["validation_rules"] = [
+            ValidationRule(rule_type=r.rule_type, value=r.value) for r in req.validation_rules or []
+        ]
+    if "parent_conditions" in fields:
+        fields["parent_conditions"] = [
+            ParentCondition(operator=p.operator, value=p.value, default_value=p.default_value)
+            for p in req.parent_conditions or []
+        ]
+    if "translations" in fields:
+        fields["translations"] = [
+            Translation(language=t.language, label=t.label, description=t.description) for t in req.translations or []
+        ]
+    if "parent_config_id" in fields:
+        fields["parent_config_id"] = UUID(req.parent_config_id) if req.parent_config_id else None
+    return fields
+
+
+async def _encode_snapshots(service: ConfigurationService, versions: list[tuple[UUID, datetime]]) -> list[bytes]:
+    """Encode configurations in order from cached snapshots, loading only the misses."""
+    snapshots = get_snapshot_cache()
+    bodies: dict[UUID, bytes] = {}
+    for config_id, version in versions:
+        body = snapshots.get(config_id, version)
+        if body is not None:
+            bodies[config_id] = body
+    missing = [config_id for config_id, _ in versions if config_id not in bodies]
+    for config in await service.get_configurations(missing):
+        bodies[config.id] = _encode_snapshot(config, store=not service.on_replica)
+    # Configurations deleted since the page was read are left out
+    return [bodies[config_id] for config_id, _ in versions if config_id in bodies]
+
+
+def _encode_snapshot(config: Configuration, store: bool = True) -> bytes:
+    """Encode a configuration, reusing its cached snapshot and refreshing it if ``store``."""
+    if not get_settings().snapshot_cache_enabled:
+        return encode_configuration(config)
+    snapshots = get_snapshot_cache()
+    body = snapshots.get(config.id, config.updated_at)
+    if body is None:
+        body = encode_configuration(config)
+        if store:
+            snapshots.put(config.id, config.updated_at, body)
+    return body
+
+
+def _configuration_etag(
+    config_id: UUID,
+    version: datetime,
+    projection: tuple[str, ...] | None = None,
+    languages: list[str] | None = None,
+) -> str:
+    """Build the ETag of one configuration representation."""
+    if projection or languages:
+        return make_etag(config_id, version.isoformat(), projection, languages)
+    return make_etag(config_id, version.isoformat())
+
+
+def _language_chain(lang: str | None, accept_language: str | None) -> list[str] | None:
+    """Build the translation fallback chain for a ``lang`` parameter, if any."""
+    if not lang:
+        return None
+    preferred = parse_accept_language(accept_language or "") if lang == "auto" else lang.split(",")
+    return language_chain([tag.strip() for tag in preferred], get_settings().default_language)
+
+
+def _etag_headers(etag: str, vary_language: bool = False) -> dict[str, str]:
+    """Headers that let clients cache a representation but revalidate it on every use."""
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if vary_language:
+        headers["Vary"] = "Accept-Language"
+    return headers
+
+
+def _not_modified(headers: dict[str, str]) -> Response:
+    """Build an empty 304 response for a matching ``If-None-Match``."""
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+
 def _config_to_response(config) -> ConfigurationResponse:
     """Convert configuration domain entity to response DTO."""
     return ConfigurationResponse(
@@ -0,0 +1,93 @@
+"""Read-through caching layer for the configuration repository."""
+
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.repositories.configuration_repository import ConfigurationRepository
+from src.domain.entities.configuration import Configuration as ConfigurationEntity
+from src.infrastructure.cache import ConfigurationCache
+
+
+class CachedConfigurationRepository(ConfigurationRepository):
+    """Configuration repository that serves point lookups from an in-process cache.
+
+    Writes go through the base repository, whose change notifications evict the cache.
+    With ``write_back`` off (sessions on a lagging replica) hits are still served but
+    misses are not cached: the primary's invalidation may already have fired.
+    """
+
+    def __init__(self, session: AsyncSession, cache: ConfigurationCache, write_back: bool = True):
+        """Initialize repository."""
+        super().__init__(session)
+        self.cache = cache
+        self.write_back = write_back
+
+    async def get_by_id(self, config_id: UUID) -> ConfigurationEntity | None:
+        """Get configuration by ID, reading through the cache."""
+        cached = self.cache.get_by_id(config_id)
+        if cached is not None:
+            return cached
+        generation = self.cache.generation
+        config = await super().get_by_id(config_id)
+        if config and self.write_back:
+            self.cache.put(config, generation)
+        return config
+
+    async def get_version(self, config_id: UUID) -> datetime | None:
+        """Get a configuration's ``updated_at``, from the cache when possible."""
+        cached = self.cache.get_version(config_id)
+        if cached is not None:
+            return cached
+        return await super().get_version(config_id)
+
+    async def get_by_key(self, key: str) -> ConfigurationEntity | None:
+        """Get configuration by key, reading through the cache."""
+        cached = self.cache.get_by_key(key)
+        if cached is not None:
+            return cached
+        generation = self.cache.generation
+        config = await super().get_by_key(key)
+        if config and self.write_back:
+            self.cache.put(config, generation)
+        return config
+
+    async def get_by_ids(self, config_ids: list[UUID]) -> list[ConfigurationEntity]:
+        """Get configurations by ID, querying only the ones not cached."""
+        found, missing = [], []
+        for config_id in dict.fromkeys(config_ids):
+            cached = self.cache.get_by_id(config_id)
+            if cached is not None:
+                found.append(cached)
+            else:
+                missing.append(config_id)
+        return found + await self._load_many(super().get_by_ids, missing)
+
+    async def get_by_keys(self, keys: list[str]) -> list[ConfigurationEntity]:
+        """Get configurations by key, querying only the ones not cached."""
+        found, missing = [], []
+        for key in dict.fromkeys(keys):
+            cached = self.cache.get_by_key(key)
+            if cached is not None:
+                found.append(cached)
+            else:
+                missing.append(key)
+        return found + await self._load_many(super().get_by_keys, missing)
+
+    async def _load_many(
+        self,
+        loader: Callable[[list[Any]], Awaitable[list[ConfigurationEntity]]],
+        identifiers: list[Any],
+    ) -> list[ConfigurationEntity]:
+        """Load cache misses in one query and cache them."""
+        if not identifiers:
+            return []
+        generation = self.cache.generation
+        configs = await loader(identifiers)
+        if self.write_back:
+            for config in configs:
+                self.cache.put(config, generation)
+        return configs
@@ -1,29 +1,228 @@
 """Repository for Configuration data access."""
 
+import base64
+import dataclasses
 import json
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime
+from typing import Any
+from typing import cast as typing_cast
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import CursorResult, cast, delete, func, insert, literal, select, text, tuple_, update
+from sqlalchemy.dialects.postgresql import JSONB, JSONPATH
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.infrastructure.database.models import Configuration as ConfigurationModel
+from src.infrastructure.database.models import ConfigurationChangeLog as ChangeLogModel
+from src.infrastructure.notifications import ChangeBus, ChangeOperation, ConfigurationChange, get_change_bus
 from src.domain.entities.configuration import (
     Configuration as ConfigurationEntity,
     ParentCondition,
     Translation,
     ValidationRule,
 )
+from src.domain.translations import LANGUAGE_TAG
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Rows per multi-row INSERT; keeps bound parameters well under PostgreSQL/SQLite limits
+BULK_CHUNK_SIZE = 500
+
+# Columns overwritten when an upserted key already exists (id and created_at are kept)
+UPSERT_COLUMNS = (
+    "active",
+    "data_type",
+    "default_value",
+    "description",
+    "label",
+    "parent_conditions",
+    "parent_config_id",
+    "translations",
+    "updated_at",
+    "validation_rules",
+)
+
+JSON_COLUMNS = frozenset({"parent_conditions", "translations", "validation_rules"})
+
+
+# Transaction-scoped advisory lock serializing change-log writers on PostgreSQL, so
+# revisions become visible in order and a reader never skips a late-committing one.
+# Writes take it only after their data statements, but it is store-wide: commits
+# that log changes still run one at a time, whatever keys they touch.
+CHANGE_LOG_LOCK_ID = 0x636F6E66
+
+
+def encode_cursor(key: str, config_id: UUID) -> str:
+    """Encode a keyset position as an opaque pagination cursor."""
+    raw = json.dumps([key, str(config_id)], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[str, UUID]:
+    """Decode an opaque pagination cursor into its (key, id) position."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        key, config_id = json.loads(raw)
+        return str(key), UUID(config_id)
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid pagination cursor") from e
+
+
+_IMPORT_COLUMNS = [
+    "id",
+    "key",
+    "label",
+    "description",
+    "data_type",
+    "default_value",
+    "active",
+    "parent_config_id",
+    "validation_rules",
+    "parent_conditions",
+    "translations",
+]
+
+_CREATE_IMPORT_STAGING = """
+CREATE TEMPORARY TABLE configurations_import (
+    import_seq BIGSERIAL,
+    id UUID NOT NULL,
+    key VARCHAR(255) NOT NULL,
+    label VARCHAR(255) NOT NULL,
+    description TEXT,
+    data_type VARCHAR(50) NOT NULL,
+    default_value TEXT,
+    active BOOLEAN NOT NULL,
+    parent_config_id UUID,
+    validation_rules JSONB,
+    parent_conditions JSONB,
+    translations JSONB
+) ON COMMIT DROP
+"""
+
+# DISTINCT ON keeps the last staged record per key, as ON CONFLICT may touch a row once
+_MERGE_IMPORT_SELECT = """
+INSERT INTO configurations (
+    id, key, label, description, data_type, default_value, active, parent_config_id,
+    validation_rules, parent_conditions, translations, created_at, updated_at
+)
+SELECT DISTINCT ON (key)
+    id, key, label, description, data_type, default_value, active, parent_config_id,
+    validation_rules, parent_conditions, translations, timezone('utc', now()), timezone('utc', now())
+FROM configurations_import
+ORDER BY key, import_seq DESC
+"""
+
+_MERGE_IMPORT_UPDATE = (
+    _MERGE_IMPORT_SELECT
+    + "ON CONFLICT (key) DO UPDATE SET "
+    + ", ".join(f"{column} = EXCLUDED.{column}" for column in UPSERT_COLUMNS)
+)
+
+_MERGE_IMPORT_SKIP = _MERGE_IMPORT_SELECT + "ON CONFLICT (key) DO NOTHING"
+
+_CREATE_IMPORT_MERGED = """
+CREATE TEMPORARY TABLE configurations_import_merged (
+    id UUID NOT NULL,
+    key VARCHAR(255) NOT NULL,
+    parent_config_id UUID,
+    previous_parent_id UUID,
+    inserted BOOLEAN NOT NULL
+) ON COMMIT DROP
+"""
+
+# Wraps a merge so the written rows are kept for the change log, which is appended
+# separately so the merge itself runs outside the change-log lock; xmax is 0 only
+# for freshly inserted row versions, and the join still sees the rows as they were
+# before the merge, since every part of the statement shares one snapshot
+_STAGE_IMPORT_MERGE = """
+WITH merged AS (
+{merge}
+RETURNING id, key, parent_config_id, xmax = 0 AS inserted
+)
+INSERT INTO configurations_import_merged (id, key, parent_config_id, previous_parent_id, inserted)
+SELECT merged.id, merged.key, merged.parent_config_id, NULLIF(old.parent_config_id, merged.parent_config_id), inserted
+FROM merged LEFT JOIN configurations old ON old.id = merged.id
+"""
+
+_LOG_IMPORT_MERGED = """
+INSERT INTO configuration_change_log (config_id, key, op, parent_config_id, previous_parent_id, changed_at)
+SELECT id, key, CASE WHEN inserted THEN 'create' ELSE 'update' END, parent_config_id, previous_parent_id,
+    timezone('utc', now())
+FROM configurations_import_merged
+"""
+
+
+def _previous_parent(previous_parent_id: UUID | None, parent_config_id: UUID | None) -> UUID | None:
+    """Get the parent a write moved a configuration away from, or None if it did not move."""
+    return previous_parent_id if previous_parent_id != parent_config_id else None
+
+
+def _translation_path(languages: list[str]) -> str:
+    """Build a jsonpath keeping the translations whose language is in ``languages``.
+
+    Tags are validated against ``LANGUAGE_TAG`` (letters, digits and hyphens), so
+    they are safe to embed in the regular expression.
+    """
+    alternatives = "|".join(language for language in languages if LANGUAGE_TAG.match(language))
+    return f'$[*] ? (@.language like_regex "^({alternatives})$" flag "i")'
+
+
+def _json_list(value: Any) -> list:
+    """Decode a JSONB list column, unwrapping rows still stored as a JSON-encoded string.
+
+    Releases before native JSONB wrote such strings; migration 0002 (or
+    scripts/migrate-jsonb-native.sql) converts them in place.
+    """
+    if isinstance(value, str):
+        value = json.loads(value)
+    return value or []
+
+
+def _decode_columns(row: Any) -> dict[str, Any]:
+    """Map a selected row to a dict with its JSONB list columns decoded."""
+    return {name: _json_list(value) if name in JSON_COLUMNS else value for name, value in row._mapping.items()}
+
+
+def _validation_rules_to_json(rules: list[ValidationRule]) -> list[dict]:
+    """Convert validation rules to JSONB column values."""
+    return [{"rule_type": r.rule_type, "value": r.value} for r in rules]
+
+
+def _parent_conditions_to_json(conditions: list[ParentCondition]) -> list[dict]:
+    """Convert parent conditions to JSONB column values."""
+    return [{"operator": c.operator, "value": c.value, "default_value": c.default_value} for c in conditions]
+
+
+def _translations_to_json(translations: list[Translation]) -> list[dict]:
+    """Convert translations to JSONB column values."""
+    return [{"language": t.language, "label": t.label, "description": t.description} for t in translations]
+
 
 class ConfigurationRepository:
     """Repository for Configuration entity."""
 
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, bus: ChangeBus | None = None):
         """Initialize repository."""
         self.session = session
+        self.bus = bus or get_change_bus()
+
+    @property
+    def _dialect_name(self) -> str:
+        """Name of the SQL dialect the session runs on, e.g. ``postgresql`` or ``sqlite``."""
+        return self.session.get_bind().dialect.name
+
+    async def _driver_connection(self) -> Any:
+        """Get the driver's own connection (asyncpg's on PostgreSQL) under the session."""
+        connection = await self.session.connection()
+        raw_connection = await connection.get_raw_connection()
+        driver = raw_connection.driver_connection
+        if driver is None:
+            raise RuntimeError("Session connection has no driver connection")
+        return driver
 
     async def create(self, config: ConfigurationEntity) -> ConfigurationEntity:
         """Create a new configuration."""
@@ -34,24 +233,24 @@ class ConfigurationRepository:
             description=config.description,
             data_type=config.data_type,
             default_value=config.default_value,
-            validation_rules=json.dumps(
-                [{"rule_type": r.rule_type, "value": r.value} for r in config.validation_rules]
-            ),
+            validation_rules=_validation_rules_to_json(config.validation_rules),
             parent_config_id=config.parent_config_id,
-            parent_conditions=json.dumps(
-                [
-                    {"operator": c.operator, "value": c.value, "default_value": c.default_value}
-                    for c in config.parent_conditions
-                ]
-            ),
-            translations=json.dumps(
-                [{"language": t.language, "label": t.label, "description": t.description} for t in config.translations]
-            ),
+            parent_conditions=_parent_conditions_to_json(config.parent_conditions),
+            translations=_translations_to_json(config.translations),
             active=config.active,
         )
         self.session.add(model)
+        await self.session.flush()
+        changes = await self._record_changes(
+            [
+                ConfigurationChange(
+                    op="create", config_id=model.id, key=model.key, parent_config_id=model.parent_config_id
+                )
+            ]
+        )
         await self.session.commit()
         logger.info("Configuration created", key=config.key)
+        await self.bus.publish_many(changes)
         return await self._model_to_domain(model)
 
     async def get_by_id(self, config_id: UUID) -> ConfigurationEntity | None:
@@ -63,6 +262,12 @@ class ConfigurationRepository:
             return await self._model_to_domain(model)
         return None
 
+    async def get_version(self, config_id: UUID) -> datetime | None:
+        """Get a configuration's ``updated_at`` without loading the row."""
+        stmt = select(ConfigurationModel.updated_at).where(ConfigurationModel.id == config_id)
+        result = await self.session.execute(stmt)
+        return result.scalar()
+
     async def get_by_key(self, key: str) -> ConfigurationEntity | None:
         """Get configuration by key."""
         stmt = select(ConfigurationModel).where(ConfigurationModel.key == key)
@@ -72,20 +277,487 @@ class ConfigurationRepository:
             return await self._model_to_domain(model)
         return None
 
-    async def list_all(self, limit: int = 10, offset: int = 0) -> tuple[list[ConfigurationEntity], int]:
-        """List all configurations."""
-        # Get total count
-        count_stmt = select(ConfigurationModel)
-        count_result = await self.session.execute(count_stmt)
-        total = len(count_result.scalars().all())
+    async def bulk_upsert(
+        self,
+        configs: list[ConfigurationEntity],
+        deletes: list[ConfigurationEntity] | None = None,
+        existing_parents: dict[str, UUID | None] | None = None,
+    ) -> list[ConfigurationEntity]:
+        """Insert or update many configurations, and delete others, in one transaction.
+
+        Rows are written with multi-row ``INSERT ... ON CONFLICT (key) DO UPDATE``.
+        ``existing_parents`` maps each key already stored to its current parent, which
+        tells creates from updates and moves for change notifications; when omitted it
+        is looked up with ``WHERE key IN (...)`` queries.
+        """
+        deletes = deletes or []
+        if existing_parents is None:
+            edges = await self.edges_by_key([c.key for c in configs])
+            existing_parents = {key: parent_id for key, (_, parent_id) in edges.items()}
+
+        try:
+            written = await self._upsert_rows(configs)
+            delete_ids = [c.id for c in deletes]
+            deleted = set(delete_ids)
+            children = []
+            for start in range(0, len(delete_ids), BULK_CHUNK_SIZE):
+                chunk = delete_ids[start : start + BULK_CHUNK_SIZE]
+                # Orphaned children become roots, so they are logged as updated as well
+                orphaned = await self.session.execute(
+                    update(ConfigurationModel)
+                    .where(ConfigurationModel.parent_config_id.in_(chunk))
+                    .values(parent_config_id=None, updated_at=datetime.utcnow())
+                    .returning(ConfigurationModel.id, ConfigurationModel.key, ConfigurationModel.parent_config_id)
+                    .execution_options(synchronize_session=False)
+                )
+                children += [
+                    ConfigurationChange(
+                        op="update", config_id=row.id, key=row.key, previous_parent_id=row.parent_config_id
+                    )
+                    for row in orphaned
+                    if row.id not in deleted
+                ]
+                await self.session.execute(delete(ConfigurationModel).where(ConfigurationModel.id.in_(chunk)))
+            changes = await self._record_changes(
+                [
+                    ConfigurationChange(
+                        op="update" if c.key in existing_parents else "create",
+                        config_id=c.id,
+                        key=c.key,
+                        parent_config_id=c.parent_config_id,
+                        previous_parent_id=_previous_parent(existing_parents.get(c.key), c.parent_config_id),
+                    )
+                    for c in written
+                ]
+                + [
+                    ConfigurationChange(op="delete", config_id=c.id, key=c.key, parent_config_id=c.parent_config_id)
+                    for c in deletes
+                ]
+                + children
+            )
+            await self.session.commit()
+        except Exception:
+            await self.session.rollback()
+            raise
+        logger.info("Configurations bulk written", upserted=len(written), deleted=len(deletes))
+
+        await self.bus.publish_many(changes)
+        return written
 
-        # Get paginated results
-        stmt = select(ConfigurationModel).limit(limit).offset(offset)
+    async def import_configurations(
+        self,
+        batches: AsyncIterator[list[ConfigurationEntity]],
+        update_existing: bool = True,
+    ) -> int:
+        """Load batches of configurations, merging them on key; returns rows written.
+
+        On PostgreSQL every batch is streamed with ``COPY`` into a temporary staging
+        table and merged with one ``INSERT ... SELECT ... ON CONFLICT`` in a single
+        transaction. Other dialects upsert batch by batch. Either way one ``reset``
+        change is published instead of a notification per row.
+        """
+        if self._dialect_name == "postgresql":
+            written = await self._copy_import(batches, update_existing)
+        else:
+            written = await self._batched_import(batches, update_existing)
+        logger.info("Configurations imported", written=written)
+        await self.bus.publish(ConfigurationChange.reset())
+        return written
+
+    async def _copy_import(self, batches: AsyncIterator[list[ConfigurationEntity]], update_existing: bool) -> int:
+        """Import through a COPY-loaded staging table (PostgreSQL only)."""
+        try:
+            await self.session.execute(text(_CREATE_IMPORT_STAGING))
+            driver = await self._driver_connection()
+            async for batch in batches:
+                await driver.copy_records_to_table(
+                    "configurations_import",
+                    records=[
+                        (
+                            c.id,
+                            c.key,
+                            c.label,
+                            c.description,
+                            c.data_type,
+                            c.default_value,
+                            c.active,
+                            c.parent_config_id,
+                            json.dumps(_validation_rules_to_json(c.validation_rules)),
+                            json.dumps(_parent_conditions_to_json(c.parent_conditions)),
+                            json.dumps(_translations_to_json(c.translations)),
+                        )
+                        for c in batch
+                    ],
+                    columns=_IMPORT_COLUMNS,
+                )
+            merge = _MERGE_IMPORT_UPDATE if update_existing else _MERGE_IMPORT_SKIP
+            await self.session.execute(text(_CREATE_IMPORT_MERGED))
+            result = typing_cast(
+                CursorResult[Any], await self.session.execute(text(_STAGE_IMPORT_MERGE.format(merge=merge)))
+            )
+            await self._lock_change_log()
+            await self.session.execute(text(_LOG_IMPORT_MERGED))
+            await self.bus.stage(self.session, [ConfigurationChange.reset()])
+            await self.session.commit()
+        except Exception:
+            await self.session.rollback()
+            raise
+        return result.rowcount
+
+    async def _batched_import(self, batches: AsyncIterator[list[ConfigurationEntity]], update_existing: bool) -> int:
+        """Import with one multi-row upsert per batch."""
+        written = 0
+        async for batch in batches:
+            # Later records win over earlier ones with the same key
+            configs = list({c.key: c for c in batch}.values())
+            taken = {
+                key: parent_id for key, (_, parent_id) in (await self.edges_by_key([c.key for c in configs])).items()
+            }
+            if not update_existing:
+                configs = [c for c in configs if c.key not in taken]
+            try:
+                rows = await self._upsert_rows(configs)
+                await self._record_changes(
+                    [
+                        ConfigurationChange(
+                            op="update" if c.key in taken else "create",
+                            config_id=c.id,
+                            key=c.key,
+                            parent_config_id=c.parent_config_id,
+                            previous_parent_id=_previous_parent(taken.get(c.key), c.parent_config_id),
+                        )
+                        for c in rows
+                    ]
+                )
+                await self.session.commit()
+                written += len(rows)
+            except Exception:
+                await self.session.rollback()
+                raise
+        return written
+
+    async def _upsert_rows(self, configs: list[ConfigurationEntity]) -> list[ConfigurationEntity]:
+        """Execute chunked ``INSERT ... ON CONFLICT (key) DO UPDATE`` without committing."""
+        now = datetime.utcnow()
+        rows = [
+            {
+                "id": c.id,
+                "key": c.key,
+                "label": c.label,
+                "description": c.description,
+                "data_type": c.data_type,
+                "default_value": c.default_value,
+                "validation_rules": _validation_rules_to_json(c.validation_rules),
+                "parent_config_id": c.parent_config_id,
+                "parent_conditions": _parent_conditions_to_json(c.parent_conditions),
+                "translations": _translations_to_json(c.translations),
+                "active": c.active,
+                "created_at": c.created_at,
+                "updated_at": now,
+            }
+            for c in configs
+        ]
+
+        dialect_insert = postgresql_insert if self._dialect_name == "postgresql" else sqlite_insert
+        ids_by_key: dict[str, UUID] = {}
+        for start in range(0, len(rows), BULK_CHUNK_SIZE):
+            values = dialect_insert(ConfigurationModel).values(rows[start : start + BULK_CHUNK_SIZE])
+            stmt = values.on_conflict_do_update(
+                index_elements=[ConfigurationModel.key],
+                set_={column: values.excluded[column] for column in UPSERT_COLUMNS},
+            ).returning(ConfigurationModel.id, ConfigurationModel.key)
+            result = await self.session.execute(stmt)
+            ids_by_key.update((row.key, row.id) for row in result)
+
+        return [c.model_copy(update={"id": ids_by_key.get(c.key, c.id), "updated_at": now}) for c in configs]
+
+    async def edges_by_key(self, keys: list[str]) -> dict[str, tuple[UUID, UUID | None]]:
+        """Map those of ``keys`` that exist to their ``(id, parent_config_id)``, one query per chunk."""
+        found: dict[str, tuple[UUID, UUID | None]] = {}
+        for start in range(0, len(keys), BULK_CHUNK_SIZE):
+            chunk = keys[start : start + BULK_CHUNK_SIZE]
+            stmt = select(ConfigurationModel.key, ConfigurationModel.id, ConfigurationModel.parent_config_id).where(
+                ConfigurationModel.key.in_(chunk)
+            )
+            found.update((row.key, (row.id, row.parent_config_id)) for row in await self.session.execute(stmt))
+        return found
+
+    async def keys_by_id(self, config_ids: list[UUID]) -> dict[UUID, str]:
+        """Map those of ``config_ids`` that exist to their keys, one query per chunk."""
+        found: dict[UUID, str] = {}
+        for start in range(0, len(config_ids), BULK_CHUNK_SIZE):
+            chunk = config_ids[start : start + BULK_CHUNK_SIZE]
+            stmt = select(ConfigurationModel.id, ConfigurationModel.key).where(ConfigurationModel.id.in_(chunk))
+            found.update((row.id, row.key) for row in await self.session.execute(stmt))
+        return found
+
+    async def existing_ids(self, config_ids: list[UUID]) -> set[UUID]:
+        """Get which of ``config_ids`` exist without loading the rows."""
+        if not config_ids:
+            return set()
+        result = await self.session.execute(select(ConfigurationModel.id).where(ConfigurationModel.id.in_(config_ids)))
+        return set(result.scalars())
+
+    async def get_by_ids(self, config_ids: list[UUID]) -> list[ConfigurationEntity]:
+        """Get every configuration whose ID is in ``config_ids`` with one query."""
+        if not config_ids:
+            return []
+        stmt = select(ConfigurationModel).where(ConfigurationModel.id.in_(config_ids))
+        result = await self.session.execute(stmt)
+        return [await self._model_to_domain(model) for model in result.scalars().all()]
+
+    async def get_by_keys(self, keys: list[str]) -> list[ConfigurationEntity]:
+        """Get every configuration whose key is in ``keys`` with one query."""
+        if not keys:
+            return []
+        stmt = select(ConfigurationModel).where(ConfigurationModel.key.in_(keys))
+        result = await self.session.execute(stmt)
+        return [await self._model_to_domain(model) for model in result.scalars().all()]
+
+    async def list_page(
+        self,
+        limit: int = 10,
+        offset: int = 0,
+        cursor: str | None = None,
+    ) -> tuple[list[ConfigurationEntity], str | None]:
+        """List one page of configurations ordered by (key, id).
+
+        When a cursor is given the page starts right after the encoded position and
+        the offset is ignored, so deep pages cost the same as the first one.
+        """
+        return await self._paginate(select(ConfigurationModel), limit=limit, offset=offset, cursor=cursor)
+
+    async def list_page_versions(
+        self,
+        limit: int = 10,
+        offset: int = 0,
+        cursor: str | None = None,
+    ) -> tuple[list[tuple[UUID, datetime]], str | None]:
+        """List one page of ``(id, updated_at)`` pairs in (key, id) order without loading rows."""
+        stmt = select(ConfigurationModel.id, ConfigurationModel.key, ConfigurationModel.updated_at)
+        result = await self.session.execute(self._keyset_page(stmt, limit, offset, cursor))
+        rows, next_cursor = self._trim_page(list(result.all()), limit)
+        return [(row.id, row.updated_at) for row in rows], next_cursor
+
+    async def list_page_columns(
+        self,
+        columns: Sequence[str],
+        limit: int = 10,
+        offset: int = 0,
+        cursor: str | None = None,
+        languages: list[str] | None = None,
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        """List one page in (key, id) order selecting only ``columns`` (plus key and id).
+
+        Columns that are not asked for, JSONB ones included, are never read. With
+        ``languages``, PostgreSQL returns only the translations in that chain.
+        """
+        stmt = select(*self._columns(columns, languages))
+        result = await self.session.execute(self._keyset_page(stmt, limit, offset, cursor))
+        rows, next_cursor = self._trim_page(list(result.all()), limit)
+        return [_decode_columns(row) for row in rows], next_cursor
+
+    async def get_columns(
+        self,
+        config_id: UUID,
+        columns: Sequence[str],
+        languages: list[str] | None = None,
+    ) -> dict[str, Any] | None:
+        """Get only ``columns`` (plus key and id) of one configuration."""
+        stmt = select(*self._columns(columns, languages)).where(ConfigurationModel.id == config_id)
+        row = (await self.session.execute(stmt)).first()
+        return _decode_columns(row) if row else None
+
+    def _columns(self, names: Sequence[str], languages: list[str] | None = None) -> list:
+        """Map column names to model attributes, always including the keyset columns."""
+        columns = []
+        for name in dict.fromkeys(["id", "key", *names]):
+            column = getattr(ConfigurationModel, name)
+            if name == "translations" and languages and self._dialect_name == "postgresql":
+                column = func.jsonb_path_query_array(
+                    column, cast(_translation_path(languages), JSONPATH), type_=JSONB
+                ).label(name)
+            columns.append(column)
+        return columns
+
+    async def list_parent_options(
+        self,
+        exclude_id: UUID | None = None,
+        limit: int = 100,
+        cursor: str | None = None,
+    ) -> tuple[list[ConfigurationEntity], int, str | None]:
+        """List configurations that may become the parent of ``exclude_id``.
+
+        The configuration itself and its whole subtree are excluded by a recursive CTE
+        walking ``parent_config_id``, which both PostgreSQL and SQLite evaluate in the
+        database.
+        """
+        stmt = select(ConfigurationModel)
+        count_stmt = select(func.count()).select_from(ConfigurationModel)
+        if exclude_id:
+            subtree = self._subtree_ids(exclude_id)
+            stmt = stmt.where(ConfigurationModel.id.not_in(select(subtree.c.id)))
+            count_stmt = count_stmt.where(ConfigurationModel.id.not_in(select(subtree.c.id)))
+
+        configs, next_cursor = await self._paginate(stmt, limit=limit, cursor=cursor)
+        total = (await self.session.execute(count_stmt)).scalar_one()
+        return configs, int(total), next_cursor
+
+    async def list_edges(self) -> list[tuple[UUID, UUID | None]]:
+        """Get every ``(id, parent_config_id)`` pair without loading full rows."""
+        result = await self.session.execute(select(ConfigurationModel.id, ConfigurationModel.parent_config_id))
+        return [(row.id, row.parent_config_id) for row in result]
+
+    async def is_in_subtree(self, root_id: UUID, config_id: UUID) -> bool:
+        """Check whether ``config_id`` is ``root_id`` or one of its descendants."""
+        subtree = self._subtree_ids(root_id)
+        stmt = select(subtree.c.id).where(subtree.c.id == config_id).limit(1)
         result = await self.session.execute(stmt)
-        models = result.scalars().all()
+        return result.first() is not None
 
+    def _subtree_ids(self, root_id: UUID):
+        """Build a recursive CTE of ``root_id`` and all of its descendants' IDs."""
+        subtree = select(ConfigurationModel.id).where(ConfigurationModel.id == root_id).cte("subtree", recursive=True)
+        # UNION (not UNION ALL) terminates even if bad data contains a cycle
+        return subtree.union(
+            select(ConfigurationModel.id).join(subtree, ConfigurationModel.parent_config_id == subtree.c.id)
+        )
+
+    async def _paginate(
+        self,
+        stmt,
+        limit: int,
+        offset: int = 0,
+        cursor: str | None = None,
+    ) -> tuple[list[ConfigurationEntity], str | None]:
+        """Apply (key, id) keyset or offset pagination to a configuration query."""
+        result = await self.session.execute(self._keyset_page(stmt, limit, offset, cursor))
+        models, next_cursor = self._trim_page(list(result.scalars().all()), limit)
         configs = [await self._model_to_domain(model) for model in models]
-        return configs, total
+        return configs, next_cursor
+
+    def _keyset_page(self, stmt, limit: int, offset: int = 0, cursor: str | None = None):
+        """Order a query by (key, id) and restrict it to one page plus one row."""
+        stmt = stmt.order_by(ConfigurationModel.key, ConfigurationModel.id)
+        if cursor:
+            after_key, after_id = decode_cursor(cursor)
+            after = tuple_(
+                literal(after_key, ConfigurationModel.key.type), literal(after_id, ConfigurationModel.id.type)
+            )
+            stmt = stmt.where(tuple_(ConfigurationModel.key, ConfigurationModel.id) > after)
+        elif offset:
+            stmt = stmt.offset(offset)
+        # Fetch one extra row to know whether another page exists
+        return stmt.limit(limit + 1)
+
+    @staticmethod
+    def _trim_page(rows: list, limit: int) -> tuple[list, str | None]:
+        """Drop the look-ahead row and build the cursor for the next page, if any."""
+        if len(rows) <= limit:
+            return rows, None
+        rows = rows[:limit]
+        return rows, encode_cursor(rows[-1].key, rows[-1].id)
+
+    async def stream_all(self, batch_size: int = 1000) -> AsyncIterator[ConfigurationEntity]:
+        """Yield every configuration in key order through a server-side cursor.
+
+        Rows are fetched ``batch_size`` at a time, so memory stays flat however
+        large the table is.
+        """
+        stmt = (
+            select(ConfigurationModel)
+            .order_by(ConfigurationModel.key, ConfigurationModel.id)
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self.session.stream_scalars(stmt)
+        async for model in result:
+            yield await self._model_to_domain(model)
+
+    async def store_version(self) -> str:
+        """Get a token that changes whenever any configuration is written or deleted."""
+        return str(await self.current_revision())
+
+    async def current_revision(self) -> int:
+        """Get the latest change-log revision, or 0 for an empty log."""
+        result = await self.session.execute(select(func.max(ChangeLogModel.revision)))
+        return int(result.scalar() or 0)
+
+    async def list_changes(self, since: int = 0, limit: int = 1000) -> list[ConfigurationChange]:
+        """Get change-log entries with a revision above ``since``, oldest first."""
+        stmt = (
+            select(ChangeLogModel).where(ChangeLogModel.revision > since).order_by(ChangeLogModel.revision).limit(limit)
+        )
+        result = await self.session.execute(stmt)
+        return [
+            ConfigurationChange(
+                # Only create, update, and delete are ever logged
+                op=typing_cast(ChangeOperation, entry.op),
+                config_id=entry.config_id,
+                key=entry.key,
+                parent_config_id=entry.parent_config_id,
+                previous_parent_id=entry.previous_parent_id,
+                revision=entry.revision,
+            )
+            for entry in result.scalars()
+        ]
+
+    async def _record_changes(self, changes: list[ConfigurationChange]) -> list[ConfigurationChange]:
+        """Append changes to the change log inside the current transaction.
+
+        The changes are staged for other workers in the same transaction. Returns them
+        stamped with the revisions they were recorded under.
+        """
+        if not changes:
+            return []
+        await self._lock_change_log()
+        now = datetime.utcnow()
+        rows = [
+            {
+                "changed_at": now,
+                "config_id": c.config_id,
+                "key": c.key,
+                "op": c.op,
+                "parent_config_id": c.parent_config_id,
+                "previous_parent_id": c.previous_parent_id,
+            }
+            for c in changes
+        ]
+        stmt = insert(ChangeLogModel).returning(ChangeLogModel.revision, sort_by_parameter_order=True)
+        result = await self.session.execute(stmt, rows)
+        recorded = [dataclasses.replace(c, revision=revision) for c, revision in zip(changes, result.scalars())]
+        await self.bus.stage(self.session, recorded)
+        return recorded
+
+    async def _lock_change_log(self) -> None:
+        """Serialize change-log writers until commit (PostgreSQL only).
+
+        Revisions come from a sequence, which hands them out in call order, not commit
+        order; without the lock a reader could pass a revision whose transaction has
+        not committed yet and never see it. Callers take the lock right before the
+        change-log insert, after their own writes, so it covers only the insert,
+        ``pg_notify``, and commit. Write throughput is therefore bounded by commit
+        latency across the whole store.
+        """
+        if self._dialect_name == "postgresql":
+            await self.session.execute(select(func.pg_advisory_xact_lock(CHANGE_LOG_LOCK_ID)))
+
+    async def count_all(self, estimated: bool = False) -> int:
+        """Count configurations.
+
+        With ``estimated`` the PostgreSQL planner statistics are used instead of a full
+        count; other dialects, and tables that were never analyzed, fall back to COUNT(*).
+        """
+        if estimated and self._dialect_name == "postgresql":
+            result = await self.session.execute(
+                text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table)"),
+                {"table": ConfigurationModel.__tablename__},
+            )
+            estimate = result.scalar()
+            if estimate is not None and estimate >= 0:
+                return int(estimate)
+
+        result = await self.session.execute(select(func.count()).select_from(ConfigurationModel))
+        return int(result.scalar_one())
 
     async def update(self, config_id: UUID, updates: dict) -> ConfigurationEntity | None:
         """Update a configuration."""
@@ -96,21 +768,31 @@ class ConfigurationRepository:
         if not model:
             return None
 
+        previous_parent_id = model.parent_config_id
         for key, value in updates.items():
             if key == "validation_rules" and value is not None:
-                value = json.dumps([{"rule_type": r.rule_type, "value": r.value} for r in value])
+                value = _validation_rules_to_json(value)
             elif key == "parent_conditions" and value is not None:
-                value = json.dumps(
-                    [{"operator": c.operator, "value": c.value, "default_value": c.default_value} for c in value]
-                )
+                value = _parent_conditions_to_json(value)
             elif key == "translations" and value is not None:
-                value = json.dumps(
-                    [{"language": t.language, "label": t.label, "description": t.description} for t in value]
-                )
+                value = _translations_to_json(value)
             setattr(model, key, value)
 
+        await self.session.flush()
+        changes = await self._record_changes(
+            [
+                ConfigurationChange(
+                    op="update",
+                    config_id=model.id,
+                    key=model.key,
+                    parent_config_id=model.parent_config_id,
+                    previous_parent_id=_previous_parent(previous_parent_id, model.parent_config_id),
+                )
+            ]
+        )
         await self.session.commit()
         logger.info("Configuration updated", config_id=str(config_id))
+        await self.bus.publish_many(changes)
         return await self._model_to_domain(model)
 
     async def delete(self, config_id: UUID) -> bool:
@@ -122,28 +804,37 @@ class ConfigurationRepository:
         if not model:
             return False
 
+        # Orphaned children become roots, so they are logged as updated as well
+        orphaned = await self.session.execute(
+            update(ConfigurationModel)
+            .where(ConfigurationModel.parent_config_id == config_id)
+            .values(parent_config_id=None, updated_at=datetime.utcnow())
+            .returning(ConfigurationModel.id, ConfigurationModel.key)
+            .execution_options(synchronize_session=False)
+        )
+        children = [
+            ConfigurationChange(op="update", config_id=row.id, key=row.key, previous_parent_id=config_id)
+            for row in orphaned
+        ]
         await self.session.delete(model)
+        changes = await self._record_changes(
+            [
+                ConfigurationChange(
+                    op="delete", config_id=model.id, key=model.key, parent_config_id=model.parent_config_id
+                )
+            ]
+            + children
+        )
         await self.session.commit()
         logger.info("Configuration deleted", config_id=str(config_id))
+        await self.bus.publish_many(changes)
         return True
 
     async def _model_to_domain(self, model: ConfigurationModel) -> ConfigurationEntity:
-        """Convert database model to domain entity."""
-        validation_rules = []
-        if model.validation_rules:
-            rules_data = json.loads(model.validation_rules)
-            validation_rules = [ValidationRule(**r) for r in rules_data]
-
-        parent_conditions = []
-        if model.parent_conditions:
-            conditions_data = json.loads(model.parent_conditions)
-            parent_conditions = [ParentCondition(**c) for c in conditions_data]
-
-        translations = []
-        if model.translations:
-            translations_data = json.loads(model.translations)
-            translations = [Translation(**t) for t in translations_data]
+        """Convert database model to domain entity.
 
+        JSONB columns arrive already decoded as lists of dicts, except in legacy rows.
+        """
         return ConfigurationEntity(
             id=model.id,
             key=model.key,
@@ -151,10 +842,10 @@ class ConfigurationRepository:
             description=model.description,
             data_type=model.data_type,
             default_value=model.default_value,
-            validation_rules=validation_rules,
+            validation_rules=[ValidationRule(**r) for r in _json_list(model.validation_rules)],
             parent_config_id=model.parent_config_id,
-            parent_conditions=parent_conditions,
-            translations=translations,
+            parent_conditions=[ParentCondition(**c) for c in _json_list(model.parent_conditions)],
+            translations=[Translation(**t) for t in _json_list(model.translations)],
             active=model.active,
             created_at=model.created_at,
             updated_at=model.updated_at,
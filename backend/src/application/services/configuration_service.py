@@ -1,23 +1,76 @@
 """Service layer for Configuration business logic."""
 
 import uuid
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime
+from typing import Any
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.domain.entities.configuration import Configuration, ParentCondition, Translation, ValidationRule
+from src.domain.conditions import CompiledConditions
+from src.domain.entities.configuration import (
+    BulkOperation,
+    BulkOperationResult,
+    Configuration,
+    ConfigurationChangeEntry,
+    ParentCondition,
+    ResolvedValue,
+    Translation,
+    ValidationRule,
+)
+from src.domain.validation import CompiledValidator
+from src.application.repositories.cached_configuration_repository import CachedConfigurationRepository
 from src.application.repositories.configuration_repository import ConfigurationRepository
+from src.configs import get_settings
+from src.infrastructure.cache import (
+    ConfigurationGraph,
+    LRUTTLCache,
+    get_configuration_cache,
+    get_configuration_graph,
+)
+from src.infrastructure.notifications import (
+    ChangeFilter,
+    ConfigurationChange,
+    WatchSubscription,
+    get_change_broadcaster,
+)
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Most change-log entries replayed to a reconnecting watcher before it is told to resync
+WATCH_REPLAY_LIMIT = 10_000
+
+# Compiled conditions keyed by (config id, updated_at, parent data type); a write bumps
+# updated_at, so stale entries are never hit and simply age out.
+_compiled_conditions: LRUTTLCache[tuple, CompiledConditions] = LRUTTLCache(max_size=50_000, ttl_seconds=3600)
+
+# Compiled validation rules keyed by (config id, updated_at), invalidated the same way
+_compiled_validators: LRUTTLCache[tuple, CompiledValidator] = LRUTTLCache(max_size=50_000, ttl_seconds=3600)
+
+# Fields a bulk operation may not set directly
+_READ_ONLY_FIELDS = frozenset({"created_at", "id", "key", "updated_at"})
+
 
 class ConfigurationService:
     """Service for configuration operations."""
 
     def __init__(self, session: AsyncSession):
-        """Initialize service."""
-        self.repository = ConfigurationRepository(session)
+        """Initialize service.
+
+        On a replica session (see ``ReplicaSet``) process-wide caches are read but
+        never filled, since a lagging replica would cache rows already invalidated.
+        """
+        self.on_replica = bool(session.info.get("replica"))
+        # The cached repository subclasses the plain one, so callers only rely on the base API
+        self.repository: ConfigurationRepository
+        if get_settings().cache_enabled:
+            self.repository = CachedConfigurationRepository(
+                session, get_configuration_cache(), write_back=not self.on_replica
+            )
+        else:
+            self.repository = ConfigurationRepository(session)
 
     async def create_configuration(
         self,
@@ -38,6 +91,7 @@ class ConfigurationService:
         existing = await self.repository.get_by_key(key)
         if existing:
             raise ValueError(f"Configuration with key '{key}' already exists")
+        _check_default_value(CompiledValidator(validation_rules or [], data_type), default_value)
 
         config = Configuration(
             id=uuid.uuid4(),
@@ -55,15 +109,424 @@ class ConfigurationService:
 
         return await self.repository.create(config)
 
+    async def bulk_apply(
+        self,
+        operations: list[BulkOperation],
+        atomic: bool = True,
+    ) -> tuple[list[BulkOperationResult], bool]:
+        """Validate a batch of operations together and write them in one transaction.
+
+        Existing keys and parents are looked up with one query each rather than per
+        item. With ``atomic`` a single invalid operation rejects the whole batch;
+        otherwise only the valid operations are written. Returns per-item results and
+        whether anything was committed.
+        """
+        logger.info("Applying bulk operations", count=len(operations), atomic=atomic)
+        existing = {c.key: c for c in await self.repository.get_by_keys(list({op.key for op in operations}))}
+
+        parent_ids = {
+            op.fields["parent_config_id"] for op in operations if op.fields.get("parent_config_id") is not None
+        }
+        known_ids = {c.id for c in existing.values()}
+        known_ids |= await self.repository.existing_ids(list(parent_ids - known_ids))
+        graph = await self.get_graph()
+        moved: dict[UUID, UUID | None] = {}
+
+        results: list[BulkOperationResult] = []
+        planned: list[tuple[BulkOperation, Configuration]] = []
+        seen: set[str] = set()
+        for index, op in enumerate(operations):
+            try:
+                if op.key in seen:
+                    raise ValueError("Duplicate key in batch")
+                seen.add(op.key)
+                config = await self._plan_bulk_operation(op, existing.get(op.key), known_ids, graph, moved)
+                if op.op == "delete":
+                    known_ids.discard(config.id)
+                planned.append((op, config))
+                results.append(BulkOperationResult(index=index, key=op.key, id=config.id, status="skipped"))
+            except ValueError as e:
+                results.append(BulkOperationResult(index=index, key=op.key, status="error", error=str(e)))
+
+        if atomic and len(planned) < len(operations):
+            return results, False
+
+        upserts = [config for op, config in planned if op.op != "delete"]
+        deletes = [config for op, config in planned if op.op == "delete"]
+        parents = {key: config.parent_config_id for key, config in existing.items()}
+        written = {c.key: c for c in await self.repository.bulk_upsert(upserts, deletes, existing_parents=parents)}
+        for result in results:
+            if result.status != "skipped":
+                continue
+            op = operations[result.index]
+            if op.op == "delete":
+                result.status = "deleted"
+            else:
+                result.id = written[op.key].id
+                result.status = "updated" if op.key in existing else "created"
+        return results, True
+
+    async def _plan_bulk_operation(
+        self,
+        op: BulkOperation,
+        current: Configuration | None,
+        known_ids: set[UUID],
+        graph: ConfigurationGraph | None,
+        moved: dict[UUID, UUID | None],
+    ) -> Configuration:
+        """Validate one bulk operation and build the configuration it writes or deletes."""
+        if op.op == "delete":
+            if current is None:
+                raise ValueError("Configuration not found")
+            return current
+        if op.op == "create" and current is not None:
+            raise ValueError(f"Configuration with key '{op.key}' already exists")
+        if op.op == "update" and current is None:
+            raise ValueError("Configuration not found")
+
+        fields = {name: value for name, value in op.fields.items() if name not in _READ_ONLY_FIELDS}
+        parent_id = fields.get("parent_config_id")
+        if parent_id is not None:
+            if parent_id not in known_ids:
+                raise ValueError("Parent configuration not found")
+            if current is not None and await self._bulk_cycle(current.id, parent_id, graph, moved):
+                raise ValueError("A configuration cannot be its own ancestor")
+
+        if current is None:
+            missing = [name for name in ("label", "data_type") if not fields.get(name)]
+            if missing:
+                raise ValueError(f"Missing required fields: {', '.join(missing)}")
+            config = Configuration(id=uuid.uuid4(), key=op.key, **fields)
+        else:
+            config = current.model_copy(update=fields)
+        if fields.keys() & {"data_type", "default_value", "validation_rules"}:
+            _check_default_value(CompiledValidator(config.validation_rules, config.data_type), config.default_value)
+        if "parent_config_id" in fields:
+            moved[config.id] = config.parent_config_id
+        return config
+
+    async def _bulk_cycle(
+        self,
+        config_id: UUID,
+        parent_id: UUID,
+        graph: ConfigurationGraph | None,
+        moved: dict[UUID, UUID | None],
+    ) -> bool:
+        """Check for a cycle, taking parents moved earlier in the same batch into account."""
+        if graph is None:
+            return await self.repository.is_in_subtree(config_id, parent_id)
+        node: UUID | None = parent_id
+        seen: set[UUID] = set()
+        while node is not None and node not in seen:
+            if node == config_id:
+                return True
+            seen.add(node)
+            node = moved[node] if node in moved else graph.parent_of(node)
+        return False
+
     async def get_configuration(self, config_id: UUID) -> Configuration | None:
         """Get configuration by ID."""
         logger.info("Getting configuration", config_id=str(config_id))
         return await self.repository.get_by_id(config_id)
 
-    async def list_configurations(self, limit: int = 10, offset: int = 0) -> tuple[list[Configuration], int]:
-        """List all configurations with pagination."""
-        logger.info("Listing configurations", limit=limit, offset=offset)
-        return await self.repository.list_all(limit=limit, offset=offset)
+    async def get_configuration_version(self, config_id: UUID) -> datetime | None:
+        """Get the last update time of a configuration, or None if it does not exist."""
+        return await self.repository.get_version(config_id)
+
+    async def get_store_version(self) -> str:
+        """Get a token that changes whenever any configuration changes."""
+        return await self.repository.store_version()
+
+    async def watch(
+        self,
+        key_prefix: str | None = None,
+        root_id: UUID | None = None,
+        since: int | None = None,
+    ) -> tuple[WatchSubscription, list[ConfigurationChange]]:
+        """Subscribe to live changes, optionally replaying the log after ``since``.
+
+        The subscription is registered before the replay is read so nothing committed
+        in between is lost; callers skip live changes already covered by the replay.
+        """
+        if root_id is not None:
+            await self.get_graph()
+        matches = self.watch_filter(key_prefix=key_prefix, root_id=root_id)
+        subscription = get_change_broadcaster().subscribe(matches)
+        replay: list[ConfigurationChange] = []
+        if since is not None:
+            try:
+                log = await self.repository.list_changes(since=since, limit=WATCH_REPLAY_LIMIT + 1)
+            except Exception:
+                get_change_broadcaster().unsubscribe(subscription)
+                raise
+            if len(log) > WATCH_REPLAY_LIMIT:
+                # Too far behind to replay; the client resyncs through the change feed
+                replay = [ConfigurationChange.reset()]
+            else:
+                replay = [c for c in log if matches(c)]
+        return subscription, replay
+
+    def watch_filter(self, key_prefix: str | None = None, root_id: UUID | None = None) -> ChangeFilter:
+        """Build a filter accepting changes under a key prefix and/or a subtree root.
+
+        A change matches a subtree when the configuration is in it before or after the
+        write, so watchers also hear about nodes moved or orphaned out of it. Subtree
+        membership is checked against the in-memory graph; while it is not loaded only
+        the root and its direct children match.
+        """
+        # Deleted nodes are gone from the graph by the time the children they orphan are seen
+        removed: set[UUID] = set()
+
+        def in_subtree(parent_id: UUID | None) -> bool:
+            if parent_id is None:
+                return False
+            if parent_id == root_id or parent_id in removed:
+                return True
+            graph = get_configuration_graph()
+            return graph.loaded and root_id in graph.ancestors(parent_id)
+
+        def matches(change: ConfigurationChange) -> bool:
+            if change.op == "reset":
+                return True
+            if root_id is not None and change.config_id != root_id:
+                if not (in_subtree(change.parent_config_id) or in_subtree(change.previous_parent_id)):
+                    return False
+                if change.op == "delete" and change.config_id is not None:
+                    removed.add(change.config_id)
+            return not key_prefix or (change.key or "").startswith(key_prefix)
+
+        return matches
+
+    async def get_changes(self, since: int = 0, limit: int = 1000) -> tuple[list[ConfigurationChangeEntry], int, bool]:
+        """Get what changed after revision ``since``.
+
+        Returns the latest change per configuration among the next ``limit`` log
+        entries, the revision to continue from, and whether more entries follow.
+        Current state is loaded with one query, so a page costs O(changes).
+        """
+        log = await self.repository.list_changes(since=since, limit=limit + 1)
+        has_more = len(log) > limit
+        log = log[:limit]
+
+        # Each logged change writes one configuration; resets are only broadcast, never logged
+        latest = {change.config_id: change for change in log if change.config_id is not None}
+        current = {
+            config.id: config
+            for config in await self.repository.get_by_ids(
+                [config_id for config_id, change in latest.items() if change.op != "delete"]
+            )
+        }
+
+        entries = []
+        for change in sorted(latest.values(), key=lambda c: c.revision or 0):
+            if change.op == "reset" or change.config_id is None or change.key is None or change.revision is None:
+                continue
+            config = current.get(change.config_id)
+            entries.append(
+                ConfigurationChangeEntry(
+                    configuration=config,
+                    config_id=change.config_id,
+                    key=change.key,
+                    # Deleted by a change beyond this page
+                    op=change.op if config is not None or change.op == "delete" else "delete",
+                    revision=change.revision,
+                )
+            )
+        last_revision = log[-1].revision if log else None
+        revision = last_revision if last_revision is not None else since
+        return entries, revision, has_more
+
+    async def list_configurations(
+        self,
+        limit: int = 10,
+        offset: int = 0,
+        cursor: str | None = None,
+        estimate_total: bool = False,
+    ) -> tuple[list[Configuration], int, str | None]:
+        """List configurations with offset or keyset (cursor) pagination."""
+        logger.info("Listing configurations", limit=limit, offset=offset, cursor=bool(cursor))
+        configs, next_cursor = await self.repository.list_page(limit=limit, offset=offset, cursor=cursor)
+        total = await self.repository.count_all(estimated=estimate_total)
+        return configs, total, next_cursor
+
+    async def list_configuration_versions(
+        self,
+        limit: int = 10,
+        offset: int = 0,
+        cursor: str | None = None,
+        estimate_total: bool = False,
+    ) -> tuple[list[tuple[UUID, datetime]], int, str | None]:
+        """List one page as ``(id, updated_at)`` pairs, for callers with their own snapshots."""
+        logger.info("Listing configuration versions", limit=limit, offset=offset, cursor=bool(cursor))
+        versions, next_cursor = await self.repository.list_page_versions(limit=limit, offset=offset, cursor=cursor)
+        total = await self.repository.count_all(estimated=estimate_total)
+        return versions, total, next_cursor
+
+    async def list_configuration_fields(
+        self,
+        fields: Sequence[str],
+        limit: int = 10,
+        offset: int = 0,
+        cursor: str | None = None,
+        estimate_total: bool = False,
+        languages: list[str] | None = None,
+    ) -> tuple[list[dict[str, Any]], int, str | None]:
+        """List one page reading only the given columns, and translations in ``languages``."""
+        logger.info("Listing configuration fields", fields=list(fields), limit=limit, cursor=bool(cursor))
+        rows, next_cursor = await self.repository.list_page_columns(
+            fields, limit=limit, offset=offset, cursor=cursor, languages=languages
+        )
+        total = await self.repository.count_all(estimated=estimate_total)
+        return rows, total, next_cursor
+
+    async def get_configuration_fields(
+        self,
+        config_id: UUID,
+        fields: Sequence[str],
+        languages: list[str] | None = None,
+    ) -> dict[str, Any] | None:
+        """Get only the given columns of a configuration, and translations in ``languages``."""
+        return await self.repository.get_columns(config_id, fields, languages=languages)
+
+    async def batch_get(
+        self,
+        ids: list[UUID],
+        keys: list[str],
+    ) -> tuple[dict[UUID, Configuration], dict[str, Configuration]]:
+        """Get configurations by ID and by key, with at most one query for each.
+
+        Returns the found configurations indexed by ID and by key; anything missing
+        from those maps does not exist.
+        """
+        logger.info("Batch getting configurations", ids=len(ids), keys=len(keys))
+        by_id = {config.id: config for config in await self.repository.get_by_ids(list(dict.fromkeys(ids)))}
+        by_key = {config.key: config for config in await self.repository.get_by_keys(list(dict.fromkeys(keys)))}
+        return by_id, by_key
+
+    async def get_configurations(self, config_ids: list[UUID]) -> list[Configuration]:
+        """Get configurations by ID, in no particular order; missing IDs are skipped."""
+        return await self.repository.get_by_ids(config_ids)
+
+    def export_configurations(self, batch_size: int = 1000) -> AsyncIterator[Configuration]:
+        """Stream every configuration in key order."""
+        logger.info("Exporting configurations")
+        return self.repository.stream_all(batch_size=batch_size)
+
+    async def import_configurations(
+        self,
+        records: AsyncIterator[tuple[int, Configuration]],
+        update_existing: bool = True,
+        batch_size: int = 5000,
+    ) -> tuple[int, list[tuple[int, str]]]:
+        """Import ``(line, configuration)`` records, merging on key.
+
+        Each record gets the checks create and update apply before anything is written;
+        records whose parent comes later in the stream wait for it. Returns the rows
+        written and the ``(line, error)`` of every rejected record.
+        """
+        logger.info("Importing configurations", update_existing=update_existing)
+        graph = await self.get_graph()
+        rejected: list[tuple[int, str]] = []
+        live_edges: dict[str, tuple[UUID, UUID | None]] = {}
+        live_keys: dict[UUID, str] = {}
+        # IDs taken by keys seen in this import, and what each imported ID is stored under
+        ids_by_key: dict[str, UUID] = {}
+        keys_by_id: dict[UUID, str] = {}
+        resolved: dict[UUID, UUID] = {}
+        moved: dict[UUID, UUID | None] = {}
+        waiting: dict[UUID, list[tuple[int, Configuration]]] = {}
+        ready: list[list[Configuration]] = [[]]
+        ready_keys: set[str] = set()
+
+        def stored_id(config: Configuration) -> UUID | None:
+            """Get the ID a record's key is already stored under, if any."""
+            if config.key in ids_by_key:
+                return ids_by_key[config.key]
+            live = live_edges.get(config.key)
+            return live[0] if live else None
+
+        async def check(config: Configuration) -> Configuration:
+            """Validate one record and point it at the rows it will be stored as."""
+            config_id = stored_id(config)
+            live = live_edges.get(config.key)
+            if config_id is None:
+                config_id = config.id
+                owner = keys_by_id.get(config_id) or live_keys.get(config_id)
+                if owner is not None and owner != config.key:
+                    raise ValueError(f"ID {config_id} already belongs to configuration '{owner}'")
+            _check_default_value(CompiledValidator(config.validation_rules, config.data_type), config.default_value)
+            parent_id = config.parent_config_id
+            if parent_id is not None:
+                parent_id = parent_id if parent_id in live_keys else resolved[parent_id]
+                current = moved[config_id] if config_id in moved else (live[1] if live else None)
+                if parent_id != current and (config.key in ids_by_key or live):
+                    if await self._bulk_cycle(config_id, parent_id, graph, moved):
+                        raise ValueError("A configuration cannot be its own ancestor")
+            return config.model_copy(update={"id": config_id, "parent_config_id": parent_id})
+
+        def resolve(config: Configuration, config_id: UUID) -> list[tuple[int, Configuration]]:
+            """Record where ``config`` is stored and release the records waiting for it."""
+            ids_by_key[config.key] = config_id
+            keys_by_id[config_id] = config.key
+            resolved[config.id] = config_id
+            released = waiting.pop(config.id, [])
+            if config_id != config.id:
+                released += waiting.pop(config_id, [])
+            return released
+
+        async def accept(pending: list[tuple[int, Configuration]]) -> None:
+            """Check records, queueing accepted ones for writing and deferring those without a parent yet."""
+            while pending:
+                line, config = pending.pop()
+                config_id = stored_id(config)
+                if config_id is not None and not update_existing:
+                    pending += resolve(config, config_id)
+                    continue
+                parent_id = config.parent_config_id
+                if parent_id is not None and parent_id not in live_keys and parent_id not in resolved:
+                    waiting.setdefault(parent_id, []).append((line, config))
+                    continue
+                try:
+                    checked = await check(config)
+                except ValueError as e:
+                    rejected.append((line, str(e)))
+                    continue
+                moved[checked.id] = checked.parent_config_id
+                pending += resolve(config, checked.id)
+                # A key repeated within a batch would be merged out of order, so it starts a new one
+                if len(ready[-1]) >= batch_size or checked.key in ready_keys:
+                    ready.append([])
+                    ready_keys.clear()
+                ready[-1].append(checked)
+                ready_keys.add(checked.key)
+
+        async def batches() -> AsyncIterator[list[Configuration]]:
+            chunk: list[tuple[int, Configuration]] = []
+            async for record in records:
+                chunk.append(record)
+                if len(chunk) < batch_size:
+                    continue
+                async for batch in flush(chunk):
+                    yield batch
+                chunk = []
+            async for batch in flush(chunk):
+                yield batch
+
+        async def flush(chunk: list[tuple[int, Configuration]]) -> AsyncIterator[list[Configuration]]:
+            keys = list({c.key for _, c in chunk} - ids_by_key.keys() - live_edges.keys())
+            live_edges.update(await self.repository.edges_by_key(keys))
+            ids = {c.id for _, c in chunk} | {c.parent_config_id for _, c in chunk if c.parent_config_id}
+            live_keys.update(await self.repository.keys_by_id(list(ids - live_keys.keys())))
+            await accept(chunk[::-1])
+            for batch in ready:
+                if batch:
+                    yield batch
+            ready[:] = [[]]
+            ready_keys.clear()
+
+        written = await self.repository.import_configurations(batches(), update_existing=update_existing)
+        rejected += [(line, "Parent configuration not found") for orphans in waiting.values() for line, _ in orphans]
+        return written, sorted(rejected)
 
     async def update_configuration(
         self,
@@ -76,6 +539,23 @@ class ConfigurationService:
         # Don't allow updating key
         updates.pop("key", None)
 
+        new_parent_id = updates.get("parent_config_id")
+        if new_parent_id is not None and await self._would_create_cycle(config_id, new_parent_id):
+            raise ValueError("A configuration cannot be its own ancestor")
+
+        if updates.keys() & {"data_type", "default_value", "validation_rules"}:
+            current = await self.repository.get_by_id(config_id)
+            if current is None:
+                return None
+            if updates.keys() & {"data_type", "validation_rules"}:
+                validator = CompiledValidator(
+                    updates.get("validation_rules", current.validation_rules),
+                    updates.get("data_type", current.data_type),
+                )
+            else:
+                validator = self._validator(current)
+            _check_default_value(validator, updates.get("default_value", current.default_value))
+
         return await self.repository.update(config_id, updates)
 
     async def delete_configuration(self, config_id: UUID) -> bool:
@@ -83,28 +563,184 @@ class ConfigurationService:
         logger.info("Deleting configuration", config_id=str(config_id))
         return await self.repository.delete(config_id)
 
-    async def get_parent_options(self, current_config_id: UUID | None = None) -> list[Configuration]:
+    async def get_parent_options(
+        self,
+        current_config_id: UUID | None = None,
+        limit: int = 100,
+        cursor: str | None = None,
+    ) -> tuple[list[Configuration], int, str | None]:
         """Get available parent configurations (excluding current and its descendants)."""
-        configs, _ = await self.repository.list_all(limit=1000)
+        return await self.repository.list_parent_options(exclude_id=current_config_id, limit=limit, cursor=cursor)
+
+    async def resolve(
+        self,
+        keys: list[str],
+        context: dict[str, Any] | None = None,
+    ) -> tuple[dict[str, ResolvedValue], list[str]]:
+        """Resolve the effective value of each key.
+
+        ``context`` supplies explicit values by key and wins over everything else. Any
+        other configuration takes the default of its first parent condition matching
+        its parent's effective value, or its own ``default_value``. Ancestors are loaded
+        one tree level per query. Returns the resolved values and the unknown keys.
+        """
+        context = context or {}
+        configs = {c.id: c for c in await self.repository.get_by_keys(keys)}
+        requested = {c.key: c for c in configs.values()}
+
+        graph = await self.get_graph()
+        if graph is not None:
+            # The graph knows every ancestor up front, so they load in one query
+            ancestor_ids = {a for c in requested.values() for a in graph.ancestors(c.id)} - configs.keys()
+            configs.update((p.id, p) for p in await self.repository.get_by_ids(list(ancestor_ids)))
+
+        pending = {c.parent_config_id for c in configs.values() if c.parent_config_id} - configs.keys()
+        while pending:
+            parents = await self.repository.get_by_ids(list(pending))
+            configs.update((p.id, p) for p in parents)
+            pending = {p.parent_config_id for p in parents if p.parent_config_id} - configs.keys()
+
+        resolved: dict[UUID, ResolvedValue] = {}
+        for config in requested.values():
+            self._resolve_chain(config, configs, context, resolved)
+
+        values = {key: resolved[config.id] for key, config in requested.items()}
+        missing = [key for key in dict.fromkeys(keys) if key not in requested]
+        return values, missing
+
+    async def evaluate_conditions(
+        self,
+        key: str,
+        parent_values: Sequence[Any],
+    ) -> tuple[Configuration, list[bool], list[Any]] | None:
+        """Evaluate a configuration's parent conditions against a column of parent values.
+
+        Each row takes the default of its first matching condition, or the
+        configuration's own ``default_value``. Returns the configuration, the per-row
+        ``matched`` flags and values, or None if the key does not exist.
+        """
+        config = await self.repository.get_by_key(key)
+        if config is None:
+            return None
+        parent = await self.repository.get_by_id(config.parent_config_id) if config.parent_config_id else None
+        if parent is None:
+            raise ValueError("Configuration has no parent to evaluate conditions against")
+        matched, values = self._compiled_conditions(config, parent).evaluate_many(parent_values)
+        values = [value if hit else config.default_value for hit, value in zip(matched, values)]
+        return config, matched, values
+
+    def _resolve_chain(
+        self,
+        config: Configuration,
+        configs: dict[UUID, Configuration],
+        context: dict[str, Any],
+        resolved: dict[UUID, ResolvedValue],
+    ) -> None:
+        """Resolve ``config`` and any unresolved ancestors, root first."""
+        chain: list[Configuration] = []
+        seen: set[UUID] = set()
+        node: Configuration | None = config
+        while node is not None and node.id not in resolved and node.id not in seen:
+            chain.append(node)
+            seen.add(node.id)
+            if node.key in context:
+                break
+            node = configs.get(node.parent_config_id) if node.parent_config_id else None
+
+        for node in reversed(chain):
+            if node.key in context:
+                resolved[node.id] = ResolvedValue(value=context[node.key], source="context")
+                continue
+            parent = configs.get(node.parent_config_id) if node.parent_config_id else None
+            parent_value = resolved.get(parent.id) if parent else None
+            if parent is not None and parent_value is not None and node.parent_conditions:
+                matched, value = self._compiled_conditions(node, parent).evaluate(parent_value.value)
+                if matched:
+                    resolved[node.id] = ResolvedValue(value=value, source="condition")
+                    continue
+            resolved[node.id] = ResolvedValue(value=node.default_value, source="default")
+
+    def _compiled_conditions(self, config: Configuration, parent: Configuration) -> CompiledConditions:
+        """Get the compiled parent conditions of ``config``, compiling them on first use."""
+        cache_key = (config.id, config.updated_at, parent.data_type)
+        compiled = _compiled_conditions.get(cache_key)
+        if compiled is None:
+            try:
+                compiled = CompiledConditions(config.parent_conditions, parent.data_type)
+            except ValueError as e:
+                logger.warning("Ignoring invalid parent conditions", key=config.key, error=str(e))
+                compiled = CompiledConditions([], parent.data_type)
+            _compiled_conditions.set(cache_key, compiled)
+        return compiled
+
+    async def validate_values(
+        self,
+        values: Sequence[Any],
+        config_id: UUID | None = None,
+        key: str | None = None,
+    ) -> list[tuple[int, list[str]]] | None:
+        """Check candidate values against the rules of the configuration with an ID or key.
+
+        The rules compile once per configuration version, so each value costs only the
+        comparisons. Returns ``(index, errors)`` for each invalid value, or None if the
+        configuration does not exist.
+        """
+        if config_id is not None:
+            config = await self.repository.get_by_id(config_id)
+        elif key is not None:
+            config = await self.repository.get_by_key(key)
+        else:
+            config = None
+        if config is None:
+            return None
+        validator = self._validator(config)
+        return [(index, errors) for index, value in enumerate(values) if (errors := validator.validate(value))]
 
-        if not current_config_id:
-            return configs
+    def _validator(self, config: Configuration) -> CompiledValidator:
+        """Get the compiled validation rules of ``config``, compiling them on first use."""
+        cache_key = (config.id, config.updated_at)
+        validator = _compiled_validators.get(cache_key)
+        if validator is None:
+            validator = CompiledValidator(config.validation_rules, config.data_type)
+            _compiled_validators.set(cache_key, validator)
+        return validator
 
-        # Filter out the current configuration and all its descendants
-        excluded_ids = {current_config_id}
+    async def get_graph(self) -> ConfigurationGraph | None:
+        """Get the configuration graph, loading it on first use.
 
-        # Find all descendants recursively
-        def find_descendants(parent_id: UUID):
-            """Recursively find all descendants of a given parent."""
-            children = [c for c in configs if c.parent_config_id == parent_id]
-            for child in children:
-                if child.id not in excluded_ids:
-                    excluded_ids.add(child.id)
-                    find_descendants(child.id)
+        Returns None when the graph is disabled, another request is loading it, or it
+        would be loaded from a replica, in which case callers fall back to querying
+        the database.
+        """
+        if not get_settings().graph_enabled:
+            return None
+        graph = get_configuration_graph()
+        if graph.loaded:
+            return graph
+        if graph.loading or self.on_replica:
+            return None
+        graph.begin_load()
+        try:
+            edges = await self.repository.list_edges()
+        except Exception:
+            graph.invalidate()
+            raise
+        graph.finish_load(edges)
+        logger.info("Configuration graph loaded", nodes=len(graph))
+        return graph
 
-        find_descendants(current_config_id)
+    async def _would_create_cycle(self, config_id: UUID, new_parent_id: UUID) -> bool:
+        """Check whether moving ``config_id`` under ``new_parent_id`` forms a cycle."""
+        graph = await self.get_graph()
+        if graph is not None:
+            return graph.would_create_cycle(config_id, new_parent_id)
+        return await self.repository.is_in_subtree(config_id, new_parent_id)
 
-        # Return configs that are not excluded
-        available = [c for c in configs if c.id not in excluded_ids]
 
-        return available
+def _check_default_value(validator: CompiledValidator, default_value: str | None) -> None:
+    """Reject a default value that breaks the configuration's own rules."""
+    if default_value is None:
+        return
+    errors = validator.validate(default_value)
+    if errors:
+        raise ValueError(f"Invalid default_value: {'; '.join(errors)}")
@@ -0,0 +1,319 @@
+"""Typed evaluation of parent conditions.
+
+Conditions evaluate one parent value at a time, or a whole column of them with
+``CompiledConditions.evaluate_many``; number and date columns are compared with
+NumPy when it is installed (imported on first use).
+"""
+
+import json
+import math
+import operator
+from collections.abc import Callable, Sequence
+from datetime import date, datetime
+from types import ModuleType
+from typing import Any
+
+from src.domain.entities.configuration import ParentCondition
+
+# NumPy is imported on the first column evaluation rather than at startup; np stays
+# None after that when it is not installed
+np: ModuleType | None = None
+_numpy_loaded = False
+
+Predicate = Callable[[Any], bool]
+# Maps a float column of parsed parent values to a boolean column
+Mask = Callable[[Any], Any]
+
+# Parent data types whose values compare as floats (dates by ordinal) in a column
+VECTORIZED_TYPES = frozenset({"date", "number"})
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+_ORDERED_OPERATORS: dict[str, Callable[[Any, Any], bool]] = {
+    "=": operator.eq,
+    "!=": operator.ne,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+}
+
+
+def _parse_number(raw: Any) -> float:
+    if isinstance(raw, bool):
+        raise ValueError(f"Invalid number: {raw!r}")
+    value = float(raw) if isinstance(raw, int | float) else float(str(raw).strip())
+    # NaN and infinities are not numbers a condition can match, in either evaluation path
+    if not math.isfinite(value):
+        raise ValueError(f"Invalid number: {raw!r}")
+    return value
+
+
+def _parse_date(raw: Any) -> date:
+    if isinstance(raw, datetime):
+        return raw.date()
+    if isinstance(raw, date):
+        return raw
+    text = str(raw).strip()
+    try:
+        return date.fromisoformat(text)
+    except ValueError:
+        return datetime.fromisoformat(text).date()
+
+
+def _parse_string(raw: Any) -> str:
+    return str(raw)
+
+
+def _parse_list(raw: Any) -> frozenset[str]:
+    if isinstance(raw, list | tuple | set | frozenset):
+        items = raw
+    else:
+        text = str(raw).strip()
+        items = json.loads(text) if text.startswith("[") else text.split(",")
+    return frozenset(str(item).strip() for item in items if str(item).strip())
+
+
+VALUE_PARSERS: dict[str, Callable[[Any], Any]] = {
+    "date": _parse_date,
+    "list": _parse_list,
+    "number": _parse_number,
+    "string": _parse_string,
+}
+
+
+def parse_value(data_type: str, raw: Any) -> Any:
+    """Parse a stored or submitted value into the Python type used for comparisons.
+
+    Lists are comma separated (or a JSON array) and compare as sets.
+    """
+    parser = VALUE_PARSERS.get(data_type)
+    if parser is None:
+        raise ValueError(f"Unsupported data type: {data_type}")
+    try:
+        return parser(raw)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Invalid {data_type} value: {raw!r}") from e
+
+
+def split_range(raw: Any) -> tuple[Any, Any]:
+    """Split a ``between`` operand into its lower and upper bounds."""
+    if isinstance(raw, list | tuple):
+        bounds = list(raw)
+    else:
+        bounds = str(raw).split(",")
+    if len(bounds) != 2:
+        raise ValueError(f"'between' expects 'min,max', got {raw!r}")
+    return bounds[0], bounds[1]
+
+
+def compile_predicate(condition: ParentCondition, parent_data_type: str) -> Predicate:
+    """Compile one condition into a closure over an already parsed parent value.
+
+    The condition operand is parsed once here rather than on every evaluation.
+    """
+    op = condition.operator
+    if parent_data_type not in VALUE_PARSERS:
+        raise ValueError(f"Unsupported data type: {parent_data_type}")
+
+    if op == "between":
+        if parent_data_type == "list":
+            raise ValueError("'between' is not supported for list values")
+        low, high = (parse_value(parent_data_type, bound) for bound in split_range(condition.value))
+        return lambda value: low <= value <= high
+
+    if op == "in" and parent_data_type != "list":
+        members = frozenset(parse_value(parent_data_type, item.strip()) for item in str(condition.value).split(","))
+        return lambda value: value in members
+
+    expected = parse_value(parent_data_type, condition.value)
+
+    if parent_data_type == "list":
+        if op == "in":
+            return lambda value: not value.isdisjoint(expected)
+        if op in ("=", "!="):
+            equality = _ORDERED_OPERATORS[op]
+            return lambda value: equality(value, expected)
+        raise ValueError(f"Operator '{op}' is not supported for list values")
+
+    compare = _ORDERED_OPERATORS.get(op)
+    if compare is None:
+        raise ValueError(f"Unsupported operator: {op}")
+    return lambda value: compare(value, expected)
+
+
+def _numpy() -> ModuleType | None:
+    """Get the numpy module, importing it on first use; None when not installed."""
+    global np, _numpy_loaded
+    if not _numpy_loaded:
+        try:
+            import numpy
+
+            np = numpy
+        except ImportError:  # pragma: no cover - optional speedup
+            np = None
+        _numpy_loaded = True
+    return np
+
+
+def _require_numpy() -> ModuleType:
+    """Get the numpy module for column evaluation, which cannot run without it."""
+    numpy = _numpy()
+    if numpy is None:
+        raise ValueError("Column evaluation needs NumPy")
+    return numpy
+
+
+def _as_float(value: Any) -> float:
+    """Map a parsed number or date onto the float axis used by column masks."""
+    return float(value.toordinal()) if isinstance(value, date) else value
+
+
+def compile_mask(condition: ParentCondition, parent_data_type: str) -> Mask:
+    """Compile one condition into a NumPy comparison over a float column.
+
+    Only number and date parents are supported; NaN rows are left to the caller.
+    """
+    if parent_data_type not in VECTORIZED_TYPES:
+        raise ValueError(f"Unsupported data type for column evaluation: {parent_data_type}")
+    numpy = _require_numpy()
+    op = condition.operator
+
+    if op == "between":
+        low, high = (_as_float(parse_value(parent_data_type, bound)) for bound in split_range(condition.value))
+        return lambda column: (column >= low) & (column <= high)
+
+    if op == "in":
+        members = [_as_float(parse_value(parent_data_type, item.strip())) for item in str(condition.value).split(",")]
+        return lambda column: numpy.isin(column, members)
+
+    compare = _ORDERED_OPERATORS.get(op)
+    if compare is None:
+        raise ValueError(f"Unsupported operator: {op}")
+    expected = _as_float(parse_value(parent_data_type, condition.value))
+    return lambda column: compare(column, expected)
+
+
+class CompiledConditions:
+    """A configuration's parent conditions compiled for one parent data type.
+
+    The first matching condition wins, mirroring the order they are edited in.
+    """
+
+    def __init__(self, conditions: Sequence[ParentCondition], parent_data_type: str):
+        """Compile conditions."""
+        self.parent_data_type = parent_data_type
+        self.conditions = list(conditions)
+        self.rules: list[tuple[Predicate, Any]] = [
+            (compile_predicate(condition, parent_data_type), condition.default_value) for condition in conditions
+        ]
+        # Column masks are compiled by the first evaluate_many, so scalar use never loads NumPy
+        self._masks: list[Mask] | None = None
+        self._masks_compiled = False
+
+    @property
+    def masks(self) -> list[Mask] | None:
+        """Column masks per condition, or None when this type (or NumPy) is not vectorized."""
+        if not self._masks_compiled:
+            if self.parent_data_type in VECTORIZED_TYPES and _numpy() is not None:
+                self._masks = [compile_mask(condition, self.parent_data_type) for condition in self.conditions]
+            self._masks_compiled = True
+        return self._masks
+
+    def evaluate(self, parent_value: Any) -> tuple[bool, Any]:
+        """Return ``(matched, default_value)`` for a raw parent value.
+
+        A parent value that does not parse as the parent's data type matches nothing.
+        """
+        if parent_value is None or not self.rules:
+            return False, None
+        try:
+            value = parse_value(self.parent_data_type, parent_value)
+        except ValueError:
+            return False, None
+        for predicate, default_value in self.rules:
+            try:
+                if predicate(value):
+                    return True, default_value
+            except TypeError:
+                continue
+        return False, None
+
+    def evaluate_many(self, parent_values: Sequence[Any]) -> tuple[list[bool], list[Any]]:
+        """Evaluate a column of raw parent values.
+
+        Returns the ``matched`` flags and chosen default values, one per row, with the
+        same results as calling ``evaluate`` per row. Number and date columns are
+        compared as whole arrays; numeric (or ``datetime64``) NumPy arrays skip parsing
+        entirely. Other types evaluate each distinct value once.
+        """
+        if not self.rules:
+            return [False] * len(parent_values), [None] * len(parent_values)
+        masks = self.masks
+        if masks is not None:
+            return self._evaluate_column(self._float_column(parent_values), masks)
+        return self._evaluate_distinct(parent_values)
+
+    def _float_column(self, parent_values: Sequence[Any]) -> Any:
+        """Parse parent values into a float column, with NaN where a value does not parse.
+
+        Non-finite entries of a NumPy array are kept as they are; ``_evaluate_column``
+        treats them as unparseable, as ``parse_value`` does.
+        """
+        numpy = _require_numpy()
+        if isinstance(parent_values, numpy.ndarray):
+            if self.parent_data_type == "number" and parent_values.dtype.kind in "iuf":
+                return parent_values.astype(float, copy=False)
+            if self.parent_data_type == "date" and parent_values.dtype.kind == "M":
+                days = parent_values.astype("datetime64[D]")
+                return numpy.where(numpy.isnat(days), numpy.nan, days.astype(numpy.int64) + _EPOCH_ORDINAL)
+
+        parsed: dict[tuple[type, Any], float] = {}
+
+        def to_float(raw: Any) -> float:
+            if raw is None:
+                return math.nan
+            try:
+                return _as_float(parse_value(self.parent_data_type, raw))
+            except ValueError:
+                return math.nan
+
+        column = numpy.empty(len(parent_values), dtype=float)
+        for index, raw in enumerate(parent_values):
+            try:
+                value = parsed.get((type(raw), raw))
+                if value is None:
+                    value = parsed[(type(raw), raw)] = to_float(raw)
+            except TypeError:
+                value = to_float(raw)
+            column[index] = value
+        return column
+
+    def _evaluate_column(self, column: Any, masks: list[Mask]) -> tuple[list[bool], list[Any]]:
+        """Pick the first matching rule per row; earlier rules overwrite later ones."""
+        numpy = _require_numpy()
+        valid = numpy.isfinite(column)
+        fallback = len(self.rules)
+        choice = numpy.full(len(column), fallback)
+        for index in range(fallback - 1, -1, -1):
+            choice[masks[index](column) & valid] = index
+
+        defaults = numpy.empty(fallback + 1, dtype=object)
+        for index, (_, default_value) in enumerate(self.rules):
+            defaults[index] = default_value
+        return (choice < fallback).tolist(), defaults[choice].tolist()
+
+    def _evaluate_distinct(self, parent_values: Sequence[Any]) -> tuple[list[bool], list[Any]]:
+        """Evaluate each distinct parent value once and reuse the result for repeats."""
+        results: dict[tuple[type, Any], tuple[bool, Any]] = {}
+        matched: list[bool] = []
+        values: list[Any] = []
+        for raw in parent_values:
+            try:
+                result = results.get((type(raw), raw))
+                if result is None:
+                    result = results[(type(raw), raw)] = self.evaluate(raw)
+            except TypeError:
+                result = self.evaluate(raw)
+            matched.append(result[0])
+            values.append(result[1])
+        return matched, values
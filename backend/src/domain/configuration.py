@@ -1,15 +1,23 @@
 """Compatibility exports for configuration domain entities."""
 
 from src.domain.entities.configuration import (
+    BulkOperation,
+    BulkOperationResult,
     Configuration,
+    ConfigurationChangeEntry,
     ParentCondition,
+    ResolvedValue,
     Translation,
     ValidationRule,
 )
 
 __all__ = [
+    "BulkOperation",
+    "BulkOperationResult",
     "Configuration",
+    "ConfigurationChangeEntry",
     "ParentCondition",
+    "ResolvedValue",
     "Translation",
     "ValidationRule",
 ]
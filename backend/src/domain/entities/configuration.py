@@ -2,7 +2,7 @@
 
 import uuid
 from datetime import datetime
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
@@ -66,3 +66,38 @@ class Configuration(BaseModel):
             "parent_config_id": str(self.parent_config_id) if self.parent_config_id else None,
             "updated_at": self.updated_at.isoformat(),
         }
+
+
+class ResolvedValue(BaseModel):
+    """Effective value of a configuration after parent conditions are applied."""
+
+    source: Literal["context", "condition", "default"] = Field(..., description="Where the value came from")
+    value: Any = Field(None, description="Effective value")
+
+
+class BulkOperation(BaseModel):
+    """One create, update, upsert, or delete in a bulk request, addressed by key."""
+
+    fields: dict[str, Any] = Field(default_factory=dict, description="Configuration fields to write")
+    key: str = Field(..., description="Configuration key")
+    op: Literal["create", "update", "upsert", "delete"] = Field(..., description="Operation")
+
+
+class BulkOperationResult(BaseModel):
+    """Outcome of one bulk operation."""
+
+    error: str | None = Field(default=None, description="Why the operation was rejected")
+    id: uuid.UUID | None = Field(default=None, description="Configuration ID")
+    index: int = Field(..., description="Position in the request")
+    key: str = Field(..., description="Configuration key")
+    status: Literal["created", "updated", "deleted", "error", "skipped"] = Field(..., description="Outcome")
+
+
+class ConfigurationChangeEntry(BaseModel):
+    """Latest change to one configuration in a change-feed page, with its current state."""
+
+    configuration: Configuration | None = Field(None, description="Current state; None once deleted")
+    config_id: uuid.UUID = Field(..., description="Configuration ID")
+    key: str = Field(..., description="Configuration key")
+    op: Literal["create", "update", "delete"] = Field(..., description="Operation")
+    revision: int = Field(..., description="Change-log revision of the change")
@@ -0,0 +1,55 @@
+"""Locale negotiation for configuration translations."""
+
+import re
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+# BCP 47-style tags restricted to what translations use, e.g. "ar", "ar-JO", "zh-Hant-TW"
+LANGUAGE_TAG = re.compile(r"^[A-Za-z]{1,8}(-[A-Za-z0-9]{1,8})*$")
+
+
+def parse_accept_language(header: str) -> list[str]:
+    """Get the language tags of an ``Accept-Language`` header, most preferred first."""
+    weighted: list[tuple[float, int, str]] = []
+    for index, part in enumerate(header.split(",")):
+        tag, _, params = part.strip().partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if quality > 0 and LANGUAGE_TAG.match(tag.strip()):
+            weighted.append((-quality, index, tag.strip()))
+    return [tag for _, _, tag in sorted(weighted)]
+
+
+def language_chain(preferred: Iterable[str], default: str | None = None) -> list[str]:
+    """Expand preferred tags into a lowercase lookup chain, e.g. ``ar-JO -> ar -> en``.
+
+    Each tag is followed by its less specific prefixes; the default language comes
+    last. Malformed tags are ignored.
+    """
+    chain: list[str] = []
+    for tag in [*preferred, default]:
+        if not tag or not LANGUAGE_TAG.match(tag):
+            continue
+        subtags = tag.lower().split("-")
+        for length in range(len(subtags), 0, -1):
+            candidate = "-".join(subtags[:length])
+            if candidate not in chain:
+                chain.append(candidate)
+    return chain
+
+
+def select_translation(translations: Iterable[Mapping[str, Any]], chain: list[str]) -> Mapping[str, Any] | None:
+    """Get the translation of the first language in ``chain`` that has one."""
+    by_language: dict[str, Mapping[str, Any]] = {}
+    for translation in translations:
+        by_language.setdefault(str(translation["language"]).lower(), translation)
+    for language in chain:
+        if language in by_language:
+            return by_language[language]
+    return None
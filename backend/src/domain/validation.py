@@ -0,0 +1,105 @@
+"""Compiled enforcement of configuration validation rules."""
+
+import math
+import re
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from src.domain.conditions import parse_value
+from src.domain.entities.configuration import ValidationRule
+
+# Returns an error message for a parsed value, or None when it passes
+Check = Callable[[Any], str | None]
+
+# Rule types that describe the configuration itself (validity window) or only
+# modify another rule (list_mode), so they compile to no check of their own
+_NON_VALUE_RULES = frozenset({"list_mode", "valid_from", "valid_until"})
+
+
+def _truthy(raw: Any) -> bool:
+    if isinstance(raw, str):
+        return raw.strip().lower() not in ("", "0", "false", "no")
+    return bool(raw)
+
+
+def _list_options(raw: Any) -> frozenset[str]:
+    """Parse ``list_options``: option objects with a ``value``, plain values, or comma-separated text."""
+    if isinstance(raw, list | tuple):
+        return frozenset(str(item["value"] if isinstance(item, dict) else item).strip() for item in raw)
+    options: frozenset[str] = parse_value("list", raw)
+    return options
+
+
+def _bound_checks(data_type: str, lower: Any, upper: Any) -> list[Check]:
+    """Compile inclusive bounds; strings are bounded by length, other types by value."""
+    checks: list[Check] = []
+    if data_type == "string":
+        if lower is not None:
+            low = int(parse_value("number", lower))
+            checks.append(lambda value: None if len(value) >= low else f"Must be at least {low} characters")
+        if upper is not None:
+            high = int(parse_value("number", upper))
+            checks.append(lambda value: None if len(value) <= high else f"Must be at most {high} characters")
+        return checks
+    if lower is not None:
+        low = parse_value(data_type, lower)
+        checks.append(lambda value: None if value >= low else f"Must be at least {lower}")
+    if upper is not None:
+        high = parse_value(data_type, upper)
+        checks.append(lambda value: None if value <= high else f"Must be at most {upper}")
+    return checks
+
+
+class CompiledValidator:
+    """A configuration's validation rules compiled for its data type.
+
+    Regexes are compiled and bounds parsed once, so ``validate`` only compares.
+    Supported rules: ``required``; ``min``/``max`` (value for numbers, length for
+    strings); ``start_date``/``end_date`` for dates; ``regex`` for strings; and
+    ``list_options`` with ``list_mode`` for lists. Unknown rule types are ignored.
+    Raises ValueError when a rule operand is malformed.
+    """
+
+    def __init__(self, rules: Sequence[ValidationRule], data_type: str):
+        """Compile rules."""
+        self.data_type = data_type
+        by_type = {rule.rule_type: rule.value for rule in rules}
+        for rule_type, value in by_type.items():
+            # Stored rules are sent back as JSON, which has no NaN or infinity
+            if isinstance(value, float) and not math.isfinite(value):
+                raise ValueError(f"Invalid {rule_type} rule: {value} is not a finite number")
+        self.required = _truthy(by_type.get("required", False))
+        self.checks: list[Check] = []
+
+        if data_type == "date":
+            self.checks += _bound_checks(data_type, by_type.get("start_date"), by_type.get("end_date"))
+        elif data_type in ("number", "string"):
+            self.checks += _bound_checks(data_type, by_type.get("min"), by_type.get("max"))
+
+        if data_type == "string" and by_type.get("regex"):
+            try:
+                pattern = re.compile(str(by_type["regex"]))
+            except re.error as e:
+                raise ValueError(f"Invalid regex rule: {e}") from e
+            self.checks.append(lambda value: None if pattern.search(value) else f"Must match {pattern.pattern}")
+
+        if data_type == "list":
+            if "list_options" in by_type:
+                options = _list_options(by_type["list_options"])
+                self.checks.append(
+                    lambda value: None
+                    if value <= options
+                    else f"Not an allowed option: {', '.join(sorted(value - options))}"
+                )
+            if str(by_type.get("list_mode", "")).lower() == "single":
+                self.checks.append(lambda value: None if len(value) <= 1 else "Only one option may be selected")
+
+    def validate(self, raw: Any) -> list[str]:
+        """Get every rule a raw value breaks; an empty list means it is valid."""
+        if raw is None or str(raw).strip() == "":
+            return ["Value is required"] if self.required else []
+        try:
+            value = parse_value(self.data_type, raw)
+        except ValueError as e:
+            return [str(e)]
+        return [error for check in self.checks if (error := check(value)) is not None]
@@ -0,0 +1,17 @@
+"""Cache module exports."""
+
+from src.infrastructure.cache.configuration_cache import ConfigurationCache, get_configuration_cache
+from src.infrastructure.cache.configuration_graph import ConfigurationGraph, get_configuration_graph
+from src.infrastructure.cache.lru import CacheStats, LRUTTLCache
+from src.infrastructure.cache.snapshot_cache import SnapshotCache, get_snapshot_cache
+
+__all__ = [
+    "CacheStats",
+    "ConfigurationCache",
+    "ConfigurationGraph",
+    "LRUTTLCache",
+    "SnapshotCache",
+    "get_configuration_cache",
+    "get_configuration_graph",
+    "get_snapshot_cache",
+]
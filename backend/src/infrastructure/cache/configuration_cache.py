@@ -0,0 +1,95 @@
+"""Process-wide cache of configuration entities."""
+
+from datetime import datetime
+from functools import lru_cache
+from uuid import UUID
+
+from src.configs import get_settings
+from src.domain.entities.configuration import Configuration
+from src.infrastructure.cache.lru import LRUTTLCache
+from src.infrastructure.notifications import ConfigurationChange, get_change_bus
+
+
+class ConfigurationCache:
+    """Configuration entities indexed by ID and by key.
+
+    Entities are copied in and out, so callers can never mutate a cached row.
+
+    Entries are evicted from change notifications rather than by the repository, so
+    writes made by other workers invalidate this cache too. Loads that raced with a
+    write must not repopulate the cache with the old row, so callers take a
+    ``generation`` token before querying and hand it back to ``put``; any
+    invalidation in between makes the put a no-op.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        """Initialize cache."""
+        self.by_id: LRUTTLCache[UUID, Configuration] = LRUTTLCache(max_size, ttl_seconds)
+        # Keys map to IDs only, so the two indexes can never disagree about a row
+        self.by_key: LRUTTLCache[str, UUID] = LRUTTLCache(max_size, ttl_seconds)
+        self.generation = 0
+
+    def get_by_id(self, config_id: UUID) -> Configuration | None:
+        """Get a copy of a cached configuration by ID."""
+        config = self.by_id.get(config_id)
+        return config.model_copy(deep=True) if config is not None else None
+
+    def get_by_key(self, key: str) -> Configuration | None:
+        """Get a copy of a cached configuration by key, resolved through the ID index."""
+        config_id = self.by_key.get(key)
+        if config_id is None:
+            return None
+        config = self.get_by_id(config_id)
+        if config is None or config.key != key:
+            self.by_key.pop(key)
+            return None
+        return config
+
+    def get_version(self, config_id: UUID) -> datetime | None:
+        """Get a cached configuration's ``updated_at`` without copying it."""
+        config = self.by_id.get(config_id)
+        return config.updated_at if config is not None else None
+
+    def put(self, config: Configuration, generation: int | None = None) -> None:
+        """Cache a copy of a configuration unless it was invalidated since ``generation``."""
+        if generation is not None and generation != self.generation:
+            return
+        self.by_id.set(config.id, config.model_copy(deep=True))
+        self.by_key.set(config.key, config.id)
+
+    def invalidate(self, config_id: UUID, key: str | None = None) -> None:
+        """Drop a configuration from both indexes."""
+        self.generation += 1
+        cached = self.by_id.pop(config_id)
+        for stale_key in {key, cached.key if cached else None}:
+            if stale_key is not None:
+                self.by_key.pop(stale_key)
+
+    def clear(self) -> None:
+        """Drop every cached configuration."""
+        self.generation += 1
+        self.by_id.clear()
+        self.by_key.clear()
+
+    def apply_change(self, change: ConfigurationChange) -> None:
+        """Evict whatever a committed change made stale."""
+        if change.op == "reset" or change.config_id is None:
+            self.clear()
+        else:
+            self.invalidate(change.config_id, change.key)
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Get hit/miss/eviction counters per index."""
+        return {
+            "by_id": {**self.by_id.stats.to_dict(), "size": len(self.by_id)},
+            "by_key": {**self.by_key.stats.to_dict(), "size": len(self.by_key)},
+        }
+
+
+@lru_cache
+def get_configuration_cache() -> ConfigurationCache:
+    """Get the process-wide configuration cache."""
+    settings = get_settings()
+    cache = ConfigurationCache(max_size=settings.cache_max_size, ttl_seconds=settings.cache_ttl_seconds)
+    get_change_bus().subscribe(cache.apply_change)
+    return cache
@@ -0,0 +1,185 @@
+"""In-memory parent/child graph of every configuration."""
+
+from collections import deque
+from collections.abc import Iterable
+from functools import lru_cache
+from uuid import UUID
+
+from src.infrastructure.notifications import ConfigurationChange, get_change_bus
+
+
+class ConfigurationGraph:
+    """Adjacency lists and depths for the configuration tree, keyed by UUID.
+
+    Ancestor chains are walked in O(depth) and descendant sets in O(subtree); both
+    are kept current by change notifications instead of rescanning the table.
+    Deleting a node re-roots its children, matching ``ON DELETE SET NULL``.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty, unloaded graph."""
+        self.parents: dict[UUID, UUID | None] = {}
+        self.children: dict[UUID, set[UUID]] = {}
+        self.depths: dict[UUID, int] = {}
+        self.loaded = False
+        self._loading = False
+        self._pending: list[ConfigurationChange] = []
+
+    def __len__(self) -> int:
+        return len(self.parents)
+
+    def __contains__(self, config_id: UUID) -> bool:
+        return config_id in self.parents
+
+    @property
+    def loading(self) -> bool:
+        """Whether a snapshot is currently being loaded."""
+        return self._loading
+
+    def begin_load(self) -> None:
+        """Start buffering changes that arrive while a snapshot is being read."""
+        self._loading = True
+        self._pending = []
+
+    def finish_load(self, edges: Iterable[tuple[UUID, UUID | None]]) -> None:
+        """Replace the graph with a snapshot of ``(id, parent_config_id)`` rows.
+
+        Changes buffered since ``begin_load`` are replayed on top, since the snapshot
+        may predate them.
+        """
+        self.parents = dict(edges)
+        self.children = {}
+        for config_id, parent_id in self.parents.items():
+            if parent_id is not None:
+                self.children.setdefault(parent_id, set()).add(config_id)
+        self.depths = {}
+        for config_id in self.parents:
+            self._compute_depth(config_id)
+
+        pending, self._pending = self._pending, []
+        self._loading = False
+        self.loaded = True
+        for change in pending:
+            self.apply_change(change)
+
+    def invalidate(self) -> None:
+        """Drop the graph so it is reloaded before its next use."""
+        self.parents, self.children, self.depths = {}, {}, {}
+        self.loaded = False
+        self._loading = False
+        self._pending = []
+
+    def apply_change(self, change: ConfigurationChange) -> None:
+        """Apply a committed change incrementally."""
+        if self._loading:
+            self._pending.append(change)
+            return
+        if change.op == "reset" or change.config_id is None:
+            self.invalidate()
+        elif self.loaded:
+            if change.op == "delete":
+                self.remove(change.config_id)
+            else:
+                self.upsert(change.config_id, change.parent_config_id)
+
+    def upsert(self, config_id: UUID, parent_id: UUID | None) -> None:
+        """Add a node or move it under a new parent."""
+        if config_id in self.parents and self.parents[config_id] == parent_id:
+            return
+        old_parent = self.parents.get(config_id)
+        if old_parent is not None:
+            self.children.get(old_parent, set()).discard(config_id)
+        self.parents[config_id] = parent_id
+        if parent_id is not None:
+            self.children.setdefault(parent_id, set()).add(config_id)
+
+        base = self.depths.get(parent_id, -1) + 1 if parent_id is not None else 0
+        self._set_subtree_depth(config_id, base)
+
+    def remove(self, config_id: UUID) -> None:
+        """Remove a node; its children become roots."""
+        if config_id not in self.parents:
+            return
+        parent_id = self.parents.pop(config_id)
+        self.depths.pop(config_id, None)
+        if parent_id is not None:
+            self.children.get(parent_id, set()).discard(config_id)
+        for child_id in self.children.pop(config_id, set()):
+            self.parents[child_id] = None
+            self._set_subtree_depth(child_id, 0)
+
+    def parent_of(self, config_id: UUID) -> UUID | None:
+        """Get a node's parent."""
+        return self.parents.get(config_id)
+
+    def children_of(self, config_id: UUID) -> set[UUID]:
+        """Get a node's direct children."""
+        return set(self.children.get(config_id, ()))
+
+    def depth(self, config_id: UUID) -> int:
+        """Get a node's distance from its root (roots are 0)."""
+        return self.depths[config_id]
+
+    def ancestors(self, config_id: UUID) -> list[UUID]:
+        """Get the chain of ancestors, nearest first, in O(depth)."""
+        chain: list[UUID] = []
+        seen = {config_id}
+        parent_id = self.parents.get(config_id)
+        while parent_id is not None and parent_id not in seen:
+            chain.append(parent_id)
+            seen.add(parent_id)
+            parent_id = self.parents.get(parent_id)
+        return chain
+
+    def descendants(self, config_id: UUID) -> set[UUID]:
+        """Get every node below ``config_id`` in O(subtree)."""
+        found: set[UUID] = set()
+        queue = deque(self.children.get(config_id, ()))
+        while queue:
+            node = queue.popleft()
+            if node in found or node == config_id:
+                continue
+            found.add(node)
+            queue.extend(self.children.get(node, ()))
+        return found
+
+    def would_create_cycle(self, config_id: UUID, new_parent_id: UUID | None) -> bool:
+        """Check whether re-parenting ``config_id`` under ``new_parent_id`` forms a cycle."""
+        if new_parent_id is None:
+            return False
+        return new_parent_id == config_id or config_id in self.ancestors(new_parent_id)
+
+    def _compute_depth(self, config_id: UUID) -> int:
+        """Compute and memoize depth iteratively (chains may be very deep)."""
+        path: list[UUID] = []
+        seen: set[UUID] = set()
+        node: UUID | None = config_id
+        while node is not None and node not in self.depths and node not in seen and node in self.parents:
+            path.append(node)
+            seen.add(node)
+            node = self.parents[node]
+        depth = self.depths[node] if node is not None and node in self.depths else -1
+        for node in reversed(path):
+            depth += 1
+            self.depths[node] = depth
+        return self.depths[config_id]
+
+    def _set_subtree_depth(self, config_id: UUID, depth: int) -> None:
+        """Set the depth of a node and shift its subtree to match."""
+        queue = deque([(config_id, depth)])
+        seen: set[UUID] = set()
+        while queue:
+            node, node_depth = queue.popleft()
+            if node in seen:
+                continue
+            seen.add(node)
+            self.depths[node] = node_depth
+            queue.extend((child, node_depth + 1) for child in self.children.get(node, ()))
+
+
+@lru_cache
+def get_configuration_graph() -> ConfigurationGraph:
+    """Get the process-wide configuration graph."""
+    graph = ConfigurationGraph()
+    get_change_bus().subscribe(graph.apply_change)
+    return graph
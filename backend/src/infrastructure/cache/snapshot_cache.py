@@ -0,0 +1,57 @@
+"""Process-wide cache of encoded configuration responses."""
+
+from datetime import datetime
+from functools import lru_cache
+from uuid import UUID
+
+from src.configs import get_settings
+from src.infrastructure.cache.lru import LRUTTLCache
+from src.infrastructure.notifications import ConfigurationChange, get_change_bus
+
+
+class SnapshotCache:
+    """Encoded response bytes per configuration, tagged with the version they encode.
+
+    A snapshot is only served for the exact ``updated_at`` it was built from, so a
+    put that raced with a write can never be returned for the newer row; change
+    notifications just release stale entries early.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        """Initialize cache."""
+        self.entries: LRUTTLCache[UUID, tuple[datetime, bytes]] = LRUTTLCache(max_size, ttl_seconds)
+
+    def get(self, config_id: UUID, version: datetime) -> bytes | None:
+        """Get the snapshot of a configuration at ``version``."""
+        cached = self.entries.get(config_id)
+        if cached is None or cached[0] != version:
+            return None
+        return cached[1]
+
+    def put(self, config_id: UUID, version: datetime, body: bytes) -> None:
+        """Cache the snapshot of a configuration at ``version``."""
+        self.entries.set(config_id, (version, body))
+
+    def clear(self) -> None:
+        """Drop every snapshot."""
+        self.entries.clear()
+
+    def apply_change(self, change: ConfigurationChange) -> None:
+        """Drop whatever a committed change made stale."""
+        if change.op == "reset" or change.config_id is None:
+            self.clear()
+        else:
+            self.entries.pop(change.config_id)
+
+    def stats(self) -> dict[str, int]:
+        """Get hit/miss/eviction counters."""
+        return {**self.entries.stats.to_dict(), "size": len(self.entries)}
+
+
+@lru_cache
+def get_snapshot_cache() -> SnapshotCache:
+    """Get the process-wide snapshot cache."""
+    settings = get_settings()
+    cache = SnapshotCache(max_size=settings.snapshot_cache_max_size, ttl_seconds=settings.snapshot_cache_ttl_seconds)
+    get_change_bus().subscribe(cache.apply_change)
+    return cache
@@ -2,10 +2,13 @@
 
 from collections.abc import AsyncGenerator
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
 from src.configs import get_settings
+from src.configs.settings import Settings
+from src.infrastructure.database.pool import engine_options, install_idle_pre_ping
+from src.infrastructure.database.replicas import ReplicaSet
 
 
 class Base(DeclarativeBase):
@@ -15,22 +18,45 @@ class Base(DeclarativeBase):
 
 
 # Global variables for database connection
-engine = None
+engine: AsyncEngine | None = None
 async_session: async_sessionmaker[AsyncSession] | None = None
+read_replicas: ReplicaSet | None = None
 
 
-async def init_db(database_url: str | None = None) -> None:
-    """Initialize database connection."""
-    global engine, async_session
+def _create_engine(url: str, settings: Settings, name: str) -> AsyncEngine:
+    """Create an engine with the configured pool, pre-ping strategy, and metrics."""
+    options = engine_options(url, settings)
+    created = create_async_engine(url, echo=False, **options)
+    if settings.db_pool_pre_ping == "idle":
+        install_idle_pre_ping(created, settings.db_pool_pre_ping_idle_seconds)
+    if settings.metrics_enabled:
+        from src.infrastructure.metrics import instrument_engine
+
+        capacity = options["pool_size"] + options["max_overflow"] if "pool_size" in options else None
+        instrument_engine(created, name=name, capacity=capacity)
+    return created
+
+
+async def init_db(database_url: str | None = None, read_database_urls: list[str] | None = None) -> AsyncEngine:
+    """Initialize database connection and return the primary engine.
+
+    ``read_database_urls`` (default: the ``read_database_urls`` setting) adds read
+    replicas. Missing tables are created on the primary unless ``db_schema_mode`` is
+    ``migrations``.
+    """
+    global engine, async_session, read_replicas
 
     settings = get_settings()
     url = database_url or settings.database_url
+    replica_urls = settings.read_database_urls if read_database_urls is None else read_database_urls
 
-    engine = create_async_engine(
-        url,
-        echo=False,
-        pool_pre_ping=True,
-    )
+    engine = _create_engine(url, settings, "primary")
+    read_replicas = None
+    if replica_urls:
+        read_replicas = ReplicaSet(
+            [_create_engine(u, settings, f"replica-{i}") for i, u in enumerate(replica_urls)],
+            retry_seconds=settings.read_replica_retry_seconds,
+        )
 
     async_session = async_sessionmaker(
         engine,
@@ -38,17 +64,20 @@ async def init_db(database_url: str | None = None) -> None:
         expire_on_commit=False,
     )
 
-    # Create tables (kept for current behavior)
-    async with engine.begin() as conn:
-        # Ensure models are registered on Base.metadata
-        from src.infrastructure.database import models as _models  # noqa: F401
+    # With migrations the schema is applied once per release, not checked by every worker
+    if settings.db_schema_mode == "create_all":
+        async with engine.begin() as conn:
+            # Ensure models are registered on Base.metadata
+            from src.infrastructure.database import models as _models  # noqa: F401
+
+            await conn.run_sync(Base.metadata.create_all)
 
-        await conn.run_sync(Base.metadata.create_all)
+    return engine
 
 
-async def initialize_database(database_url: str) -> None:
+async def initialize_database(database_url: str) -> AsyncEngine:
     """Backward-compatible database initializer."""
-    await init_db(database_url)
+    return await init_db(database_url)
 
 
 async def get_session() -> AsyncGenerator[AsyncSession]:
@@ -63,8 +92,17 @@ async def get_session() -> AsyncGenerator[AsyncSession]:
             await session.close()
 
 
+async def open_read_session() -> AsyncSession | None:
+    """Open a session on a healthy read replica, or None when there is none to use."""
+    if read_replicas is None:
+        return None
+    return await read_replicas.open_session()
+
+
 async def close_db() -> None:
     """Close database connection."""
     global engine
     if engine:
         await engine.dispose()
+    if read_replicas:
+        await read_replicas.dispose()
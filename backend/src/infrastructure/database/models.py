@@ -3,7 +3,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, String, Text
+from sqlalchemy import BigInteger, Boolean, DateTime, Index, Integer, String, Text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -14,6 +14,11 @@ class Configuration(Base):
     """Configuration database model."""
 
     __tablename__ = "configurations"
+    __table_args__ = (
+        Index("ix_configurations_key_id", "key", "id"),
+        # Same name as in scripts/init-db.sql and the initial migration
+        Index("idx_configurations_parent_config_id", "parent_config_id"),
+    )
 
     active: Mapped[bool] = mapped_column(Boolean, default=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
@@ -38,3 +43,22 @@ class Configuration(Base):
         nullable=False,
     )
     validation_rules: Mapped[list | None] = mapped_column(JSONB, nullable=True, server_default="[]")
+
+
+class ConfigurationChangeLog(Base):
+    """One committed write to a configuration, numbered by a store-wide revision."""
+
+    __tablename__ = "configuration_change_log"
+
+    changed_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    config_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False, index=True)
+    key: Mapped[str] = mapped_column(String(255), nullable=False)
+    op: Mapped[str] = mapped_column(String(16), nullable=False)
+    parent_config_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), nullable=True)
+    previous_parent_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), nullable=True)
+    # SQLite only auto-increments INTEGER PRIMARY KEY columns
+    revision: Mapped[int] = mapped_column(
+        BigInteger().with_variant(Integer, "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+    )
@@ -0,0 +1,60 @@
+"""Connection pool options and liveness checks built from settings."""
+
+import time
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import DisconnectionError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.configs.settings import Settings
+
+_CHECKED_IN_AT = "pool_checked_in_at"
+
+
+def engine_options(url: str, settings: Settings) -> dict[str, Any]:
+    """Build ``create_async_engine`` keyword arguments for ``url``.
+
+    Pool sizing only applies to server databases; SQLite keeps SQLAlchemy's
+    per-dialect pool. ``prepared_statement_cache_size`` only applies to asyncpg.
+    """
+    parsed = make_url(url)
+    options: dict[str, Any] = {"pool_pre_ping": settings.db_pool_pre_ping == "always"}
+    if parsed.get_backend_name() != "sqlite":
+        options.update(
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_recycle=settings.db_pool_recycle_seconds,
+            pool_timeout=settings.db_pool_timeout_seconds,
+        )
+    if parsed.get_driver_name() == "asyncpg":
+        options["connect_args"] = {"prepared_statement_cache_size": settings.db_prepared_statement_cache_size}
+    return options
+
+
+def install_idle_pre_ping(engine: AsyncEngine, idle_seconds: float) -> None:
+    """Ping only connections that sat in the pool longer than ``idle_seconds``.
+
+    A connection checked in moments ago is almost certainly alive, so this skips the
+    round-trip that ``pool_pre_ping`` adds to every checkout. A failed ping makes the
+    pool discard the connection and hand out a fresh one.
+    """
+    sync_engine = engine.sync_engine
+    dialect = sync_engine.dialect
+
+    @event.listens_for(sync_engine.pool, "checkin")
+    def checkin(dbapi_connection, connection_record) -> None:
+        connection_record.info[_CHECKED_IN_AT] = time.monotonic()
+
+    @event.listens_for(sync_engine.pool, "checkout")
+    def checkout(dbapi_connection, connection_record, connection_proxy) -> None:
+        checked_in_at = connection_record.info.get(_CHECKED_IN_AT)
+        if checked_in_at is None or time.monotonic() - checked_in_at < idle_seconds:
+            return
+        try:
+            alive = dialect.do_ping(dbapi_connection)
+        except Exception as e:
+            raise DisconnectionError(f"Idle connection failed its ping: {e}") from e
+        if not alive:
+            raise DisconnectionError("Idle connection failed its ping")
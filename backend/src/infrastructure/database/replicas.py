@@ -0,0 +1,71 @@
+"""Round-robin read replicas with failover."""
+
+import time
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class ReplicaSet:
+    """Session factories for read replicas, handed out round-robin.
+
+    A replica that fails to hand out a connection is skipped for ``retry_seconds``
+    before it is tried again; when none is available callers use the primary.
+    Sessions carry ``info["replica"]`` so callers can tell they may be reading
+    lagging data.
+    """
+
+    def __init__(self, engines: list[AsyncEngine], retry_seconds: float):
+        """Initialize replica set."""
+        self.engines = engines
+        self.factories = [
+            async_sessionmaker(e, class_=AsyncSession, expire_on_commit=False, info={"replica": True}) for e in engines
+        ]
+        self.retry_seconds = retry_seconds
+        self.down_until = [0.0] * len(engines)
+        self.next_index = 0
+
+    def __len__(self) -> int:
+        """Get the number of replicas."""
+        return len(self.engines)
+
+    def available(self) -> list[int]:
+        """Get the indexes of replicas not currently marked down."""
+        now = time.monotonic()
+        return [index for index, until in enumerate(self.down_until) if until <= now]
+
+    def mark_down(self, index: int) -> None:
+        """Skip a replica until its retry delay has passed."""
+        self.down_until[index] = time.monotonic() + self.retry_seconds
+
+    async def open_session(self) -> AsyncSession | None:
+        """Open a session on the next healthy replica, with its connection checked out.
+
+        The connection is acquired up front so an unreachable replica is detected
+        here, where the next one can still be tried, rather than mid-request.
+        """
+        start = self.next_index
+        self.next_index = (start + 1) % len(self.factories)
+        for offset in range(len(self.factories)):
+            index = (start + offset) % len(self.factories)
+            if self.down_until[index] > time.monotonic():
+                continue
+            session = self.factories[index]()
+            try:
+                await session.connection()
+            except (SQLAlchemyError, OSError) as e:
+                await session.close()
+                self.mark_down(index)
+                logger.warning("Read replica unavailable", replica=index, error=str(e))
+                continue
+            return session
+        return None
+
+    async def dispose(self) -> None:
+        """Close every replica connection."""
+        for engine in self.engines:
+            await engine.dispose()
@@ -0,0 +1,23 @@
+"""Metrics module exports."""
+
+from src.infrastructure.metrics.registry import (
+    CounterFamily,
+    Histogram,
+    HistogramFamily,
+    MetricsRegistry,
+    get_metrics_registry,
+)
+from src.infrastructure.metrics.request import RequestMetrics, current_request, track_serialization
+from src.infrastructure.metrics.database import instrument_engine
+
+__all__ = [
+    "CounterFamily",
+    "Histogram",
+    "HistogramFamily",
+    "MetricsRegistry",
+    "RequestMetrics",
+    "current_request",
+    "get_metrics_registry",
+    "instrument_engine",
+    "track_serialization",
+]
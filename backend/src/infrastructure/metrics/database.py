@@ -0,0 +1,104 @@
+"""SQLAlchemy hooks timing queries and pool checkouts."""
+
+from time import perf_counter
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import Pool, PoolProxiedConnection, QueuePool
+
+from src.infrastructure.metrics.registry import MetricsRegistry, get_metrics_registry
+from src.infrastructure.metrics.request import current_request
+
+_QUERY_STARTED = "metrics_query_started"
+
+
+def instrument_engine(
+    engine: AsyncEngine,
+    registry: MetricsRegistry | None = None,
+    name: str = "primary",
+    capacity: int | None = None,
+) -> None:
+    """Record query latency, pool checkout time, and pool saturation of ``engine``.
+
+    Events run in SQLAlchemy's greenlet, which shares the caller's context, so the
+    time is also added to the request being served. ``name`` labels the pool; a
+    later engine with the same name replaces the earlier one's gauges. ``capacity``
+    (pool size plus max overflow) is reported as ``db_pool_capacity`` when given,
+    since SQLAlchemy does not expose a pool's max overflow.
+    """
+    registry = registry or get_metrics_registry()
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+        conn.info.setdefault(_QUERY_STARTED, []).append(perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+        _finish_query(conn.info, registry, name)
+
+    @event.listens_for(sync_engine, "handle_error")
+    def handle_error(context) -> None:
+        if context.connection is not None:
+            _finish_query(context.connection.info, registry, name)
+
+    # dispose() replaces the pool with a fresh one, whose checkouts are timed again
+    @event.listens_for(sync_engine, "engine_disposed")
+    def engine_disposed(disposed: Engine) -> None:
+        _time_checkouts(disposed.pool, registry, name)
+
+    registry.db_pool_checkouts_in_flight.set(name, value=0)
+    registry.db_pool_timeouts.inc(name, amount=0)
+    if capacity is not None:
+        registry.db_pool_capacity.set(name, value=capacity)
+    _time_checkouts(sync_engine.pool, registry, name)
+
+    def collect() -> None:
+        pool = sync_engine.pool
+        if isinstance(pool, QueuePool):
+            registry.db_pool_checked_out.set(name, value=pool.checkedout())
+            registry.db_pool_open.set(name, value=pool.checkedin() + pool.checkedout())
+
+    registry.collectors[f"pool:{name}"] = collect
+
+
+def _finish_query(info: dict[str, Any], registry: MetricsRegistry, name: str) -> None:
+    started = info.get(_QUERY_STARTED)
+    if not started:
+        return
+    elapsed = perf_counter() - started.pop()
+    registry.db_query_seconds.labels(name).observe(elapsed)
+    metrics = current_request.get()
+    if metrics is not None:
+        metrics.db_queries += 1
+        metrics.db_seconds += elapsed
+
+
+def _time_checkouts(pool: Pool, registry: MetricsRegistry, name: str) -> None:
+    """Time checkouts, including waits for a free connection, and count timeouts.
+
+    Pool events only fire once a connection has been handed out, so the pool's
+    public ``connect()``, which engines check connections out through, is wrapped.
+    """
+    connect = pool.connect
+
+    def timed_connect() -> PoolProxiedConnection:
+        registry.db_pool_checkouts_in_flight.inc(name)
+        started = perf_counter()
+        try:
+            return connect()
+        except PoolTimeoutError:
+            registry.db_pool_timeouts.inc(name)
+            raise
+        finally:
+            elapsed = perf_counter() - started
+            registry.db_pool_checkouts_in_flight.inc(name, amount=-1)
+            registry.db_pool_checkout_seconds.labels(name).observe(elapsed)
+            metrics = current_request.get()
+            if metrics is not None:
+                metrics.pool_wait_seconds += elapsed
+
+    pool.connect = timed_connect  # type: ignore[method-assign]
@@ -0,0 +1,217 @@
+"""In-process metric families rendered in the Prometheus text format."""
+
+from bisect import bisect_left
+from collections.abc import Callable, Sequence
+from functools import lru_cache
+
+# Request and query latencies in seconds
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Queries issued by one request
+COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 25, 50, 100, 250)
+
+_INF = 'le="+Inf"'
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class Histogram:
+    """Bucketed observations of one label set.
+
+    Updates are plain attribute increments: everything that observes runs on the
+    event loop thread (SQLAlchemy events included), so no lock is needed.
+    """
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: Sequence[float]):
+        """Initialize histogram."""
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class HistogramFamily:
+    """Histograms of one metric, one per label set."""
+
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str] = (), buckets=LATENCY_BUCKETS):
+        """Initialize family."""
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(buckets)
+        self.children: dict[tuple[str, ...], Histogram] = {}
+
+    def labels(self, *values: str) -> Histogram:
+        """Get the histogram of a label set, creating it on first use."""
+        child = self.children.get(values)
+        if child is None:
+            child = self.children.setdefault(values, Histogram(self.buckets))
+        return child
+
+    def render(self) -> list[str]:
+        """Render as Prometheus text lines."""
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        for values, child in list(self.children.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets, child.counts):
+                cumulative += count
+                le = f'le="{_number(bound)}"'
+                lines.append(f"{self.name}_bucket{_labels(self.label_names, values, le)} {cumulative}")
+            lines.append(f"{self.name}_bucket{_labels(self.label_names, values, _INF)} {child.count}")
+            lines.append(f"{self.name}_sum{_labels(self.label_names, values)} {_number(child.sum)}")
+            lines.append(f"{self.name}_count{_labels(self.label_names, values)} {child.count}")
+        return lines
+
+
+class CounterFamily:
+    """Monotonic counters of one metric, one per label set."""
+
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str] = ()):
+        """Initialize family."""
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self.values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, *values: str, amount: float = 1) -> None:
+        """Increment the counter of a label set."""
+        self.values[values] = self.values.get(values, 0) + amount
+
+    def render(self) -> list[str]:
+        """Render as Prometheus text lines."""
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} counter"]
+        for values, value in list(self.values.items()):
+            lines.append(f"{self.name}{_labels(self.label_names, values)} {_number(value)}")
+        return lines
+
+
+class GaugeFamily:
+    """Point-in-time values of one metric, one per label set."""
+
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str] = ()):
+        """Initialize family."""
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self.values: dict[tuple[str, ...], float] = {}
+
+    def set(self, *values: str, value: float) -> None:
+        """Set the gauge of a label set."""
+        self.values[values] = value
+
+    def inc(self, *values: str, amount: float = 1) -> None:
+        """Move the gauge of a label set by ``amount``."""
+        self.values[values] = self.values.get(values, 0) + amount
+
+    def render(self) -> list[str]:
+        """Render as Prometheus text lines."""
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} gauge"]
+        for values, value in list(self.values.items()):
+            lines.append(f"{self.name}{_labels(self.label_names, values)} {_number(value)}")
+        return lines
+
+
+class MetricsRegistry:
+    """Request, database, and serialization metrics of this process."""
+
+    def __init__(self):
+        """Initialize metric families."""
+        route = ("method", "route")
+        self.requests = CounterFamily("http_requests_total", "Completed HTTP requests.", (*route, "status"))
+        self.request_seconds = HistogramFamily("http_request_duration_seconds", "HTTP request latency.", route)
+        self.request_db_queries = HistogramFamily(
+            "http_request_db_queries", "Database queries issued per HTTP request.", route, COUNT_BUCKETS
+        )
+        self.request_db_seconds = HistogramFamily(
+            "http_request_db_seconds", "Time spent executing database queries per HTTP request.", route
+        )
+        self.request_pool_wait_seconds = HistogramFamily(
+            "http_request_pool_wait_seconds", "Time spent waiting for pooled connections per HTTP request.", route
+        )
+        self.request_serialization_seconds = HistogramFamily(
+            "http_request_serialization_seconds", "Time spent encoding response bodies per HTTP request.", route
+        )
+        pool = ("pool",)
+        self.db_query_seconds = HistogramFamily("db_query_duration_seconds", "Database query latency.", pool)
+        self.db_pool_checkout_seconds = HistogramFamily(
+            "db_pool_checkout_seconds", "Time to check a connection out of the pool.", pool
+        )
+        self.db_pool_timeouts = CounterFamily(
+            "db_pool_checkout_timeouts_total", "Checkouts that gave up after the pool timeout.", pool
+        )
+        self.db_pool_checkouts_in_flight = GaugeFamily(
+            "db_pool_checkouts_in_flight", "Checkouts in progress, including any waiting for a free connection.", pool
+        )
+        self.db_pool_checked_out = GaugeFamily("db_pool_checked_out", "Connections currently checked out.", pool)
+        self.db_pool_open = GaugeFamily("db_pool_open", "Connections currently open, idle or checked out.", pool)
+        self.db_pool_capacity = GaugeFamily(
+            "db_pool_capacity", "Most connections the pool may open (pool size plus overflow).", pool
+        )
+        # Refresh point-in-time gauges right before rendering, keyed by owner
+        self.collectors: dict[str, Callable[[], None]] = {}
+
+    def observe_request(
+        self,
+        method: str,
+        route: str,
+        status_code: int,
+        seconds: float,
+        db_queries: int,
+        db_seconds: float,
+        pool_wait_seconds: float,
+        serialization_seconds: float,
+    ) -> None:
+        """Record one completed request."""
+        self.requests.inc(method, route, str(status_code))
+        self.request_seconds.labels(method, route).observe(seconds)
+        self.request_db_queries.labels(method, route).observe(db_queries)
+        self.request_db_seconds.labels(method, route).observe(db_seconds)
+        self.request_pool_wait_seconds.labels(method, route).observe(pool_wait_seconds)
+        self.request_serialization_seconds.labels(method, route).observe(serialization_seconds)
+
+    def render(self) -> str:
+        """Render every family in the Prometheus text exposition format."""
+        for collect in list(self.collectors.values()):
+            collect()
+        families = (
+            self.requests,
+            self.request_seconds,
+            self.request_db_queries,
+            self.request_db_seconds,
+            self.request_pool_wait_seconds,
+            self.request_serialization_seconds,
+            self.db_query_seconds,
+            self.db_pool_checkout_seconds,
+            self.db_pool_timeouts,
+            self.db_pool_checkouts_in_flight,
+            self.db_pool_checked_out,
+            self.db_pool_open,
+            self.db_pool_capacity,
+        )
+        return "\n".join(line for family in families for line in family.render()) + "\n"
+
+
+@lru_cache
+def get_metrics_registry() -> MetricsRegistry:
+    """Get the process-wide metrics registry."""
+    return MetricsRegistry()
@@ -0,0 +1,49 @@
+"""Per-request timing collected across layers through a context variable."""
+
+from collections.abc import Callable
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import wraps
+from time import perf_counter
+from typing import ParamSpec, TypeVar
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+@dataclass(slots=True)
+class RequestMetrics:
+    """Time spent by one request outside the handler's own code."""
+
+    db_queries: int = 0
+    db_seconds: float = 0.0
+    pool_wait_seconds: float = 0.0
+    serialization_seconds: float = 0.0
+    serializing: bool = False
+
+
+# Set by the metrics middleware for the duration of each HTTP request
+current_request: ContextVar[RequestMetrics | None] = ContextVar("current_request", default=None)
+
+
+def track_serialization(encode: Callable[P, R]) -> Callable[P, R]:
+    """Add the time spent in ``encode`` to the current request.
+
+    Only the outermost encoder call is timed, so encoders that call each other
+    are not counted twice.
+    """
+
+    @wraps(encode)
+    def timed(*args: P.args, **kwargs: P.kwargs) -> R:
+        metrics = current_request.get()
+        if metrics is None or metrics.serializing:
+            return encode(*args, **kwargs)
+        metrics.serializing = True
+        started = perf_counter()
+        try:
+            return encode(*args, **kwargs)
+        finally:
+            metrics.serializing = False
+            metrics.serialization_seconds += perf_counter() - started
+
+    return timed
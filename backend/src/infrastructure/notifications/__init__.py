@@ -0,0 +1,24 @@
+"""Change notification module exports."""
+
+from src.infrastructure.notifications.broadcaster import (
+    ChangeBroadcaster,
+    ChangeFilter,
+    WatchItem,
+    WatchSubscription,
+    get_change_broadcaster,
+)
+from src.infrastructure.notifications.bus import ChangeBus, get_change_bus
+from src.infrastructure.notifications.events import INSTANCE_ID, ChangeOperation, ConfigurationChange
+
+__all__ = [
+    "INSTANCE_ID",
+    "ChangeBroadcaster",
+    "ChangeBus",
+    "ChangeFilter",
+    "ChangeOperation",
+    "ConfigurationChange",
+    "WatchItem",
+    "WatchSubscription",
+    "get_change_broadcaster",
+    "get_change_bus",
+]
@@ -0,0 +1,81 @@
+"""Fan-out of configuration changes to long-lived watchers."""
+
+import asyncio
+from collections.abc import Callable
+from functools import lru_cache
+
+from src.configs import get_settings
+from src.infrastructure.notifications.bus import get_change_bus
+from src.infrastructure.notifications.events import ConfigurationChange
+
+ChangeFilter = Callable[[ConfigurationChange], bool]
+
+# What a watcher dequeues: a change, or None once it has overflowed
+WatchItem = ConfigurationChange | None
+
+
+class WatchSubscription:
+    """One watcher's bounded queue of matching changes.
+
+    A watcher that falls ``queue_size`` changes behind is overflowed: its backlog is
+    dropped and ``get`` returns None, after which it should reconnect and catch up
+    from the change log instead of slowing the writers down.
+    """
+
+    def __init__(self, matches: ChangeFilter | None = None, queue_size: int = 1000):
+        """Initialize subscription."""
+        self.matches = matches
+        self.overflowed = False
+        self._queue: asyncio.Queue[WatchItem] = asyncio.Queue(maxsize=queue_size)
+
+    def offer(self, change: ConfigurationChange) -> None:
+        """Queue a change if it passes the filter, without ever blocking."""
+        if self.overflowed or (self.matches is not None and not self.matches(change)):
+            return
+        try:
+            self._queue.put_nowait(change)
+        except asyncio.QueueFull:
+            self.overflowed = True
+            while not self._queue.empty():
+                self._queue.get_nowait()
+            self._queue.put_nowait(None)
+
+    async def get(self) -> WatchItem:
+        """Wait for the next change; None means the watcher overflowed."""
+        return await self._queue.get()
+
+
+class ChangeBroadcaster:
+    """Shares a single change-bus subscription among any number of watchers."""
+
+    def __init__(self, queue_size: int = 1000):
+        """Initialize broadcaster."""
+        self.queue_size = queue_size
+        self._subscriptions: set[WatchSubscription] = set()
+
+    def __len__(self) -> int:
+        """Number of connected watchers."""
+        return len(self._subscriptions)
+
+    def subscribe(self, matches: ChangeFilter | None = None) -> WatchSubscription:
+        """Register a watcher receiving the changes accepted by ``matches``."""
+        subscription = WatchSubscription(matches, self.queue_size)
+        self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: WatchSubscription) -> None:
+        """Remove a watcher."""
+        self._subscriptions.discard(subscription)
+
+    def deliver(self, change: ConfigurationChange) -> None:
+        """Offer a change to every watcher."""
+        for subscription in list(self._subscriptions):
+            subscription.offer(change)
+
+
+@lru_cache
+def get_change_broadcaster() -> ChangeBroadcaster:
+    """Get the process-wide broadcaster, subscribed to the change bus."""
+    broadcaster = ChangeBroadcaster(queue_size=get_settings().watch_queue_size)
+    get_change_bus().subscribe(broadcaster.deliver)
+    return broadcaster
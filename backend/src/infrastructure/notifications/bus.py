@@ -0,0 +1,71 @@
+"""In-process fan-out of configuration changes."""
+
+from collections.abc import Awaitable, Callable, Sequence
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.notifications.events import ConfigurationChange
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+ChangeHandler = Callable[[ConfigurationChange], None]
+ChangeRelay = Callable[[AsyncSession, Sequence[ConfigurationChange]], Awaitable[None]]
+
+
+class ChangeBus:
+    """Delivers configuration changes to in-process subscribers.
+
+    Writes made by this process are delivered synchronously on ``publish``. When a
+    relay is attached (see ``PostgresChangeListener``), writers also ``stage`` their
+    changes inside the writing transaction, so the other workers receive them exactly
+    when it commits and feed them back in through ``deliver``.
+    """
+
+    def __init__(self):
+        """Initialize bus."""
+        self._handlers: list[ChangeHandler] = []
+        self.relay: ChangeRelay | None = None
+
+    def subscribe(self, handler: ChangeHandler) -> None:
+        """Register a handler for every change."""
+        if handler not in self._handlers:
+            self._handlers.append(handler)
+
+    def unsubscribe(self, handler: ChangeHandler) -> None:
+        """Remove a previously registered handler."""
+        if handler in self._handlers:
+            self._handlers.remove(handler)
+
+    async def stage(self, session: AsyncSession, changes: Sequence[ConfigurationChange]) -> None:
+        """Queue changes for the other workers in the session's open transaction.
+
+        Errors propagate so the write is rolled back rather than committed unannounced.
+        """
+        if changes and self.relay is not None:
+            await self.relay(session, changes)
+
+    async def publish(self, change: ConfigurationChange) -> None:
+        """Publish a change committed by this process."""
+        await self.publish_many([change])
+
+    async def publish_many(self, changes: Sequence[ConfigurationChange]) -> None:
+        """Deliver the changes of one committed transaction to this process's subscribers."""
+        for change in changes:
+            self.deliver(change)
+
+    def deliver(self, change: ConfigurationChange) -> None:
+        """Hand a change to every subscriber."""
+        for handler in list(self._handlers):
+            try:
+                handler(change)
+            except Exception as e:
+                logger.error("Error handling configuration change", error=str(e), op=change.op)
+
+
+_bus = ChangeBus()
+
+
+def get_change_bus() -> ChangeBus:
+    """Get the process-wide change bus."""
+    return _bus
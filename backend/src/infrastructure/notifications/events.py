@@ -0,0 +1,67 @@
+"""Configuration change events."""
+
+import json
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Literal
+from uuid import UUID
+
+# Identifies this process so relayed notifications it sent itself can be skipped
+INSTANCE_ID = uuid.uuid4().hex
+
+ChangeOperation = Literal["create", "update", "delete", "reset"]
+
+
+@dataclass(frozen=True)
+class ConfigurationChange:
+    """A committed write to a configuration.
+
+    ``revision`` is the change-log revision the write was recorded under, and
+    ``previous_parent_id`` the parent the configuration had before a write moved it.
+
+    ``reset`` carries no configuration and tells subscribers that changes may have been
+    missed (for example after the listener lost its connection) and all derived state
+    must be dropped.
+    """
+
+    op: ChangeOperation
+    config_id: UUID | None = None
+    key: str | None = None
+    parent_config_id: UUID | None = None
+    previous_parent_id: UUID | None = None
+    revision: int | None = None
+    origin: str = field(default=INSTANCE_ID)
+
+    @classmethod
+    def reset(cls) -> "ConfigurationChange":
+        """Build a reset event."""
+        return cls(op="reset")
+
+    def to_payload(self) -> str:
+        """Serialize for a NOTIFY payload."""
+        return json.dumps(
+            {
+                "op": self.op,
+                "id": str(self.config_id) if self.config_id else None,
+                "key": self.key,
+                "parent_config_id": str(self.parent_config_id) if self.parent_config_id else None,
+                "previous_parent_id": str(self.previous_parent_id) if self.previous_parent_id else None,
+                "revision": self.revision,
+                "origin": self.origin,
+            },
+            separators=(",", ":"),
+        )
+
+    @classmethod
+    def from_payload(cls, payload: str) -> "ConfigurationChange":
+        """Deserialize a NOTIFY payload."""
+        data: dict[str, Any] = json.loads(payload)
+        return cls(
+            op=data["op"],
+            config_id=UUID(data["id"]) if data.get("id") else None,
+            key=data.get("key"),
+            parent_config_id=UUID(data["parent_config_id"]) if data.get("parent_config_id") else None,
+            previous_parent_id=UUID(data["previous_parent_id"]) if data.get("previous_parent_id") else None,
+            revision=data.get("revision"),
+            origin=data.get("origin", ""),
+        )
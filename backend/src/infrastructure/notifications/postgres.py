@@ -0,0 +1,103 @@
+"""Cross-process change relay over PostgreSQL LISTEN/NOTIFY."""
+
+import asyncio
+from collections.abc import Sequence
+
+import asyncpg  # type: ignore[import-untyped]
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from src.infrastructure.notifications.bus import ChangeBus
+from src.infrastructure.notifications.events import INSTANCE_ID, ConfigurationChange
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class PostgresChangeListener:
+    """Relays local changes with ``pg_notify`` and delivers peers' changes to the bus.
+
+    ``pg_notify`` runs inside the writing transaction, so PostgreSQL delivers the
+    notification if and only if the write commits.
+
+    One dedicated connection per worker holds the LISTEN. If that connection drops,
+    notifications may have been missed, so a ``reset`` is delivered once it reconnects.
+    """
+
+    def __init__(
+        self,
+        bus: ChangeBus,
+        engine: AsyncEngine,
+        channel: str,
+        reconnect_delay: float = 1.0,
+        max_reconnect_delay: float = 30.0,
+    ):
+        """Initialize listener."""
+        self.bus = bus
+        self.engine = engine
+        self.channel = channel
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self._dsn = make_url(engine.url).set(drivername="postgresql").render_as_string(hide_password=False)
+        self._task: asyncio.Task | None = None
+
+    async def start(self) -> None:
+        """Attach to the bus and start listening in the background."""
+        self.bus.relay = self.notify
+        self._task = asyncio.create_task(self._run(), name="configuration-change-listener")
+
+    async def stop(self) -> None:
+        """Stop listening and detach from the bus."""
+        if self.bus.relay == self.notify:
+            self.bus.relay = None
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def notify(self, session: AsyncSession, changes: Sequence[ConfigurationChange]) -> None:
+        """Queue changes for every listening worker in a single round-trip, sent on commit."""
+        await session.execute(
+            text("SELECT pg_notify(:channel, payload) FROM unnest(CAST(:payloads AS text[])) AS payload"),
+            {"channel": self.channel, "payloads": [change.to_payload() for change in changes]},
+        )
+
+    def _on_notification(self, connection, pid, channel, payload: str) -> None:
+        try:
+            change = ConfigurationChange.from_payload(payload)
+        except (ValueError, KeyError) as e:
+            logger.error("Invalid configuration change payload", error=str(e))
+            return
+        if change.origin != INSTANCE_ID:
+            self.bus.deliver(change)
+
+    async def _run(self) -> None:
+        delay = self.reconnect_delay
+        reconnecting = False
+        while True:
+            lost = asyncio.Event()
+            conn = None
+            try:
+                conn = await asyncpg.connect(self._dsn)
+                conn.add_termination_listener(lambda _conn: lost.set())
+                await conn.add_listener(self.channel, self._on_notification)
+                if reconnecting:
+                    # Anything written while we were not listening is unknown to us
+                    self.bus.deliver(ConfigurationChange.reset())
+                reconnecting = True
+                logger.info("Listening for configuration changes", channel=self.channel)
+                delay = self.reconnect_delay
+                await lost.wait()
+                logger.warning("Change listener connection lost")
+            except Exception as e:
+                # Any failure in the cycle retries; giving up would end invalidation for good
+                logger.error("Change listener failed", error=str(e), retry_in=delay)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.max_reconnect_delay)
+            finally:
+                if conn is not None and not conn.is_closed():
+                    await conn.close()
@@ -3,11 +3,14 @@
 from contextlib import asynccontextmanager
 from typing import Any, AsyncGenerator, Dict
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 
 from src.configs import get_settings
+from src.infrastructure.cache import get_configuration_cache, get_snapshot_cache
+from src.infrastructure.database import connection
 from src.infrastructure.database.connection import initialize_database
+from src.infrastructure.notifications import get_change_bus
 from src.apis.routers import configurations
 from src.utils.logging import setup_logging, get_logger
 
@@ -23,13 +26,35 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger.info("Starting Configuration Engine Backend", environment=settings.environment)
 
     # Initialize database
-    await initialize_database(settings.database_url)
+    engine = await initialize_database(settings.database_url)
     logger.info("Database initialized")
 
+    # Listen for writes made by other workers so per-process caches stay correct
+    listener = None
+    if settings.change_notifications_enabled and engine.dialect.name == "postgresql":
+        from src.infrastructure.notifications.postgres import PostgresChangeListener
+
+        listener = PostgresChangeListener(
+            get_change_bus(),
+            engine,
+            channel=settings.change_notifications_channel,
+        )
+        await listener.start()
+
+    # Otherwise the graph is loaded by the first request that needs it
+    if settings.graph_enabled and settings.graph_preload_enabled:
+        from src.application.services.configuration_service import ConfigurationService
+
+        assert connection.async_session is not None
+        async with connection.async_session() as session:
+            await ConfigurationService(session).get_graph()
+
     yield
 
     # Shutdown
     logger.info("Configuration Engine Backend shutting down")
+    if listener:
+        await listener.stop()
 
 
 # Create FastAPI application
@@ -49,6 +74,24 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Only needed when GET endpoints can be served by a replica
+if settings.read_database_urls:
+    from src.apis.consistency import ReadYourWritesMiddleware
+
+    app.add_middleware(ReadYourWritesMiddleware)
+
+# Outermost, so latency includes every other middleware
+if settings.metrics_enabled:
+    from src.apis.metrics import MetricsMiddleware
+    from src.infrastructure.metrics import get_metrics_registry
+
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics() -> Response:
+        """Request, database, and serialization metrics in the Prometheus text format."""
+        return Response(get_metrics_registry().render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
 # Include routers
 app.include_router(configurations.router, prefix="/api/v1")
 
@@ -69,6 +112,16 @@ async def health_check() -> Dict[str, str]:
     return {"status": "healthy"}
 
 
+@app.get("/health/cache")
+async def cache_stats() -> Dict[str, Any]:
+    """Configuration cache counters."""
+    return {
+        "enabled": settings.cache_enabled,
+        **get_configuration_cache().stats(),
+        "snapshots": {"enabled": settings.snapshot_cache_enabled, **get_snapshot_cache().stats()},
+    }
+
+
 if __name__ == "__main__":
     import uvicorn
 
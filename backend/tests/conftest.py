@@ -5,10 +5,23 @@ from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 
 from src.main import app
+from src.infrastructure.cache import get_configuration_cache, get_configuration_graph, get_snapshot_cache
 from src.infrastructure.database.connection import get_session
 from src.infrastructure.database.models import Base
 
 
+@pytest.fixture(autouse=True)
+def clear_configuration_cache():
+    """Start every test with empty process-wide configuration caches and graph."""
+    get_configuration_cache().clear()
+    get_configuration_graph().invalidate()
+    get_snapshot_cache().clear()
+    yield
+    get_configuration_cache().clear()
+    get_configuration_graph().invalidate()
+    get_snapshot_cache().clear()
+
+
 @pytest.fixture
 async def test_db_session():
     """Create test database session."""
@@ -1,8 +1,19 @@
 """Integration tests for Configuration API."""
 
+import gzip
+import json
+from functools import partialmethod
+from uuid import UUID, uuid4
+
 import pytest
 from httpx import AsyncClient
 from fastapi import status
+from sqlalchemy import text
+
+from src.apis.routers.configurations import _watch_stream
+from src.application.services.configuration_service import ConfigurationService
+from src.infrastructure.metrics import instrument_engine
+from src.infrastructure.notifications import get_change_broadcaster
 
 
 @pytest.mark.asyncio
@@ -29,6 +40,48 @@ class TestConfigurationsAPI:
         assert data["label"] == "Maximum Retries"
         assert "id" in data
 
+    async def test_json_columns_stored_natively(self, client: AsyncClient, test_db_session):
+        """Test that JSON columns hold documents rather than JSON-encoded strings."""
+        payload = {
+            "key": "NATIVE_JSON",
+            "label": "Native JSON",
+            "data_type": "number",
+            "validation_rules": [{"rule_type": "min", "value": 1}],
+            "parent_conditions": [{"operator": ">", "value": "5", "default_value": "2"}],
+            "translations": [{"language": "ar", "label": "Native"}],
+        }
+        response = await client.post("/api/v1/configurations/", json=payload)
+        assert response.json()["validation_rules"] == [{"rule_type": "min", "value": 1}]
+
+        result = await test_db_session.execute(
+            text(
+                "SELECT json_type(validation_rules), json_type(parent_conditions), json_type(translations) "
+                "FROM configurations WHERE key = 'NATIVE_JSON'"
+            )
+        )
+
+        assert tuple(result.one()) == ("array", "array", "array")
+
+    async def test_legacy_json_string_columns_are_decoded(self, client: AsyncClient, test_db_session):
+        """Test that rows still holding JSON-encoded strings read like native ones."""
+        created = (
+            await client.post("/api/v1/configurations/", json={"key": "LEGACY", "label": "L", "data_type": "number"})
+        ).json()
+        await test_db_session.execute(
+            text(
+                "UPDATE configurations SET validation_rules = json_quote(:rules), "
+                "updated_at = '2030-01-01 00:00:00' WHERE key = 'LEGACY'"
+            ),
+            {"rules": json.dumps([{"rule_type": "min", "value": 1}])},
+        )
+        await test_db_session.commit()
+
+        listed = (await client.get("/api/v1/configurations/")).json()["items"]
+        fields = (await client.get(f"/api/v1/configurations/by-id/{created['id']}?fields=validation_rules")).json()
+
+        assert listed[0]["validation_rules"] == [{"rule_type": "min", "value": 1}]
+        assert fields["validation_rules"] == [{"rule_type": "min", "value": 1}]
+
     async def test_get_configuration(self, client: AsyncClient):
         """Test getting a configuration."""
         # Create first
@@ -66,6 +119,60 @@ class TestConfigurationsAPI:
         assert data["total"] == 3
         assert len(data["items"]) == 3
 
+    async def test_list_configurations_cursor_pagination(self, client: AsyncClient):
+        """Test keyset pagination walks every configuration exactly once in key order."""
+        for i in (3, 0, 4, 1, 2):
+            payload = {
+                "key": f"PAGED_{i}",
+                "label": f"Paged {i}",
+                "data_type": "string",
+            }
+            await client.post("/api/v1/configurations/", json=payload)
+
+        seen = []
+        response = await client.get("/api/v1/configurations/?limit=2")
+        data = response.json()
+        seen.extend(item["key"] for item in data["items"])
+        while data["next_cursor"]:
+            response = await client.get(f"/api/v1/configurations/?limit=2&cursor={data['next_cursor']}")
+            assert response.status_code == status.HTTP_200_OK
+            data = response.json()
+            assert data["total"] == 5
+            seen.extend(item["key"] for item in data["items"])
+
+        assert seen == [f"PAGED_{i}" for i in range(5)]
+
+    async def test_list_configurations_invalid_cursor(self, client: AsyncClient):
+        """Test that a malformed cursor is rejected."""
+        response = await client.get("/api/v1/configurations/?cursor=not-a-cursor")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    async def test_get_configuration_served_from_cache(self, client: AsyncClient):
+        """Test that repeated reads hit the cache and updates invalidate it."""
+        create_payload = {
+            "key": "CACHED_CONFIG",
+            "label": "Cached Config",
+            "data_type": "string",
+        }
+        create_response = await client.post("/api/v1/configurations/", json=create_payload)
+        config_id = create_response.json()["id"]
+
+        before = (await client.get("/health/cache")).json()
+        await client.get(f"/api/v1/configurations/by-id/{config_id}")
+        await client.get(f"/api/v1/configurations/by-id/{config_id}")
+        stats = (await client.get("/health/cache")).json()
+        # A cold read misses on the version check and again on the load; a warm one
+        # only checks the version and is served from the encoded snapshot
+        assert stats["by_id"]["hits"] - before["by_id"]["hits"] == 1
+        assert stats["by_id"]["misses"] - before["by_id"]["misses"] == 2
+        assert stats["snapshots"]["hits"] - before["snapshots"]["hits"] == 1
+
+        await client.put(f"/api/v1/configurations/by-id/{config_id}", json={"label": "Changed"})
+        response = await client.get(f"/api/v1/configurations/by-id/{config_id}")
+
+        assert response.json()["label"] == "Changed"
+
     async def test_update_configuration(self, client: AsyncClient):
         """Test updating a configuration."""
         # Create
@@ -109,6 +216,27 @@ class TestConfigurationsAPI:
         get_response = await client.get(f"/api/v1/configurations/{config_id}")
         assert get_response.status_code == status.HTTP_404_NOT_FOUND
 
+    async def test_metrics(self, client: AsyncClient, test_db_session):
+        """Test that requests report latency and DB queries per route template."""
+        instrument_engine(test_db_session.bind)
+        created = await client.post(
+            "/api/v1/configurations/", json={"key": "METRIC", "label": "Metric", "data_type": "string"}
+        )
+        await client.get(f"/api/v1/configurations/by-id/{created.json()['id']}")
+        await client.get("/no-such-path")
+
+        response = await client.get("/metrics")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"].startswith("text/plain")
+        labels = 'method="GET",route="/api/v1/configurations/by-id/{config_id}"'
+        lines = dict(line.rsplit(" ", 1) for line in response.text.splitlines() if not line.startswith("#"))
+        assert int(lines[f"http_request_duration_seconds_count{{{labels}}}"]) >= 1
+        assert float(lines[f"http_request_db_queries_sum{{{labels}}}"]) >= 1
+        assert f"http_request_serialization_seconds_sum{{{labels}}}" in lines
+        assert 'http_requests_total{method="GET",route="<unmatched>",status="404"}' in lines
+        assert int(lines['db_query_duration_seconds_count{pool="primary"}']) >= 1
+
     async def test_health_check(self, client: AsyncClient):
         """Test health check endpoint."""
         response = await client.get("/health")
@@ -193,3 +321,748 @@ class TestConfigurationsAPI:
 
         # Config B should see C (unrelated config)
         assert config_c_id in available_ids_b
+
+    async def test_parent_options_paginated_over_deep_tree(self, client: AsyncClient):
+        """Test that parent options exclude a deep subtree and page with a cursor."""
+        parent_id = None
+        chain_ids = []
+        for depth in range(5):
+            payload = {
+                "key": f"CHAIN_{depth}",
+                "label": f"Chain {depth}",
+                "data_type": "string",
+                "parent_config_id": parent_id,
+            }
+            response = await client.post("/api/v1/configurations/", json=payload)
+            parent_id = response.json()["id"]
+            chain_ids.append(parent_id)
+        for key in ("OTHER_A", "OTHER_B"):
+            await client.post("/api/v1/configurations/", json={"key": key, "label": key, "data_type": "string"})
+
+        keys = []
+        url = f"/api/v1/configurations/parent-options/by/{chain_ids[1]}?limit=1"
+        response = await client.get(url)
+        data = response.json()
+        assert data["total"] == 3
+        keys.extend(item["key"] for item in data["items"])
+        while data["next_cursor"]:
+            data = (await client.get(f"{url}&cursor={data['next_cursor']}")).json()
+            keys.extend(item["key"] for item in data["items"])
+
+        assert keys == ["CHAIN_0", "OTHER_A", "OTHER_B"]
+
+    async def test_resolve_walks_parent_conditions(self, client: AsyncClient):
+        """Test that resolution applies parent conditions through the whole chain."""
+        tier = await client.post(
+            "/api/v1/configurations/",
+            json={"key": "TIER", "label": "Tier", "data_type": "number", "default_value": "1"},
+        )
+        limit = await client.post(
+            "/api/v1/configurations/",
+            json={
+                "key": "LIMIT",
+                "label": "Limit",
+                "data_type": "string",
+                "default_value": "low",
+                "parent_config_id": tier.json()["id"],
+                "parent_conditions": [{"operator": ">=", "value": "3", "default_value": "high"}],
+            },
+        )
+        await client.post(
+            "/api/v1/configurations/",
+            json={
+                "key": "BURST",
+                "label": "Burst",
+                "data_type": "number",
+                "default_value": "10",
+                "parent_config_id": limit.json()["id"],
+                "parent_conditions": [{"operator": "=", "value": "high", "default_value": "100"}],
+            },
+        )
+
+        default = await client.post("/api/v1/configurations/resolve", json={"keys": ["BURST", "NOPE"]})
+        boosted = await client.post(
+            "/api/v1/configurations/resolve",
+            json={"keys": ["BURST", "LIMIT"], "context": {"TIER": 5}},
+        )
+
+        assert default.status_code == status.HTTP_200_OK
+        assert default.json()["values"]["BURST"] == {"value": "10", "source": "default"}
+        assert default.json()["missing"] == ["NOPE"]
+        assert boosted.json()["values"] == {
+            "BURST": {"value": "100", "source": "condition"},
+            "LIMIT": {"value": "high", "source": "condition"},
+        }
+
+    @pytest.mark.parametrize("graph_enabled", [True, False])
+    async def test_update_rejects_parent_cycle(self, client: AsyncClient, monkeypatch, graph_enabled):
+        """Test that a configuration cannot be moved under its own descendant."""
+        from src.configs import get_settings
+
+        monkeypatch.setattr(get_settings(), "graph_enabled", graph_enabled)
+        parent = await client.post(
+            "/api/v1/configurations/", json={"key": "CYCLE_A", "label": "A", "data_type": "string"}
+        )
+        child = await client.post(
+            "/api/v1/configurations/",
+            json={"key": "CYCLE_B", "label": "B", "data_type": "string", "parent_config_id": parent.json()["id"]},
+        )
+
+        response = await client.put(
+            f"/api/v1/configurations/by-id/{parent.json()['id']}",
+            json={"parent_config_id": child.json()["id"]},
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    async def test_bulk_operations_single_transaction(self, client: AsyncClient):
+        """Test that a bulk batch creates, updates, and deletes with per-item results."""
+        existing = await client.post(
+            "/api/v1/configurations/", json={"key": "BULK_OLD", "label": "Old", "data_type": "string"}
+        )
+        doomed = await client.post(
+            "/api/v1/configurations/", json={"key": "BULK_GONE", "label": "Gone", "data_type": "string"}
+        )
+
+        response = await client.post(
+            "/api/v1/configurations/bulk",
+            json={
+                "operations": [
+                    {"op": "create", "key": "BULK_NEW", "label": "New", "data_type": "number", "default_value": "1"},
+                    {"op": "upsert", "key": "BULK_OLD", "label": "Renamed"},
+                    {
+                        "op": "upsert",
+                        "key": "BULK_CHILD",
+                        "label": "Child",
+                        "data_type": "string",
+                        "parent_config_id": existing.json()["id"],
+                    },
+                    {"op": "delete", "key": "BULK_GONE"},
+                ]
+            },
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["committed"] is True
+        assert [r["status"] for r in data["results"]] == ["created", "updated", "created", "deleted"]
+        assert data["results"][1]["id"] == existing.json()["id"]
+
+        updated = await client.get(f"/api/v1/configurations/by-id/{existing.json()['id']}")
+        assert updated.json()["label"] == "Renamed"
+        assert updated.json()["data_type"] == "string"
+        gone = await client.get(f"/api/v1/configurations/by-id/{doomed.json()['id']}")
+        assert gone.status_code == status.HTTP_404_NOT_FOUND
+        listing = await client.get("/api/v1/configurations/?limit=10")
+        assert [item["key"] for item in listing.json()["items"]] == ["BULK_CHILD", "BULK_NEW", "BULK_OLD"]
+
+    async def test_bulk_delete_detaches_children(self, client: AsyncClient):
+        """Test that a bulk delete turns children into roots and logs them as updated."""
+        parent = (
+            await client.post(
+                "/api/v1/configurations/", json={"key": "BULK_PARENT", "label": "P", "data_type": "string"}
+            )
+        ).json()
+        await client.post(
+            "/api/v1/configurations/",
+            json={"key": "BULK_KID", "label": "K", "data_type": "string", "parent_config_id": parent["id"]},
+        )
+        baseline = (await client.get("/api/v1/configurations/changes")).json()
+
+        response = await client.post(
+            "/api/v1/configurations/bulk", json={"operations": [{"op": "delete", "key": "BULK_PARENT"}]}
+        )
+        delta = (await client.get(f"/api/v1/configurations/changes?since={baseline['revision']}")).json()
+
+        assert response.json()["committed"] is True
+        assert [(c["key"], c["op"]) for c in delta["changes"]] == [("BULK_PARENT", "delete"), ("BULK_KID", "update")]
+        assert delta["changes"][1]["configuration"]["parent_config_id"] is None
+
+    async def test_bulk_atomic_rejects_whole_batch(self, client: AsyncClient):
+        """Test that one invalid operation rejects an atomic batch."""
+        await client.post("/api/v1/configurations/", json={"key": "BULK_TAKEN", "label": "T", "data_type": "string"})
+
+        response = await client.post(
+            "/api/v1/configurations/bulk",
+            json={
+                "operations": [
+                    {"op": "create", "key": "BULK_FRESH", "label": "Fresh", "data_type": "string"},
+                    {"op": "create", "key": "BULK_TAKEN", "label": "Again", "data_type": "string"},
+                    {"op": "update", "key": "BULK_MISSING", "label": "Missing"},
+                ]
+            },
+        )
+
+        data = response.json()
+        assert data["committed"] is False
+        assert [r["status"] for r in data["results"]] == ["skipped", "error", "error"]
+        listing = await client.get("/api/v1/configurations/")
+        assert listing.json()["total"] == 1
+
+    @pytest.mark.parametrize("compressed", [False, True])
+    async def test_export_streams_ndjson(self, client: AsyncClient, compressed: bool):
+        """Test that export emits one JSON document per configuration in key order."""
+        for key in ("EXPORT_B", "EXPORT_A", "EXPORT_C"):
+            await client.post(
+                "/api/v1/configurations/",
+                json={
+                    "key": key,
+                    "label": key,
+                    "data_type": "string",
+                    "translations": [{"language": "en", "label": key}],
+                },
+            )
+
+        response = await client.get(f"/api/v1/configurations/export?gzip={str(compressed).lower()}")
+
+        assert response.status_code == status.HTTP_200_OK
+        body = gzip.decompress(response.content) if compressed else response.content
+        lines = [json.loads(line) for line in body.decode().splitlines()]
+        assert [line["key"] for line in lines] == ["EXPORT_A", "EXPORT_B", "EXPORT_C"]
+        assert lines[0]["translations"] == [{"description": None, "label": "EXPORT_A", "language": "en"}]
+
+    async def test_import_round_trips_export(self, client: AsyncClient):
+        """Test that a gzipped export imports back with IDs and parents intact."""
+        parent = await client.post(
+            "/api/v1/configurations/", json={"key": "IMPORT_PARENT", "label": "Parent", "data_type": "number"}
+        )
+        await client.post(
+            "/api/v1/configurations/",
+            json={
+                "key": "IMPORT_CHILD",
+                "label": "Child",
+                "data_type": "string",
+                "parent_config_id": parent.json()["id"],
+                "parent_conditions": [{"operator": ">", "value": "1", "default_value": "x"}],
+            },
+        )
+        snapshot = (await client.get("/api/v1/configurations/export?gzip=true")).content
+        exported = gzip.decompress(snapshot).decode().splitlines()
+        for item in (await client.get("/api/v1/configurations/")).json()["items"]:
+            await client.delete(f"/api/v1/configurations/by-id/{item['id']}")
+
+        response = await client.post("/api/v1/configurations/import", content=snapshot)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {"received": 2, "imported": 2, "failed": 0, "errors": []}
+        restored = (await client.get("/api/v1/configurations/export")).content.decode().splitlines()
+        for before, after in zip(exported, restored):
+            before, after = json.loads(before), json.loads(after)
+            assert {k: v for k, v in before.items() if not k.endswith("_at")} == {
+                k: v for k, v in after.items() if not k.endswith("_at")
+            }
+
+    async def test_import_reports_invalid_lines(self, client: AsyncClient):
+        """Test that invalid lines are reported while valid ones are imported."""
+        await client.post(
+            "/api/v1/configurations/", json={"key": "IMPORT_KEEP", "label": "Original", "data_type": "string"}
+        )
+        body = "\n".join(
+            [
+                json.dumps({"key": "IMPORT_KEEP", "label": "Replaced", "data_type": "string"}),
+                "{not json",
+                "",
+                json.dumps({"key": "IMPORT_NEW", "data_type": "string"}),
+                json.dumps({"key": "IMPORT_OK", "label": "Ok", "data_type": "string"}),
+            ]
+        )
+
+        response = await client.post("/api/v1/configurations/import?on_conflict=skip", content=body.encode())
+
+        data = response.json()
+        assert data["received"] == 4
+        assert data["imported"] == 1
+        assert [e["line"] for e in data["errors"]] == [2, 4]
+        keys = {i["key"]: i["label"] for i in (await client.get("/api/v1/configurations/")).json()["items"]}
+        assert keys == {"IMPORT_KEEP": "Original", "IMPORT_OK": "Ok"}
+
+    async def test_import_reports_conflicting_records(self, client: AsyncClient):
+        """Test that records clashing with stored rows are reported per line instead of failing the import."""
+        taken = (
+            await client.post(
+                "/api/v1/configurations/", json={"key": "IMPORT_TAKEN", "label": "T", "data_type": "string"}
+            )
+        ).json()
+        child = (
+            await client.post(
+                "/api/v1/configurations/",
+                json={"key": "IMPORT_LEAF", "label": "L", "data_type": "string", "parent_config_id": taken["id"]},
+            )
+        ).json()
+        body = "\n".join(
+            [
+                json.dumps({"id": taken["id"], "key": "IMPORT_OTHER", "label": "O", "data_type": "string"}),
+                json.dumps(
+                    {"key": "IMPORT_ORPHAN", "label": "O", "data_type": "string", "parent_config_id": str(uuid4())}
+                ),
+                json.dumps(
+                    {
+                        "key": "IMPORT_BAD_DEFAULT",
+                        "label": "B",
+                        "data_type": "number",
+                        "default_value": "5",
+                        "validation_rules": [{"rule_type": "max", "value": 2}],
+                    }
+                ),
+                json.dumps(
+                    {"key": "IMPORT_TAKEN", "label": "T", "data_type": "string", "parent_config_id": child["id"]}
+                ),
+                json.dumps({"key": "IMPORT_FINE", "label": "F", "data_type": "string"}),
+            ]
+        )
+
+        response = await client.post("/api/v1/configurations/import", content=body.encode())
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert (data["received"], data["imported"], data["failed"]) == (5, 1, 4)
+        assert [(e["line"], e["error"]) for e in data["errors"]] == [
+            (1, f"ID {taken['id']} already belongs to configuration 'IMPORT_TAKEN'"),
+            (2, "Parent configuration not found"),
+            (3, "Invalid default_value: Must be at most 2"),
+            (4, "A configuration cannot be its own ancestor"),
+        ]
+        keys = {i["key"] for i in (await client.get("/api/v1/configurations/")).json()["items"]}
+        assert keys == {"IMPORT_TAKEN", "IMPORT_LEAF", "IMPORT_FINE"}
+
+    async def test_import_waits_for_parents_in_later_batches(self, client: AsyncClient, monkeypatch):
+        """Test that a child listed before its parent is written once the parent has been imported."""
+        monkeypatch.setattr(
+            ConfigurationService,
+            "import_configurations",
+            partialmethod(ConfigurationService.import_configurations, batch_size=1),
+        )
+        parent_id, child_id = str(uuid4()), str(uuid4())
+        existing = (
+            await client.post(
+                "/api/v1/configurations/", json={"key": "IMPORT_ROOT", "label": "R", "data_type": "string"}
+            )
+        ).json()
+        body = "\n".join(
+            [
+                json.dumps(
+                    {
+                        "id": child_id,
+                        "key": "IMPORT_KID",
+                        "label": "K",
+                        "data_type": "string",
+                        "parent_config_id": parent_id,
+                    }
+                ),
+                # Stored under the existing row's ID, which the child must be pointed at
+                json.dumps({"id": parent_id, "key": "IMPORT_ROOT", "label": "Root", "data_type": "string"}),
+            ]
+        )
+
+        response = await client.post("/api/v1/configurations/import", content=body.encode())
+
+        assert response.json() == {"received": 2, "imported": 2, "failed": 0, "errors": []}
+        kid = (await client.get(f"/api/v1/configurations/by-id/{child_id}")).json()
+        assert kid["parent_config_id"] == existing["id"]
+
+    async def test_large_integer_rule_value_round_trips(self, client: AsyncClient):
+        """Test that a rule value beyond 64 bits is listed back instead of breaking the list."""
+        rules = [{"rule_type": "max", "value": 2**70}]
+        created = await client.post(
+            "/api/v1/configurations/",
+            json={"key": "BIG_MAX", "label": "Big", "data_type": "number", "validation_rules": rules},
+        )
+
+        response = await client.get("/api/v1/configurations/")
+
+        assert created.status_code == status.HTTP_201_CREATED
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["items"][0]["validation_rules"] == rules
+
+    async def test_create_rejects_non_finite_rule_value(self, client: AsyncClient):
+        """Test that a NaN rule value, which responses cannot encode, is rejected on write."""
+        body = '{"key": "NAN_MAX", "label": "NaN", "data_type": "number", "validation_rules": [{"rule_type": "max", "value": NaN}]}'
+
+        response = await client.post(
+            "/api/v1/configurations/", content=body, headers={"content-type": "application/json"}
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json()["detail"] == "Invalid max rule: nan is not a finite number"
+
+    async def test_get_configuration_not_modified(self, client: AsyncClient):
+        """Test that a matching If-None-Match is answered with 304 until the configuration changes."""
+        created = (
+            await client.post(
+                "/api/v1/configurations/", json={"key": "ETAG_KEY", "label": "Original", "data_type": "string"}
+            )
+        ).json()
+        url = f"/api/v1/configurations/by-id/{created['id']}"
+
+        first = await client.get(url)
+        etag = first.headers["etag"]
+        revalidated = await client.get(url, headers={"If-None-Match": f'W/{etag}, "other"'})
+
+        assert revalidated.status_code == status.HTTP_304_NOT_MODIFIED
+        assert revalidated.headers["etag"] == etag
+        assert revalidated.content == b""
+
+        await client.put(url, json={"label": "Changed"})
+        changed = await client.get(url, headers={"If-None-Match": etag})
+
+        assert changed.status_code == status.HTTP_200_OK
+        assert changed.headers["etag"] != etag
+        assert changed.json()["label"] == "Changed"
+
+    async def test_get_configuration_if_none_match_missing(self, client: AsyncClient):
+        """Test that revalidating a missing configuration returns 404."""
+        response = await client.get(f"/api/v1/configurations/by-id/{uuid4()}", headers={"If-None-Match": '"x"'})
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    async def test_list_configurations_not_modified(self, client: AsyncClient):
+        """Test that list ETags depend on the query and change on writes."""
+        await client.post(
+            "/api/v1/configurations/", json={"key": "ETAG_LIST_A", "label": "List", "data_type": "string"}
+        )
+        etag = (await client.get("/api/v1/configurations/?limit=5")).headers["etag"]
+
+        assert (await client.get("/api/v1/configurations/?limit=5", headers={"If-None-Match": etag})).status_code == 304
+        assert (await client.get("/api/v1/configurations/?limit=6", headers={"If-None-Match": etag})).status_code == 200
+
+        await client.post(
+            "/api/v1/configurations/", json={"key": "ETAG_LIST_B", "label": "List", "data_type": "string"}
+        )
+        response = await client.get("/api/v1/configurations/?limit=5", headers={"If-None-Match": etag})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["total"] == 2
+
+    async def test_changes_since_revision(self, client: AsyncClient):
+        """Test that the change feed returns only deltas, with tombstones for deletes."""
+        parent = (
+            await client.post(
+                "/api/v1/configurations/", json={"key": "FEED_PARENT", "label": "P", "data_type": "string"}
+            )
+        ).json()
+        child = (
+            await client.post(
+                "/api/v1/configurations/",
+                json={"key": "FEED_CHILD", "label": "C", "data_type": "string", "parent_config_id": parent["id"]},
+            )
+        ).json()
+        baseline = (await client.get("/api/v1/configurations/changes")).json()
+
+        assert [c["key"] for c in baseline["changes"]] == ["FEED_PARENT", "FEED_CHILD"]
+        assert baseline["has_more"] is False
+
+        await client.post("/api/v1/configurations/", json={"key": "FEED_OTHER", "label": "O", "data_type": "string"})
+        await client.put(f"/api/v1/configurations/by-id/{child['id']}", json={"label": "C2"})
+        await client.delete(f"/api/v1/configurations/by-id/{parent['id']}")
+
+        delta = (await client.get(f"/api/v1/configurations/changes?since={baseline['revision']}")).json()
+        changes = {c["key"]: c for c in delta["changes"]}
+
+        assert list(changes) == ["FEED_OTHER", "FEED_PARENT", "FEED_CHILD"]
+        assert changes["FEED_PARENT"]["op"] == "delete"
+        assert changes["FEED_PARENT"]["configuration"] is None
+        assert changes["FEED_CHILD"]["configuration"]["label"] == "C2"
+        assert changes["FEED_CHILD"]["configuration"]["parent_config_id"] is None
+        assert (await client.get(f"/api/v1/configurations/changes?since={delta['revision']}")).json()["changes"] == []
+
+    async def test_changes_pages_with_has_more(self, client: AsyncClient):
+        """Test that a limited change-feed page reports more entries and resumes after them."""
+        for key in ("FEED_A", "FEED_B", "FEED_C"):
+            await client.post("/api/v1/configurations/", json={"key": key, "label": key, "data_type": "string"})
+
+        first = (await client.get("/api/v1/configurations/changes?limit=2")).json()
+        rest = (await client.get(f"/api/v1/configurations/changes?limit=2&since={first['revision']}")).json()
+
+        assert first["has_more"] is True
+        assert [c["key"] for c in first["changes"] + rest["changes"]] == ["FEED_A", "FEED_B", "FEED_C"]
+        assert rest["has_more"] is False
+
+    async def test_watch_replays_then_streams_changes(self, client: AsyncClient, test_db_session):
+        """Test that a watcher gets the filtered replay and then live changes as SSE."""
+        parent = (
+            await client.post(
+                "/api/v1/configurations/", json={"key": "WATCH_ROOT", "label": "R", "data_type": "string"}
+            )
+        ).json()
+        await client.post("/api/v1/configurations/", json={"key": "OTHER_KEY", "label": "O", "data_type": "string"})
+
+        subscription, replay = await ConfigurationService(test_db_session).watch(root_id=UUID(parent["id"]), since=0)
+        stream = _watch_stream(subscription, replay, heartbeat=0.01)
+        try:
+            assert await anext(stream) == b": connected\n\n"
+            assert b'"key":"WATCH_ROOT"' in await anext(stream)
+
+            await client.post(
+                "/api/v1/configurations/",
+                json={"key": "WATCH_CHILD", "label": "C", "data_type": "string", "parent_config_id": parent["id"]},
+            )
+            await client.post(
+                "/api/v1/configurations/", json={"key": "OTHER_LATER", "label": "O", "data_type": "string"}
+            )
+            event = await anext(stream)
+
+            assert event.startswith(b"id: 3\nevent: create\n")
+            assert b'"key":"WATCH_CHILD"' in event
+            assert await anext(stream) == b": keepalive\n\n"
+        finally:
+            await stream.aclose()
+
+        assert len(get_change_broadcaster()) == 0
+
+    async def test_watch_reports_nodes_moved_out_of_subtree(self, client: AsyncClient, test_db_session):
+        """Test that a subtree watcher hears about a node moved under a parent outside the subtree."""
+        root = (
+            await client.post("/api/v1/configurations/", json={"key": "MOVE_ROOT", "label": "R", "data_type": "string"})
+        ).json()
+        child = (
+            await client.post(
+                "/api/v1/configurations/",
+                json={"key": "MOVE_CHILD", "label": "C", "data_type": "string", "parent_config_id": root["id"]},
+            )
+        ).json()
+        outside = (
+            await client.post("/api/v1/configurations/", json={"key": "MOVE_AWAY", "label": "A", "data_type": "string"})
+        ).json()
+
+        subscription, _ = await ConfigurationService(test_db_session).watch(root_id=UUID(root["id"]))
+        stream = _watch_stream(subscription, [], heartbeat=0.01)
+        try:
+            assert await anext(stream) == b": connected\n\n"
+
+            await client.put(f"/api/v1/configurations/by-id/{child['id']}", json={"parent_config_id": outside["id"]})
+            event = await anext(stream)
+
+            assert b'"key":"MOVE_CHILD"' in event
+            assert f'"parent_config_id":"{outside["id"]}"'.encode() in event
+            assert f'"previous_parent_id":"{root["id"]}"'.encode() in event
+        finally:
+            await stream.aclose()
+
+    async def test_watch_reports_children_orphaned_by_delete(self, client: AsyncClient, test_db_session):
+        """Test that deleting a mid-tree node reports the children it detaches from the subtree."""
+        root = (
+            await client.post(
+                "/api/v1/configurations/", json={"key": "ORPHAN_ROOT", "label": "R", "data_type": "string"}
+            )
+        ).json()
+        middle = (
+            await client.post(
+                "/api/v1/configurations/",
+                json={"key": "ORPHAN_MID", "label": "M", "data_type": "string", "parent_config_id": root["id"]},
+            )
+        ).json()
+        await client.post(
+            "/api/v1/configurations/",
+            json={"key": "ORPHAN_LEAF", "label": "L", "data_type": "string", "parent_config_id": middle["id"]},
+        )
+
+        service = ConfigurationService(test_db_session)
+        subscription, _ = await service.watch(root_id=UUID(root["id"]))
+        stream = _watch_stream(subscription, [], heartbeat=0.01)
+        try:
+            assert await anext(stream) == b": connected\n\n"
+
+            await client.delete(f"/api/v1/configurations/by-id/{middle['id']}")
+            deleted, orphaned = await anext(stream), await anext(stream)
+
+            assert deleted.startswith(b"id: 4\nevent: delete\n")
+            assert b'"key":"ORPHAN_LEAF"' in orphaned
+            assert b'"parent_config_id":null' in orphaned
+            assert f'"previous_parent_id":"{middle["id"]}"'.encode() in orphaned
+        finally:
+            await stream.aclose()
+
+        # A reconnecting watcher gets the same events from the change log
+        subscription, replay = await service.watch(root_id=UUID(root["id"]), since=3)
+        get_change_broadcaster().unsubscribe(subscription)
+
+        assert [(c.op, c.key) for c in replay] == [("delete", "ORPHAN_MID"), ("update", "ORPHAN_LEAF")]
+
+    async def test_watch_rejects_invalid_last_event_id(self, client: AsyncClient):
+        """Test that a malformed Last-Event-ID is rejected before streaming starts."""
+        response = await client.get("/api/v1/configurations/watch", headers={"Last-Event-ID": "abc"})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    async def test_list_assembled_from_snapshots(self, client: AsyncClient):
+        """Test that list pages reuse encoded snapshots and never serve stale ones."""
+        ids = [
+            (
+                await client.post(
+                    "/api/v1/configurations/", json={"key": f"SNAP_{i}", "label": f"L{i}", "data_type": "string"}
+                )
+            ).json()["id"]
+            for i in range(3)
+        ]
+        baseline = (await client.get("/health/cache")).json()["snapshots"]["hits"]
+        first = await client.get("/api/v1/configurations/")
+        await client.put(f"/api/v1/configurations/by-id/{ids[1]}", json={"label": "Changed"})
+        second = await client.get("/api/v1/configurations/")
+
+        assert (await client.get("/health/cache")).json()["snapshots"]["hits"] - baseline == 2
+        assert [i["label"] for i in first.json()["items"]] == ["L0", "L1", "L2"]
+        assert [i["label"] for i in second.json()["items"]] == ["L0", "Changed", "L2"]
+        assert second.json()["items"][0] == first.json()["items"][0]
+
+    async def test_batch_get_by_keys_and_ids(self, client: AsyncClient):
+        """Test that keys and IDs are looked up together and misses are reported."""
+        created = [
+            (
+                await client.post(
+                    "/api/v1/configurations/", json={"key": f"BATCH_{i}", "label": f"B{i}", "data_type": "string"}
+                )
+            ).json()
+            for i in range(3)
+        ]
+        unknown_id = str(uuid4())
+
+        response = await client.post(
+            "/api/v1/configurations/batch-get",
+            json={"keys": ["BATCH_0", "BATCH_1", "BATCH_0", "NOPE"], "ids": [created[2]["id"], unknown_id]},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["by_key"] == {"BATCH_0": created[0], "BATCH_1": created[1]}
+        assert data["by_id"] == {created[2]["id"]: created[2]}
+        assert data["missing_keys"] == ["NOPE"]
+        assert data["missing_ids"] == [unknown_id]
+
+    async def test_batch_get_rejects_invalid_id(self, client: AsyncClient):
+        """Test that malformed IDs are rejected."""
+        response = await client.post("/api/v1/configurations/batch-get", json={"ids": ["not-a-uuid"]})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    async def test_evaluate_conditions_for_many_parent_values(self, client: AsyncClient):
+        """Test that parent conditions are evaluated per row with the default as fallback."""
+        tier = await client.post(
+            "/api/v1/configurations/", json={"key": "TIER", "label": "Tier", "data_type": "number"}
+        )
+        await client.post(
+            "/api/v1/configurations/",
+            json={
+                "key": "QUOTA",
+                "label": "Quota",
+                "data_type": "number",
+                "default_value": "10",
+                "parent_config_id": tier.json()["id"],
+                "parent_conditions": [
+                    {"operator": "between", "value": "2,3", "default_value": "100"},
+                    {"operator": ">", "value": "3", "default_value": "1000"},
+                ],
+            },
+        )
+
+        response = await client.post(
+            "/api/v1/configurations/evaluate", json={"key": "QUOTA", "parent_values": ["1", 2, "3.5", None, "gold"]}
+        )
+        orphan = await client.post("/api/v1/configurations/evaluate", json={"key": "TIER", "parent_values": [1]})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {
+            "matched": [False, True, True, False, False],
+            "values": ["10", "100", "1000", "10", "10"],
+        }
+        assert orphan.status_code == status.HTTP_400_BAD_REQUEST
+
+    async def test_rejects_default_value_breaking_rules(self, client: AsyncClient):
+        """Test that default values are checked against validation rules on write."""
+        payload = {
+            "key": "RULED",
+            "label": "Ruled",
+            "data_type": "number",
+            "validation_rules": [{"rule_type": "min", "value": 1}, {"rule_type": "max", "value": 10}],
+        }
+        response = await client.post("/api/v1/configurations/", json={**payload, "default_value": "11"})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "Must be at most 10" in response.json()["detail"]
+
+        created = (await client.post("/api/v1/configurations/", json={**payload, "default_value": "5"})).json()
+        response = await client.put(f"/api/v1/configurations/by-id/{created['id']}", json={"default_value": "0"})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    async def test_validate_values(self, client: AsyncClient):
+        """Test batch validation of candidate values."""
+        await client.post(
+            "/api/v1/configurations/",
+            json={
+                "key": "PORT",
+                "label": "Port",
+                "data_type": "number",
+                "validation_rules": [{"rule_type": "min", "value": 1}, {"rule_type": "max", "value": 65535}],
+            },
+        )
+
+        response = await client.post(
+            "/api/v1/configurations/validate", json={"key": "PORT", "values": ["80", "0", 443, "http"]}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {
+            "errors": [
+                {"errors": ["Must be at least 1"], "index": 1},
+                {"errors": ["Invalid number value: 'http'"], "index": 3},
+            ],
+            "invalid": 2,
+            "valid": 2,
+        }
+
+        missing = await client.post("/api/v1/configurations/validate", json={"key": "NOPE", "values": ["1"]})
+        assert missing.status_code == status.HTTP_404_NOT_FOUND
+
+    async def test_fields_projection(self, client: AsyncClient):
+        """Test that fields= narrows list and get responses."""
+        created = (
+            await client.post(
+                "/api/v1/configurations/",
+                json={
+                    "key": "FIELDS_KEY",
+                    "label": "Fields",
+                    "data_type": "number",
+                    "default_value": "5",
+                    "translations": [{"language": "fr", "label": "Champs"}],
+                },
+            )
+        ).json()
+
+        listed = (await client.get("/api/v1/configurations/?fields=key,default_value,data_type")).json()
+        single = await client.get(f"/api/v1/configurations/by-id/{created['id']}?fields=translations")
+        full = await client.get(f"/api/v1/configurations/by-id/{created['id']}")
+
+        assert listed["items"] == [{"data_type": "number", "default_value": "5", "key": "FIELDS_KEY"}]
+        assert listed["total"] == 1
+        assert single.json() == {"translations": created["translations"]}
+        assert single.headers["etag"] != full.headers["etag"]
+
+    async def test_fields_projection_rejects_unknown_field(self, client: AsyncClient):
+        """Test that unknown field names are rejected."""
+        response = await client.get("/api/v1/configurations/?fields=key,nope")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    async def test_lang_projects_translations(self, client: AsyncClient):
+        """Test that lang= keeps only the best translation of the fallback chain."""
+        translations = [
+            {"language": "en", "label": "Timeout", "description": None},
+            {"language": "ar", "label": "مهلة", "description": None},
+            {"language": "fr", "label": "Délai", "description": None},
+        ]
+        created = (
+            await client.post(
+                "/api/v1/configurations/",
+                json={"key": "LANG_KEY", "label": "Timeout", "data_type": "number", "translations": translations},
+            )
+        ).json()
+
+        regional = (await client.get(f"/api/v1/configurations/by-id/{created['id']}?lang=ar-JO")).json()
+        fallback = (await client.get("/api/v1/configurations/?lang=de")).json()["items"][0]
+        negotiated = await client.get(
+            "/api/v1/configurations/?lang=auto&fields=key,translations",
+            headers={"Accept-Language": "de;q=0.9, fr"},
+        )
+
+        assert regional == {**created, "translations": [translations[1]]}
+        assert fallback["translations"] == [translations[0]]
+        assert negotiated.json()["items"] == [{"key": "LANG_KEY", "translations": [translations[2]]}]
+        assert negotiated.headers["vary"] == "Accept-Language"
@@ -0,0 +1,97 @@
+"""Integration tests for routing reads to replicas."""
+
+from uuid import UUID
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.apis.consistency import READ_PRIMARY_COOKIE, ReadYourWritesMiddleware
+from src.application.repositories.configuration_repository import ConfigurationRepository
+from src.domain.entities.configuration import Configuration
+from src.infrastructure.cache import get_configuration_cache, get_configuration_graph, get_snapshot_cache
+from src.infrastructure.database import connection
+from src.infrastructure.database.models import Base
+from src.infrastructure.database.replicas import ReplicaSet
+from src.main import app
+
+
+@pytest.fixture
+async def replica(monkeypatch):
+    """A replica database holding one configuration the primary does not have."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)() as session:
+        await ConfigurationRepository(session).create(
+            Configuration(key="ONLY_ON_REPLICA", label="Replica", data_type="string")
+        )
+    monkeypatch.setattr(connection, "read_replicas", ReplicaSet([engine], retry_seconds=60))
+    yield
+    await engine.dispose()
+
+
+@pytest.fixture
+async def rw_client(client):
+    """Client going through the read-your-writes middleware."""
+    async with AsyncClient(app=ReadYourWritesMiddleware(app), base_url="http://test") as ac:
+        yield ac
+
+
+def keys(response) -> list[str]:
+    """Configuration keys of a list response."""
+    return [item["key"] for item in response.json()["items"]]
+
+
+async def test_reads_go_to_replica_and_writes_pin_the_client(replica, rw_client: AsyncClient):
+    """Test that GETs use the replica until the client writes or asks for the primary."""
+    assert keys(await rw_client.get("/api/v1/configurations/")) == ["ONLY_ON_REPLICA"]
+    primary = await rw_client.get("/api/v1/configurations/", headers={"X-Read-Consistency": "primary"})
+    assert keys(primary) == []
+
+    created = await rw_client.post(
+        "/api/v1/configurations/", json={"key": "WRITTEN", "label": "Written", "data_type": "string"}
+    )
+    assert READ_PRIMARY_COOKIE in created.cookies
+
+    assert keys(await rw_client.get("/api/v1/configurations/")) == ["WRITTEN"]
+    by_id = await rw_client.get(f"/api/v1/configurations/by-id/{created.json()['id']}")
+    assert by_id.status_code == 200
+
+
+async def test_reads_do_not_pin(replica, rw_client: AsyncClient):
+    """Test that read-only requests do not set the primary cookie."""
+    response = await rw_client.get("/api/v1/configurations/")
+
+    assert READ_PRIMARY_COOKIE not in response.cookies
+
+
+async def test_replica_reads_do_not_fill_shared_caches(monkeypatch, client: AsyncClient):
+    """Test that a lagging replica's rows are served but never cached for later primary reads."""
+    created = (
+        await client.post("/api/v1/configurations/", json={"key": "LAGGING", "label": "New", "data_type": "string"})
+    ).json()
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)() as session:
+        await ConfigurationRepository(session).create(
+            Configuration(id=UUID(created["id"]), key="LAGGING", label="Old", data_type="string")
+        )
+    monkeypatch.setattr(connection, "read_replicas", ReplicaSet([engine], retry_seconds=60))
+    get_configuration_cache().clear()
+    get_snapshot_cache().clear()
+    get_configuration_graph().invalidate()
+
+    stale = await client.get(f"/api/v1/configurations/by-id/{created['id']}")
+    listed = await client.get("/api/v1/configurations/")
+    options = await client.get("/api/v1/configurations/parent-options")
+    snapshots = get_snapshot_cache().stats()["size"]
+    fresh = await client.get(f"/api/v1/configurations/by-id/{created['id']}", headers={"X-Read-Consistency": "primary"})
+    await engine.dispose()
+
+    assert stale.json()["label"] == "Old"
+    assert keys(listed) == ["LAGGING"]
+    assert [item["label"] for item in options.json()["items"]] == ["Old"]
+    assert snapshots == 0
+    assert fresh.json()["label"] == "New"
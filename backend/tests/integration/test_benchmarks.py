@@ -0,0 +1,62 @@
+"""Smoke tests for the benchmark suite."""
+
+import json
+
+from benchmarks.__main__ import main
+from benchmarks.cold_start import main as cold_start_main
+from benchmarks.harness import find_regressions, percentile
+from benchmarks.seed import DataShape, build_configurations, parent_index
+from src.infrastructure.database import connection
+
+
+def test_tree_shape():
+    """Test that seeded keys form complete trees of the requested depth and fan-out."""
+    shape = DataShape(keys=30, depth=2, fan_out=2, translations=1)
+    configs = build_configurations(shape)
+
+    assert [parent_index(i, shape) for i in range(7)] == [None, 0, 0, None, 3, 3, None]
+    assert configs[4].parent_config_id == configs[3].id
+    assert len(configs[0].translations) == 1
+    assert [c.id for c in configs] == [c.id for c in build_configurations(shape)]
+
+
+def test_percentile_and_regressions():
+    """Test nearest-rank percentiles and baseline comparison."""
+    assert percentile([1.0, 2.0, 3.0, 4.0], 0.5) == 2.0
+    assert percentile([1.0, 2.0, 3.0, 4.0], 0.99) == 4.0
+
+    baseline = [{"name": "http.get", "p50_ms": 1.0, "p99_ms": 2.0}]
+    assert find_regressions([{"name": "http.get", "p50_ms": 1.1, "p99_ms": 2.1}], baseline, 0.2) == []
+    assert find_regressions([{"name": "http.get", "p50_ms": 1.0, "p99_ms": 3.0}], baseline, 0.2) == [
+        "http.get p99_ms: 2.000 -> 3.000 (+50%)"
+    ]
+
+
+def test_suite_reports_json(tmp_path, monkeypatch):
+    """Test a tiny end-to-end run over both targets."""
+    monkeypatch.setattr(connection, "engine", None)
+    monkeypatch.setattr(connection, "async_session", None)
+    output = tmp_path / "report.json"
+
+    exit_code = main(["--keys", "20", "--iterations", "3", "--warmup", "1", "--output", str(output)])
+
+    report = json.loads(output.read_text())
+    assert exit_code == 0
+    assert report["shape"]["keys"] == 20
+    assert {r["name"] for r in report["results"]} >= {"http.list", "http.parent_options", "service.list"}
+    assert all(r["iterations"] == 3 and r["p99_ms"] >= r["p50_ms"] for r in report["results"])
+
+
+def test_cold_start_reports_json(tmp_path, monkeypatch):
+    """Test one cold start per schema mode in a fresh process."""
+    monkeypatch.setattr(connection, "engine", None)
+    monkeypatch.setattr(connection, "async_session", None)
+    output = tmp_path / "cold_start.json"
+
+    exit_code = cold_start_main(["--keys", "5", "--runs", "1", "--output", str(output)])
+
+    report = json.loads(output.read_text())
+    assert exit_code == 0
+    assert [r["name"] for r in report["results"]] == ["cold_start[create_all]", "cold_start[migrations]"]
+    for result in report["results"]:
+        assert result["time_to_first_request_ms"]["p50"] >= result["import_ms"]["p50"] + result["startup_ms"]["p50"]
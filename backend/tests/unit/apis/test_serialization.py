@@ -0,0 +1,138 @@
+"""Equivalence tests for the fast configuration serializer."""
+
+import json
+import uuid
+from datetime import datetime
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from src.apis import serialization
+from src.apis.models.configuration_models import ConfigurationListResponse
+from src.apis.routers.configurations import _config_to_response
+from src.apis.serialization import (
+    RESPONSE_FIELDS,
+    configuration_to_dict,
+    encode_configuration,
+    encode_configuration_list,
+    parse_fields,
+    row_to_dict,
+)
+from src.application.repositories.configuration_repository import (
+    _parent_conditions_to_json,
+    _translations_to_json,
+    _validation_rules_to_json,
+)
+from src.domain.entities.configuration import Configuration, ParentCondition, Translation, ValidationRule
+
+CONFIGURATIONS = [
+    Configuration(key="minimal", label="Minimal", data_type="string"),
+    Configuration(
+        key="full",
+        label="Délai d'attente ✓",
+        description='Quotes " and \\ backslashes\nand newlines',
+        data_type="number",
+        default_value="30",
+        active=False,
+        parent_config_id=uuid.uuid4(),
+        validation_rules=[ValidationRule(rule_type="min", value=1), ValidationRule(rule_type="max", value=2.5)],
+        parent_conditions=[ParentCondition(operator="between", value="1,5", default_value=None)],
+        translations=[Translation(language="ar", label="مهلة", description=None)],
+        created_at=datetime(2024, 1, 2, 3, 4, 5, 678901),
+        updated_at=datetime(2024, 1, 2, 3, 4, 5),
+    ),
+]
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def encoder(request, monkeypatch):
+    """Run each test with orjson (when installed) and with the stdlib fallback."""
+    if request.param == "orjson":
+        if serialization.orjson is None:
+            pytest.skip("orjson is not installed")
+    else:
+        monkeypatch.setattr(serialization, "orjson", None)
+    return request.param
+
+
+def _reference(content) -> bytes:
+    """Encode a DTO the way FastAPI's response_model path does."""
+    return JSONResponse(jsonable_encoder(content)).body
+
+
+class TestConfigurationSerialization:
+    """Test that the fast path matches the response-model output."""
+
+    @pytest.mark.parametrize("config", CONFIGURATIONS, ids=lambda c: c.key)
+    def test_configuration_matches_response_model(self, encoder, config):
+        """Test that one configuration encodes to the same document."""
+        expected = _reference(_config_to_response(config))
+        actual = encode_configuration(config)
+
+        assert json.loads(actual) == json.loads(expected)
+        if encoder == "stdlib":
+            assert actual == expected
+
+    @pytest.mark.parametrize("next_cursor", [None, "abc"])
+    def test_list_matches_response_model(self, encoder, next_cursor):
+        """Test that a list page assembled from fragments matches the DTO."""
+        expected = _reference(
+            ConfigurationListResponse(
+                items=[_config_to_response(c) for c in CONFIGURATIONS],
+                total=7,
+                limit=2,
+                offset=4,
+                next_cursor=next_cursor,
+            )
+        )
+        actual = encode_configuration_list(
+            (encode_configuration(c) for c in CONFIGURATIONS), total=7, limit=2, offset=4, next_cursor=next_cursor
+        )
+
+        assert json.loads(actual) == json.loads(expected)
+        if encoder == "stdlib":
+            assert actual == expected
+
+    def test_empty_list(self, encoder):
+        """Test that an empty page is valid JSON."""
+        actual = encode_configuration_list([], total=0, limit=10, offset=0)
+
+        assert json.loads(actual) == {"items": [], "limit": 10, "next_cursor": None, "offset": 0, "total": 0}
+
+    def test_large_integer_rule_value(self, encoder):
+        """Test that integers beyond 64 bits encode as they do through the stdlib."""
+        config = Configuration(
+            key="big",
+            label="Big",
+            data_type="number",
+            validation_rules=[ValidationRule(rule_type="max", value=2**70)],
+        )
+
+        actual = encode_configuration(config)
+
+        assert json.loads(actual)["validation_rules"] == [{"rule_type": "max", "value": 2**70}]
+        assert json.loads(actual) == json.loads(_reference(_config_to_response(config)))
+
+
+class TestFieldProjection:
+    """Test sparse fieldsets built from selected columns."""
+
+    def test_parse_fields_orders_and_validates(self):
+        """Test that fields come back in response order and unknown names are rejected."""
+        assert parse_fields(None) is None
+        assert parse_fields("default_value, key,data_type,key") == ("data_type", "default_value", "key")
+        with pytest.raises(ValueError, match="Unknown fields: secret"):
+            parse_fields("key,secret")
+
+    @pytest.mark.parametrize("config", CONFIGURATIONS, ids=lambda c: c.key)
+    def test_full_projection_matches_entity_encoding(self, config):
+        """Test that projecting every column equals the full response."""
+        row = {
+            **config.model_dump(exclude={"validation_rules", "parent_conditions", "translations"}),
+            "validation_rules": _validation_rules_to_json(config.validation_rules),
+            "parent_conditions": _parent_conditions_to_json(config.parent_conditions),
+            "translations": _translations_to_json(config.translations),
+        }
+
+        assert row_to_dict(row, RESPONSE_FIELDS) == configuration_to_dict(config)
@@ -0,0 +1,135 @@
+"""Unit tests for the configuration cache."""
+
+import uuid
+from datetime import timedelta
+
+from src.domain.entities.configuration import Configuration
+from src.infrastructure.cache import ConfigurationCache, LRUTTLCache, SnapshotCache
+from src.infrastructure.notifications import ConfigurationChange
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_config(key: str) -> Configuration:
+    """Build a configuration entity."""
+    return Configuration(id=uuid.uuid4(), key=key, label=key, data_type="string")
+
+
+class TestLRUTTLCache:
+    """Test the LRU/TTL primitive."""
+
+    def test_evicts_least_recently_used(self):
+        """Test that the oldest untouched entry is evicted first."""
+        cache = LRUTTLCache(max_size=2, ttl_seconds=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1
+
+        cache.set("c", 3)
+
+        assert "b" not in cache
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.stats.evictions == 1
+
+    def test_entries_expire_after_ttl(self):
+        """Test that entries are dropped once their TTL has passed."""
+        clock = FakeClock()
+        cache = LRUTTLCache(max_size=10, ttl_seconds=5, clock=clock)
+        cache.set("a", 1)
+
+        clock.now = 4.9
+        assert cache.get("a") == 1
+        clock.now = 5.0
+        assert cache.get("a") is None
+        assert cache.stats.to_dict() == {
+            "hits": 1,
+            "misses": 1,
+            "evictions": 0,
+            "expirations": 1,
+            "invalidations": 0,
+        }
+
+
+class TestConfigurationCache:
+    """Test the configuration cache indexes."""
+
+    def test_invalidate_drops_both_indexes(self):
+        """Test that invalidating by ID also drops the key index."""
+        cache = ConfigurationCache(max_size=10, ttl_seconds=60)
+        config = make_config("A")
+        cache.put(config)
+
+        cache.invalidate(config.id)
+
+        assert cache.get_by_id(config.id) is None
+        assert cache.get_by_key("A") is None
+
+    def test_key_index_resolves_through_id_index(self):
+        """Test that a key whose entity was evicted from the ID index is a miss."""
+        cache = ConfigurationCache(max_size=1, ttl_seconds=60)
+        config = make_config("A")
+        cache.put(config)
+
+        other = make_config("B")
+        cache.by_id.set(other.id, other)
+
+        assert cache.get_by_key("A") is None
+        assert len(cache.by_key) == 0
+
+    def test_returns_copies(self):
+        """Test that mutating a returned entity does not change the cached one."""
+        cache = ConfigurationCache(max_size=10, ttl_seconds=60)
+        config = make_config("A")
+        cache.put(config)
+
+        cache.get_by_id(config.id).label = "changed"
+        config.label = "changed too"
+
+        assert cache.get_by_key("A").label == "A"
+
+    def test_put_after_concurrent_invalidation_is_ignored(self):
+        """Test that a load which raced with a write does not cache the stale row."""
+        cache = ConfigurationCache(max_size=10, ttl_seconds=60)
+        config = make_config("A")
+        generation = cache.generation
+
+        cache.invalidate(config.id, config.key)
+        cache.put(config, generation)
+
+        assert cache.get_by_id(config.id) is None
+
+
+class TestSnapshotCache:
+    """Test version-checked encoded snapshots."""
+
+    def test_serves_only_the_cached_version(self):
+        """Test that a snapshot is never returned for a newer version of the row."""
+        cache = SnapshotCache(max_size=10, ttl_seconds=60)
+        config = make_config("A")
+        cache.put(config.id, config.updated_at, b"old")
+
+        assert cache.get(config.id, config.updated_at) == b"old"
+        assert cache.get(config.id, config.updated_at + timedelta(seconds=1)) is None
+
+    def test_change_drops_snapshot(self):
+        """Test that change notifications release snapshots."""
+        cache = SnapshotCache(max_size=10, ttl_seconds=60)
+        first, second = make_config("A"), make_config("B")
+        cache.put(first.id, first.updated_at, b"a")
+        cache.put(second.id, second.updated_at, b"b")
+
+        cache.apply_change(ConfigurationChange(op="update", config_id=first.id, key="A"))
+        assert cache.get(first.id, first.updated_at) is None
+        assert cache.get(second.id, second.updated_at) == b"b"
+
+        cache.apply_change(ConfigurationChange.reset())
+        assert cache.stats()["size"] == 0
@@ -0,0 +1,78 @@
+"""Unit tests for the configuration graph."""
+
+import uuid
+
+from src.infrastructure.cache import ConfigurationGraph
+from src.infrastructure.notifications import ConfigurationChange
+
+
+def build_graph(edges):
+    """Load a graph from (id, parent) pairs."""
+    graph = ConfigurationGraph()
+    graph.begin_load()
+    graph.finish_load(edges)
+    return graph
+
+
+class TestConfigurationGraph:
+    """Test graph indexes and incremental updates."""
+
+    def test_ancestors_descendants_and_depth(self):
+        """Test lookups on a small tree."""
+        a, b, c, d = (uuid.uuid4() for _ in range(4))
+        graph = build_graph([(c, b), (a, None), (b, a), (d, a)])
+
+        assert graph.ancestors(c) == [b, a]
+        assert graph.descendants(a) == {b, c, d}
+        assert [graph.depth(n) for n in (a, b, c, d)] == [0, 1, 2, 1]
+
+    def test_reparent_shifts_subtree_depth(self):
+        """Test that moving a node updates its whole subtree."""
+        a, b, c, x = (uuid.uuid4() for _ in range(4))
+        graph = build_graph([(a, None), (b, a), (c, b), (x, None)])
+
+        graph.apply_change(ConfigurationChange(op="update", config_id=x, parent_config_id=c))
+        graph.apply_change(ConfigurationChange(op="update", config_id=b, parent_config_id=None))
+
+        assert graph.descendants(a) == set()
+        assert graph.ancestors(x) == [c, b]
+        assert graph.depth(x) == 2
+
+    def test_delete_reroots_children(self):
+        """Test that deleting a node makes its children roots."""
+        a, b, c = (uuid.uuid4() for _ in range(3))
+        graph = build_graph([(a, None), (b, a), (c, b)])
+
+        graph.apply_change(ConfigurationChange(op="delete", config_id=b))
+
+        assert b not in graph
+        assert graph.parent_of(c) is None
+        assert graph.depth(c) == 0
+
+    def test_cycle_detection(self):
+        """Test that a node cannot move under itself or its descendants."""
+        a, b, c = (uuid.uuid4() for _ in range(3))
+        graph = build_graph([(a, None), (b, a), (c, b)])
+
+        assert graph.would_create_cycle(a, c)
+        assert graph.would_create_cycle(a, a)
+        assert not graph.would_create_cycle(c, a)
+
+    def test_changes_during_load_are_replayed(self):
+        """Test that a change arriving while the snapshot loads is not lost."""
+        a, b = uuid.uuid4(), uuid.uuid4()
+        graph = ConfigurationGraph()
+        graph.begin_load()
+        graph.apply_change(ConfigurationChange(op="create", config_id=b, parent_config_id=a))
+        graph.finish_load([(a, None)])
+
+        assert graph.parent_of(b) == a
+
+    def test_reset_unloads_graph(self):
+        """Test that a reset forces a reload."""
+        graph = build_graph([(uuid.uuid4(), None)])
+
+        graph.apply_change(ConfigurationChange.reset())
+
+        assert not graph.loaded
+        assert len(graph) == 0
@@ -0,0 +1,54 @@
+"""Unit tests for connection pool options."""
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.configs.settings import Settings
+from src.infrastructure.database.pool import engine_options, install_idle_pre_ping
+
+
+class TestEngineOptions:
+    """Test settings -> create_async_engine arguments."""
+
+    def test_postgres(self):
+        """Test that server databases get pool sizing and asyncpg its statement cache."""
+        settings = Settings(
+            db_pool_size=20, db_max_overflow=5, db_pool_pre_ping="idle", db_prepared_statement_cache_size=0
+        )
+
+        options = engine_options("postgresql+asyncpg://user:secret@db/app", settings)
+
+        assert options == {
+            "pool_pre_ping": False,
+            "pool_size": 20,
+            "max_overflow": 5,
+            "pool_recycle": settings.db_pool_recycle_seconds,
+            "pool_timeout": settings.db_pool_timeout_seconds,
+            "connect_args": {"prepared_statement_cache_size": 0},
+        }
+
+    def test_sqlite(self):
+        """Test that SQLite keeps its own pool and only gets the pre-ping flag."""
+        assert engine_options("sqlite+aiosqlite:///:memory:", Settings(db_pool_pre_ping="always")) == {
+            "pool_pre_ping": True
+        }
+
+
+async def test_idle_pre_ping_only_pings_idle_connections(monkeypatch):
+    """Test that a connection is pinged only after sitting idle past the threshold."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    pings = []
+    do_ping = engine.sync_engine.dialect.do_ping
+    monkeypatch.setattr(engine.sync_engine.dialect, "do_ping", lambda conn: pings.append(conn) or do_ping(conn))
+
+    install_idle_pre_ping(engine, idle_seconds=3600)
+    for _ in range(2):
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+    assert pings == []
+
+    install_idle_pre_ping(engine, idle_seconds=0)
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+    assert len(pings) == 1
+    await engine.dispose()
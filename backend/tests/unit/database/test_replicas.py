@@ -0,0 +1,44 @@
+"""Unit tests for read replica selection."""
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.infrastructure.database.replicas import ReplicaSet
+
+
+async def database_name(session) -> str:
+    """Name of the SQLite file a session is connected to."""
+    rows = (await session.execute(text("PRAGMA database_list"))).all()
+    return rows[0][2].rsplit("/", 1)[-1]
+
+
+async def test_round_robin_and_failover(tmp_path):
+    """Test that replicas rotate and an unreachable one is skipped until its retry delay passes."""
+    replicas = ReplicaSet(
+        [
+            create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'a.db'}"),
+            create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'missing' / 'b.db'}"),
+            create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'c.db'}"),
+        ],
+        retry_seconds=60,
+    )
+
+    names = []
+    for _ in range(4):
+        session = await replicas.open_session()
+        names.append(await database_name(session))
+        await session.close()
+
+    assert names == ["a.db", "c.db", "c.db", "a.db"]
+    assert replicas.available() == [0, 2]
+    await replicas.dispose()
+
+
+async def test_no_healthy_replica(tmp_path):
+    """Test that None is returned when every replica is down."""
+    replicas = ReplicaSet([create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'missing' / 'x.db'}")], 60)
+
+    assert await replicas.open_session() is None
+    assert await replicas.open_session() is None
+    assert replicas.available() == []
+    await replicas.dispose()
@@ -0,0 +1,23 @@
+"""Unit tests for the startup schema mode."""
+
+import pytest
+from sqlalchemy import inspect
+
+from src.configs.settings import Settings
+from src.infrastructure.database import connection
+
+
+@pytest.mark.parametrize(("mode", "tables"), [("create_all", True), ("migrations", False)])
+async def test_init_db_schema_mode(monkeypatch, tmp_path, mode, tables):
+    """Test that only create_all mode creates missing tables at startup."""
+    monkeypatch.setattr(connection, "get_settings", lambda: Settings(db_schema_mode=mode, read_database_urls=[]))
+    monkeypatch.setattr(connection, "engine", None)
+    monkeypatch.setattr(connection, "async_session", None)
+    monkeypatch.setattr(connection, "read_replicas", None)
+
+    await connection.init_db(f"sqlite+aiosqlite:///{tmp_path / 'app.db'}")
+    async with connection.engine.connect() as conn:
+        names = await conn.run_sync(lambda sync_conn: inspect(sync_conn).get_table_names())
+    await connection.close_db()
+
+    assert ("configurations" in names) is tables
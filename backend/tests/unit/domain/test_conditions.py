@@ -0,0 +1,191 @@
+"""Unit tests for parent condition evaluation."""
+
+from datetime import date
+
+import pytest
+
+from src.domain import conditions
+from src.domain.conditions import CompiledConditions, compile_predicate, parse_value
+from src.domain.entities.configuration import ParentCondition
+
+
+def condition(operator: str, value, default_value="matched") -> ParentCondition:
+    """Build a parent condition."""
+    return ParentCondition(operator=operator, value=value, default_value=default_value)
+
+
+class TestParseValue:
+    """Test typed value parsing."""
+
+    def test_parses_each_data_type(self):
+        """Test parsing of every supported data type."""
+        assert parse_value("number", "3.5") == 3.5
+        assert parse_value("date", "2024-02-01") == date(2024, 2, 1)
+        assert parse_value("list", "a, b,,c") == frozenset({"a", "b", "c"})
+        assert parse_value("list", '["a", "b"]') == frozenset({"a", "b"})
+        assert parse_value("string", 7) == "7"
+
+    def test_rejects_invalid_values(self):
+        """Test that unparseable values raise ValueError."""
+        with pytest.raises(ValueError):
+            parse_value("number", "three")
+        with pytest.raises(ValueError):
+            parse_value("colour", "red")
+
+
+class TestCompilePredicate:
+    """Test compiled comparators."""
+
+    @pytest.mark.parametrize(
+        ("operator", "operand", "value", "expected"),
+        [
+            ("=", "10", 10.0, True),
+            ("!=", "10", 10.0, False),
+            (">", "10", 11.0, True),
+            (">=", "10", 10.0, True),
+            ("<", "10", 10.0, False),
+            ("<=", "10", 9.5, True),
+            ("between", "1,5", 5.0, True),
+            ("between", "1,5", 5.5, False),
+            ("in", "1,2,3", 2.0, True),
+        ],
+    )
+    def test_number_operators(self, operator, operand, value, expected):
+        """Test numeric operators compare numerically, not lexically."""
+        assert compile_predicate(condition(operator, operand), "number")(value) is expected
+
+    def test_date_between(self):
+        """Test a date range condition."""
+        predicate = compile_predicate(condition("between", "2024-01-01,2024-12-31"), "date")
+
+        assert predicate(date(2024, 6, 1))
+        assert not predicate(date(2025, 1, 1))
+
+    def test_list_in_matches_any_selection(self):
+        """Test that a list condition matches when any selected value overlaps."""
+        predicate = compile_predicate(condition("in", "gold,silver"), "list")
+
+        assert predicate(frozenset({"bronze", "silver"}))
+        assert not predicate(frozenset({"bronze"}))
+
+    def test_unsupported_operator(self):
+        """Test that unknown operators fail at compile time."""
+        with pytest.raises(ValueError):
+            compile_predicate(condition("~", "x"), "string")
+        with pytest.raises(ValueError):
+            compile_predicate(condition(">", "x"), "list")
+
+
+class TestCompiledConditions:
+    """Test first-match evaluation."""
+
+    def test_first_match_wins(self):
+        """Test that conditions are evaluated in order."""
+        compiled = CompiledConditions(
+            [condition(">", "100", "large"), condition(">", "10", "medium")],
+            "number",
+        )
+
+        assert compiled.evaluate("500") == (True, "large")
+        assert compiled.evaluate("50") == (True, "medium")
+        assert compiled.evaluate("5") == (False, None)
+
+    def test_unparseable_parent_value_matches_nothing(self):
+        """Test that a parent value of the wrong type never matches."""
+        compiled = CompiledConditions([condition("=", "1")], "number")
+
+        assert compiled.evaluate("one") == (False, None)
+
+    def test_numpy_loads_on_first_column_evaluation(self, monkeypatch):
+        """Test that scalar evaluation never imports NumPy; evaluate_many does."""
+        pytest.importorskip("numpy")
+        monkeypatch.setattr(conditions, "np", None)
+        monkeypatch.setattr(conditions, "_numpy_loaded", False)
+        compiled = CompiledConditions([condition(">", "1")], "number")
+
+        assert compiled.evaluate("2") == (True, "matched")
+        assert not conditions._numpy_loaded
+        assert compiled.evaluate_many(["2", "0"]) == ([True, False], ["matched", None])
+        assert conditions._numpy_loaded and conditions.np is not None
+
+
+@pytest.fixture(params=["numpy", "python"])
+def column_engine(request, monkeypatch):
+    """Run each test with NumPy (when installed) and with the pure-Python fallback."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(conditions, "np", None)
+        monkeypatch.setattr(conditions, "_numpy_loaded", True)
+    return request.param
+
+
+class TestEvaluateMany:
+    """Test column evaluation against row-by-row evaluation."""
+
+    @pytest.mark.parametrize(
+        ("data_type", "rules", "values"),
+        [
+            (
+                "number",
+                [condition("between", "1,5", "low"), condition(">", "3", "high"), condition("in", "9, 10", "set")],
+                ["2", "4", 7, 10.0, "9", None, "x", True, "", [1]],
+            ),
+            (
+                "date",
+                [condition("between", "2024-01-01,2024-06-30", "h1"), condition(">=", "2024-07-01", "h2")],
+                ["2024-03-01", "2024-08-01T10:00:00", "2023-12-31", "soon", None],
+            ),
+            (
+                "string",
+                [condition("=", "eu", "gdpr"), condition("in", "us,ca", "na")],
+                ["eu", "us", "eu", "jp", None, 3],
+            ),
+            (
+                "list",
+                [condition("in", "beta", "preview")],
+                ["alpha,beta", "alpha", ["beta"], None],
+            ),
+        ],
+    )
+    def test_matches_row_by_row_evaluation(self, column_engine, data_type, rules, values):
+        """Test that every row gets the same result as evaluate()."""
+        compiled = CompiledConditions(rules, data_type)
+
+        matched, chosen = compiled.evaluate_many(values)
+
+        assert list(zip(matched, chosen)) == [compiled.evaluate(value) for value in values]
+
+    @pytest.mark.parametrize("operator", ["!=", ">", "<", "in", "between"])
+    def test_non_finite_numbers_match_nothing(self, column_engine, operator):
+        """Test that NaN and infinities never match, row by row or as a column."""
+        compiled = CompiledConditions([condition(operator, "1,5" if operator == "between" else "5", "x")], "number")
+        values = ["nan", "inf", "-inf", float("nan"), float("inf"), "-Infinity"]
+
+        assert compiled.evaluate_many(values) == ([False] * len(values), [None] * len(values))
+        assert [compiled.evaluate(value) for value in values] == [(False, None)] * len(values)
+
+    def test_non_finite_numpy_values_match_nothing(self):
+        """Test that NaN and infinities in a float array never match."""
+        np = pytest.importorskip("numpy")
+        compiled = CompiledConditions([condition("!=", "5", "x")], "number")
+        values = np.array([np.nan, np.inf, -np.inf, 3.0])
+
+        assert compiled.evaluate_many(values) == ([False, False, False, True], [None, None, None, "x"])
+        assert [compiled.evaluate(value) for value in values] == [(False, None)] * 3 + [(True, "x")]
+
+    def test_numpy_columns(self):
+        """Test that typed NumPy arrays are compared without parsing."""
+        np = pytest.importorskip("numpy")
+        numbers = CompiledConditions([condition("between", "1,5", "low"), condition("!=", "0", "other")], "number")
+        dates = CompiledConditions([condition("<", "2024-01-01", "old")], "date")
+
+        assert numbers.evaluate_many(np.array([0, 3, 8])) == ([False, True, True], [None, "low", "other"])
+        assert dates.evaluate_many(np.array(["2023-05-01", "2024-05-01", "NaT"], dtype="datetime64[D]")) == (
+            [True, False, False],
+            ["old", None, None],
+        )
+
+    def test_no_conditions(self, column_engine):
+        """Test that a configuration without conditions matches nothing."""
+        assert CompiledConditions([], "number").evaluate_many(["1", "2"]) == ([False, False], [None, None])
@@ -0,0 +1,52 @@
+"""Unit tests for translation locale negotiation."""
+
+import pytest
+
+from src.domain.translations import language_chain, parse_accept_language, select_translation
+
+TRANSLATIONS = [
+    {"language": "en", "label": "Timeout"},
+    {"language": "AR", "label": "مهلة"},
+    {"language": "fr-CA", "label": "Délai"},
+]
+
+
+class TestLanguageChain:
+    """Test fallback-chain construction."""
+
+    def test_expands_prefixes_then_default(self):
+        """Test that a regional tag falls back to its language, then the default."""
+        assert language_chain(["ar-JO"], "en") == ["ar-jo", "ar", "en"]
+
+    def test_skips_duplicates_and_malformed_tags(self):
+        """Test that repeated and invalid tags do not appear in the chain."""
+        assert language_chain(["fr-CA", "fr", "<script>", ""], "fr") == ["fr-ca", "fr"]
+
+    @pytest.mark.parametrize(
+        ("header", "expected"),
+        [
+            ("ar-JO,ar;q=0.9,en;q=0.8", ["ar-JO", "ar", "en"]),
+            ("en;q=0.5, fr-CA", ["fr-CA", "en"]),
+            ("*, de;q=0, es;q=bad, it", ["it"]),
+            ("", []),
+        ],
+    )
+    def test_parse_accept_language(self, header, expected):
+        """Test that Accept-Language tags are ordered by quality."""
+        assert parse_accept_language(header) == expected
+
+
+class TestSelectTranslation:
+    """Test picking a translation through a chain."""
+
+    def test_first_match_wins_case_insensitively(self):
+        """Test that the most specific available language is used."""
+        assert select_translation(TRANSLATIONS, ["ar-jo", "ar", "en"])["label"] == "مهلة"
+
+    def test_falls_back_to_default(self):
+        """Test that the default language is used when nothing closer exists."""
+        assert select_translation(TRANSLATIONS, ["de", "en"])["label"] == "Timeout"
+
+    def test_no_match(self):
+        """Test that no translation is selected when the chain has no match."""
+        assert select_translation(TRANSLATIONS, ["de"]) is None
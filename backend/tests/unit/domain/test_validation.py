@@ -0,0 +1,63 @@
+"""Unit tests for compiled validation rules."""
+
+import pytest
+
+from src.domain.entities.configuration import ValidationRule
+from src.domain.validation import CompiledValidator
+
+
+def validator(data_type: str, **rules) -> CompiledValidator:
+    """Compile keyword rules for a data type."""
+    return CompiledValidator([ValidationRule(rule_type=t, value=v) for t, v in rules.items()], data_type)
+
+
+class TestCompiledValidator:
+    """Test rule enforcement per data type."""
+
+    def test_number_bounds(self):
+        """Test inclusive numeric bounds."""
+        v = validator("number", min="1", max=10)
+        assert v.validate("1") == []
+        assert v.validate("10") == []
+        assert v.validate("0") == ["Must be at least 1"]
+        assert v.validate("11") == ["Must be at most 10"]
+        assert v.validate("ten") == ["Invalid number value: 'ten'"]
+
+    def test_string_length_and_regex(self):
+        """Test that string bounds apply to length and regex must match."""
+        v = validator("string", min=2, max=4, regex=r"^[a-z]+$")
+        assert v.validate("abc") == []
+        assert v.validate("a") == ["Must be at least 2 characters"]
+        assert v.validate("ABCDE") == ["Must be at most 4 characters", "Must match ^[a-z]+$"]
+
+    def test_date_window(self):
+        """Test start_date and end_date bounds."""
+        v = validator("date", start_date="2024-01-01", end_date="2024-12-31")
+        assert v.validate("2024-06-01") == []
+        assert v.validate("2025-01-01") == ["Must be at most 2024-12-31"]
+
+    def test_list_options_and_mode(self):
+        """Test allowed options and single selection."""
+        options = [{"label": "A", "value": "a"}, {"label": "B", "value": "b"}]
+        v = validator("list", list_options=options, list_mode="single")
+        assert v.validate("a") == []
+        assert v.validate("a,c") == ["Not an allowed option: c", "Only one option may be selected"]
+
+    def test_required(self):
+        """Test that empty values only fail when required."""
+        assert validator("number", min=1).validate("") == []
+        assert validator("number", required=True).validate("") == ["Value is required"]
+        assert validator("string", required="false").validate(None) == []
+
+    def test_ignores_unknown_rules(self):
+        """Test that unsupported rule types are skipped."""
+        assert validator("string", unique_items=True, valid_from="2024-01-01").validate("x") == []
+
+    def test_rejects_invalid_rules(self):
+        """Test that malformed operands fail at compile time."""
+        with pytest.raises(ValueError):
+            validator("number", min="one")
+        with pytest.raises(ValueError):
+            validator("string", regex="(")
+        with pytest.raises(ValueError, match="not a finite number"):
+            validator("string", unique_items=float("nan"))
@@ -0,0 +1,55 @@
+"""Unit tests for connection pool metrics."""
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from src.infrastructure.metrics import MetricsRegistry, instrument_engine
+
+
+def samples(registry: MetricsRegistry) -> dict[str, str]:
+    """Rendered samples by series name."""
+    return dict(line.rsplit(" ", 1) for line in registry.render().splitlines() if not line.startswith("#"))
+
+
+async def test_pool_saturation_gauges(tmp_path):
+    """Test that gauges follow checkouts and count every query."""
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}", poolclass=AsyncAdaptedQueuePool, pool_size=2, max_overflow=1
+    )
+    registry = MetricsRegistry()
+    instrument_engine(engine, registry, name="replica-1", capacity=3)
+
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+        busy = samples(registry)
+    idle = samples(registry)
+    await engine.dispose()
+
+    assert busy['db_pool_checked_out{pool="replica-1"}'] == "1"
+    assert busy['db_pool_capacity{pool="replica-1"}'] == "3"
+    assert busy['db_pool_checkouts_in_flight{pool="replica-1"}'] == "0"
+    assert idle['db_pool_checked_out{pool="replica-1"}'] == "0"
+    assert idle['db_pool_open{pool="replica-1"}'] == "1"
+    assert idle['db_pool_checkout_seconds_count{pool="replica-1"}'] == "1"
+    assert idle['db_pool_checkout_timeouts_total{pool="replica-1"}'] == "0"
+    assert int(idle['db_query_duration_seconds_count{pool="replica-1"}']) >= 1
+
+
+async def test_pool_replaced_by_dispose_is_timed(tmp_path):
+    """Test that checkouts from the pool created by dispose() are still timed."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}", poolclass=AsyncAdaptedQueuePool)
+    registry = MetricsRegistry()
+    instrument_engine(engine, registry, name="primary")
+
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+    await engine.dispose()
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+        busy = samples(registry)
+    await engine.dispose()
+
+    assert busy['db_pool_checkout_seconds_count{pool="primary"}'] == "2"
+    assert busy['db_pool_checked_out{pool="primary"}'] == "1"
+    assert 'db_pool_capacity{pool="primary"}' not in busy
@@ -0,0 +1,69 @@
+"""Unit tests for the metrics registry."""
+
+from src.infrastructure.metrics import HistogramFamily, MetricsRegistry, RequestMetrics, current_request
+from src.infrastructure.metrics.request import track_serialization
+
+
+class TestHistogramFamily:
+    """Test bucketing and Prometheus rendering."""
+
+    def test_renders_cumulative_buckets(self):
+        """Test that buckets are cumulative and inclusive of their upper bound."""
+        family = HistogramFamily("latency_seconds", "Latency.", ("route",), buckets=(0.1, 1))
+        for value in (0.05, 0.1, 0.5, 3):
+            family.labels("/a").observe(value)
+
+        assert family.render() == [
+            "# HELP latency_seconds Latency.",
+            "# TYPE latency_seconds histogram",
+            'latency_seconds_bucket{route="/a",le="0.1"} 2',
+            'latency_seconds_bucket{route="/a",le="1"} 3',
+            'latency_seconds_bucket{route="/a",le="+Inf"} 4',
+            'latency_seconds_sum{route="/a"} 3.65',
+            'latency_seconds_count{route="/a"} 4',
+        ]
+
+    def test_escapes_label_values(self):
+        """Test that quotes in label values are escaped."""
+        family = HistogramFamily("h", "H.", ("route",), buckets=(1,))
+        family.labels('say "hi"').observe(0)
+
+        assert 'h_count{route="say \\"hi\\""} 1' in family.render()
+
+
+class TestMetricsRegistry:
+    """Test request recording."""
+
+    def test_observe_request(self):
+        """Test that one request feeds every per-request family."""
+        registry = MetricsRegistry()
+        registry.observe_request("GET", "/items", 200, 0.02, 3, 0.01, 0.0, 0.005)
+
+        text = registry.render()
+        assert 'http_requests_total{method="GET",route="/items",status="200"} 1' in text
+        assert 'http_request_db_queries_bucket{method="GET",route="/items",le="3"} 1' in text
+        assert 'http_request_db_queries_bucket{method="GET",route="/items",le="2"} 0' in text
+        assert text.endswith("\n")
+
+
+def test_track_serialization_times_outermost_call_only():
+    """Test that nested encoders are not counted twice."""
+
+    @track_serialization
+    def inner():
+        return b"x"
+
+    @track_serialization
+    def outer():
+        return inner() + inner()
+
+    metrics = RequestMetrics()
+    token = current_request.set(metrics)
+    try:
+        assert outer() == b"xx"
+    finally:
+        current_request.reset(token)
+
+    assert metrics.serialization_seconds > 0
+    assert not metrics.serializing
+    assert outer() == b"xx"
@@ -0,0 +1,46 @@
+"""Unit tests for the watch broadcaster."""
+
+import uuid
+
+from src.infrastructure.notifications import ChangeBroadcaster, ConfigurationChange
+
+
+class TestChangeBroadcaster:
+    """Test fan-out to filtered, bounded watcher queues."""
+
+    async def test_deliver_applies_each_filter(self):
+        """Test that every watcher only receives the changes it asked for."""
+        broadcaster = ChangeBroadcaster()
+        everything = broadcaster.subscribe()
+        prefixed = broadcaster.subscribe(lambda change: change.key.startswith("app."))
+        first = ConfigurationChange(op="create", config_id=uuid.uuid4(), key="app.timeout", revision=1)
+        second = ConfigurationChange(op="update", config_id=uuid.uuid4(), key="db.pool", revision=2)
+
+        broadcaster.deliver(first)
+        broadcaster.deliver(second)
+
+        assert [await everything.get(), await everything.get()] == [first, second]
+        assert await prefixed.get() == first
+        assert len(broadcaster) == 2
+
+    async def test_overflow_drops_backlog_and_signals_none(self):
+        """Test that a slow watcher is cut off instead of buffering without bound."""
+        broadcaster = ChangeBroadcaster(queue_size=2)
+        subscription = broadcaster.subscribe()
+
+        for revision in range(1, 5):
+            broadcaster.deliver(ConfigurationChange(op="update", config_id=uuid.uuid4(), key="A", revision=revision))
+
+        assert subscription.overflowed is True
+        assert await subscription.get() is None
+
+    def test_unsubscribe_stops_delivery(self):
+        """Test that a disconnected watcher no longer receives changes."""
+        broadcaster = ChangeBroadcaster()
+        subscription = broadcaster.subscribe()
+
+        broadcaster.unsubscribe(subscription)
+        broadcaster.deliver(ConfigurationChange(op="delete", config_id=uuid.uuid4(), key="A"))
+
+        assert len(broadcaster) == 0
+        assert subscription._queue.empty()
@@ -0,0 +1,100 @@
+"""Unit tests for configuration change notifications."""
+
+import uuid
+
+import pytest
+
+from src.domain.entities.configuration import Configuration
+from src.infrastructure.cache import ConfigurationCache
+from src.infrastructure.notifications import ChangeBus, ConfigurationChange
+
+
+class TestConfigurationChange:
+    """Test change event serialization."""
+
+    def test_payload_round_trip(self):
+        """Test that a change survives NOTIFY payload encoding."""
+        change = ConfigurationChange(
+            op="update",
+            config_id=uuid.uuid4(),
+            key="A",
+            parent_config_id=uuid.uuid4(),
+            previous_parent_id=uuid.uuid4(),
+            origin="worker-2",
+        )
+
+        assert ConfigurationChange.from_payload(change.to_payload()) == change
+
+
+class TestChangeBus:
+    """Test change fan-out with a local stand-in bus."""
+
+    async def test_publish_delivers_locally(self):
+        """Test that local writes reach subscribers without going through the relay."""
+        bus = ChangeBus()
+        received, relayed = [], []
+
+        async def relay(session, changes):
+            relayed.extend(changes)
+
+        bus.subscribe(received.append)
+        bus.relay = relay
+        change = ConfigurationChange(op="delete", config_id=uuid.uuid4(), key="A")
+
+        await bus.publish(change)
+
+        assert received == [change]
+        assert relayed == []
+
+    async def test_stage_relays_in_the_writing_session(self):
+        """Test that staged changes reach the relay with the writer's session."""
+        bus = ChangeBus()
+        relayed = []
+
+        async def relay(session, changes):
+            relayed.append((session, list(changes)))
+
+        session = object()
+        change = ConfigurationChange(op="delete", config_id=uuid.uuid4(), key="A")
+        await bus.stage(session, [change])
+        bus.relay = relay
+        await bus.stage(session, [])
+        await bus.stage(session, [change])
+
+        assert relayed == [(session, [change])]
+
+    async def test_failing_relay_fails_the_write(self):
+        """Test that a relay error reaches the writer, which then rolls back."""
+        bus = ChangeBus()
+
+        async def relay(session, changes):
+            raise ConnectionError("database gone")
+
+        bus.relay = relay
+
+        with pytest.raises(ConnectionError):
+            await bus.stage(object(), [ConfigurationChange.reset()])
+
+    def test_peer_change_evicts_cache(self):
+        """Test that a change delivered from another worker evicts the cached entry."""
+        bus = ChangeBus()
+        cache = ConfigurationCache(max_size=10, ttl_seconds=3600)
+        bus.subscribe(cache.apply_change)
+        config = Configuration(id=uuid.uuid4(), key="A", label="A", data_type="string")
+        cache.put(config)
+
+        bus.deliver(ConfigurationChange(op="update", config_id=config.id, key="A", origin="another-worker"))
+
+        assert cache.get_by_id(config.id) is None
+        assert cache.get_by_key("A") is None
+
+    def test_reset_clears_cache(self):
+        """Test that a reset drops every cached entry."""
+        bus = ChangeBus()
+        cache = ConfigurationCache(max_size=10, ttl_seconds=3600)
+        bus.subscribe(cache.apply_change)
+        cache.put(Configuration(id=uuid.uuid4(), key="A", label="A", data_type="string"))
+
+        bus.deliver(ConfigurationChange.reset())
+
+        assert len(cache.by_id) == 0
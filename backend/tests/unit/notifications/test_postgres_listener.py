@@ -0,0 +1,53 @@
+"""Unit tests for the PostgreSQL change listener."""
+
+import asyncio
+
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.infrastructure.notifications import ChangeBus, postgres
+from src.infrastructure.notifications.postgres import PostgresChangeListener
+
+
+class FakeConnection:
+    """Stands in for an asyncpg connection, optionally one whose LISTEN fails."""
+
+    def __init__(self, listening: asyncio.Event, fail: bool):
+        self.listening = listening
+        self.fail = fail
+        self.closed = False
+
+    def add_termination_listener(self, callback) -> None:
+        pass
+
+    async def add_listener(self, channel, callback) -> None:
+        if self.fail:
+            raise RuntimeError("LISTEN failed")
+        self.listening.set()
+
+    def is_closed(self) -> bool:
+        return self.closed
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+async def test_listen_failure_after_connect_is_retried(monkeypatch):
+    """Test that an error after connecting retries instead of ending the listener."""
+    listening = asyncio.Event()
+    connections = []
+
+    async def connect(dsn):
+        connections.append(FakeConnection(listening, fail=not connections))
+        return connections[-1]
+
+    monkeypatch.setattr(postgres.asyncpg, "connect", connect)
+    engine = create_async_engine("postgresql+asyncpg://user:secret@db/app")
+    listener = PostgresChangeListener(ChangeBus(), engine, channel="changes", reconnect_delay=0)
+
+    await listener.start()
+    await asyncio.wait_for(listening.wait(), timeout=1)
+    await listener.stop()
+    await engine.dispose()
+
+    assert len(connections) == 2
+    assert connections[0].closed and connections[1].closed
@@ -49,6 +49,7 @@ export interface ConfigurationListResponse {
   total: number
   limit: number
   offset: number
+  next_cursor?: string | null
 }
 
 export interface ParentOption {
@@ -114,17 +115,27 @@ export const configurationsAPI = {
     await apiClient.delete(`/configurations/by-id/${id}`)
   },
 
-  // Get parent options
+  // Get parent options (follows next_cursor until every page is loaded)
   async getParentOptions(currentConfigId?: string): Promise<ParentOption[]> {
     const url = currentConfigId 
       ? `/configurations/parent-options/by/${currentConfigId}` 
       : '/configurations/parent-options'
-    const response = await apiClient.get<ConfigurationListResponse>(url)
-    return response.data.items.map(item => ({
-      id: item.id,
-      key: item.key,
-      label: item.label,
-      data_type: item.data_type,
-    }))
+    const options: ParentOption[] = []
+    let cursor: string | null | undefined
+    do {
+      const response = await apiClient.get<ConfigurationListResponse>(url, {
+        params: cursor ? { cursor } : undefined,
+      })
+      options.push(
+        ...response.data.items.map(item => ({
+          id: item.id,
+          key: item.key,
+          label: item.label,
+          data_type: item.data_type,
+        })),
+      )
+      cursor = response.data.next_cursor
+    } while (cursor)
+    return options
   },
 }